@@ -0,0 +1,45 @@
+"""outbox
+
+Revision ID: 2c7d9f4e1b83
+Revises: 8b3f6e1a9d52
+Create Date: 2026-10-18 16:05:27.412903
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2c7d9f4e1b83"
+down_revision: Union[str, None] = "8b3f6e1a9d52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "available_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_outbox_available_at", "outbox", ["available_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_available_at", table_name="outbox")
+    op.drop_table("outbox")
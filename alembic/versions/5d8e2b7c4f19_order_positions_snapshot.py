@@ -0,0 +1,46 @@
+"""order positions snapshot
+
+Revision ID: 5d8e2b7c4f19
+Revises: a3f1c9d2e7b4
+Create Date: 2026-10-18 12:48:09.552913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d8e2b7c4f19"
+down_revision: Union[str, None] = "a3f1c9d2e7b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "order_positions",
+        sa.Column("unit_price", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "order_positions",
+        sa.Column("position_name", sa.String(length=100), nullable=True),
+    )
+
+    # Заполнение снимка текущими ценами и названиями позиций
+    op.execute("""
+        UPDATE order_positions
+        SET unit_price = positions.price, position_name = positions.name
+        FROM positions
+        WHERE positions.id = order_positions.position_id
+        """)
+
+    op.alter_column("order_positions", "unit_price", nullable=False)
+    op.alter_column("order_positions", "position_name", nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column("order_positions", "position_name")
+    op.drop_column("order_positions", "unit_price")
@@ -0,0 +1,46 @@
+"""menu trigram search
+
+Revision ID: 8b3f6e1a9d52
+Revises: e91b4a6d2c37
+Create Date: 2026-10-18 14:02:11.538204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b3f6e1a9d52"
+down_revision: Union[str, None] = "e91b4a6d2c37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CREATE INDEX CONCURRENTLY не может выполняться внутри транзакции,
+    # autocommit_block сначала фиксирует транзакцию с созданием расширения
+    with op.get_context().autocommit_block():
+        for table_name in ["positions", "categories"]:
+            op.create_index(
+                f"ix_{table_name}_name_trgm",
+                table_name,
+                ["name"],
+                postgresql_using="gin",
+                postgresql_ops={"name": "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name in ["categories", "positions"]:
+            op.drop_index(
+                f"ix_{table_name}_name_trgm",
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,57 @@
+"""order totals
+
+Revision ID: a3f1c9d2e7b4
+Revises: 7ac9924d4755
+Create Date: 2026-10-18 12:10:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f1c9d2e7b4"
+down_revision: Union[str, None] = "7ac9924d4755"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "order_positions",
+        sa.Column("line_total", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "orders",
+        sa.Column("total_price", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Заполнение стоимости существующих позиций и сумм заказов
+    op.execute("""
+        UPDATE order_positions
+        SET line_total = floor(order_positions.weight / 100.0 * positions.price)::int
+            * order_positions.quantity
+        FROM positions
+        WHERE positions.id = order_positions.position_id
+        """)
+    op.execute("""
+        UPDATE orders
+        SET total_price = totals.total_price
+        FROM (
+            SELECT order_id, sum(line_total) AS total_price
+            FROM order_positions
+            GROUP BY order_id
+        ) AS totals
+        WHERE totals.order_id = orders.id
+        """)
+
+    op.alter_column("order_positions", "line_total", server_default=None)
+    op.alter_column("orders", "total_price", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("orders", "total_price")
+    op.drop_column("order_positions", "line_total")
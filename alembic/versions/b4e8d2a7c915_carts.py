@@ -0,0 +1,38 @@
+"""carts
+
+Revision ID: b4e8d2a7c915
+Revises: 6f1a3c8e5d20
+Create Date: 2026-10-18 16:48:12.730415
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e8d2a7c915"
+down_revision: Union[str, None] = "6f1a3c8e5d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "carts",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("data", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()
+        ),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index("ix_carts_updated_at", "carts", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_carts_updated_at", table_name="carts")
+    op.drop_table("carts")
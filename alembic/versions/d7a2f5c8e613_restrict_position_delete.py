@@ -0,0 +1,46 @@
+"""restrict position delete
+
+Revision ID: d7a2f5c8e613
+Revises: b4e8d2a7c915
+Create Date: 2026-10-18 19:12:40.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a2f5c8e613"
+down_revision: Union[str, None] = "b4e8d2a7c915"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Удаление позиции меню больше не удаляет строки прошлых заказов
+    op.drop_constraint(
+        "order_positions_position_id_fkey", "order_positions", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "order_positions_position_id_fkey",
+        "order_positions",
+        "positions",
+        ["position_id"],
+        ["id"],
+        ondelete="RESTRICT",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "order_positions_position_id_fkey", "order_positions", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "order_positions_position_id_fkey",
+        "order_positions",
+        "positions",
+        ["position_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
@@ -0,0 +1,78 @@
+"""hot path indexes
+
+Revision ID: e91b4a6d2c37
+Revises: 5d8e2b7c4f19
+Create Date: 2026-10-18 13:21:57.104662
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e91b4a6d2c37"
+down_revision: Union[str, None] = "5d8e2b7c4f19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY не может выполняться внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_orders_user_id",
+            "orders",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_orders_processing",
+            "orders",
+            ["id"],
+            postgresql_where=sa.text("status = 'PROCESSING'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_orders_date_brin",
+            "orders",
+            ["date"],
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_order_positions_position_id",
+            "order_positions",
+            ["position_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_role",
+            "users",
+            ["role"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name, index_name in [
+            ("users", "ix_users_role"),
+            ("order_positions", "ix_order_positions_position_id"),
+            ("orders", "ix_orders_date_brin"),
+            ("orders", "ix_orders_processing"),
+            ("orders", "ix_orders_user_id"),
+        ]:
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
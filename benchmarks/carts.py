@@ -0,0 +1,76 @@
+"""
+Замер памяти CartStore при 100 000 активных пользователей.
+
+Каждый пользователь добавляет позицию в корзину, а фоновая запись имитируется
+вызовом flush после каждых FLUSH_EVERY пользователей. Записи в БД отбрасываются:
+замеряется только память процесса, которую занимают корзины.
+Для сравнения тот же сценарий выполняется без ограничения размера LRU,
+как при прежнем глобальном словаре корзин.
+
+Запуск из корня проекта:
+
+    python -m benchmarks.carts
+"""
+
+import asyncio
+import tracemalloc
+from typing import Any
+
+from src.bot.cart import CartStore
+from src.core.cart.respository import CartRepository
+from src.core.position.schemas import PositionGetSchema
+from src.core.settings import settings
+
+USERS = 100_000
+FLUSH_EVERY = 1000
+
+
+class DiscardingCartRepository(CartRepository):
+    """
+    Репозиторий без БД: корзин нет, записи отбрасываются.
+    """
+
+    async def get(self, user_id: int) -> dict[str, Any] | None:
+        return None
+
+    async def save_many(self, carts: dict[int, dict[str, Any] | None]):
+        pass
+
+    async def delete_expired(self, batch_size: int) -> int:
+        return 0
+
+
+async def measure(max_size: int) -> tuple[int, float, float]:
+    """
+    Замер памяти корзин.
+    Возвращает количество корзин в памяти, текущую и пиковую память в МБ.
+
+    Аргументы:
+        max_size: Максимальное количество корзин в памяти
+    """
+    position = PositionGetSchema(id=1, name="Латте", category_id=1, price=250)
+    store = CartStore(DiscardingCartRepository(settings.cart_ttl), max_size=max_size)
+
+    tracemalloc.start()
+    for user_id in range(USERS):
+        cart = await store.get(user_id)
+        cart.add_item(position, weight=300)
+        store.save(user_id, cart)
+        if (user_id + 1) % FLUSH_EVERY == 0:
+            await store.flush()
+    await store.flush()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(store._carts), current / 2**20, peak / 2**20
+
+
+async def main():
+    print("| Ограничение LRU | Корзин в памяти | Память, МБ | Пик, МБ |")
+    print("|---|---|---|---|")
+    for max_size in (settings.cart_cache_size, USERS):
+        carts, current, peak = await measure(max_size)
+        print(f"| {max_size} | {carts} | {current:.1f} | {peak:.1f} |")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
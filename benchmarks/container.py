@@ -0,0 +1,128 @@
+"""
+Сравнение внедрения сервисов в апдейт бота: построение графа сервисов
+на каждый апдейт, как в прежнем ServicesMiddleware, и сервисы из контейнера.
+
+БД не нужна: сервисы и репозитории не открывают соединений при создании.
+Запуск из корня проекта:
+
+    python -m benchmarks.container
+"""
+
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from src.core.category.respository import CategoryRepository
+from src.core.category.service import CategoryService
+from src.core.container import get_container
+from src.core.order.respository import OrderRepository
+from src.core.order.service import OrderService
+from src.core.position.respository import PositionRepository
+from src.core.position.service import PositionService
+from src.core.types import ServiceException
+from src.core.user.respository import UserRepository
+from src.core.user.service import UserService
+
+UPDATES = 10_000
+REPEATS = 20
+
+
+# Прежние фабрики из src/core/*/dependencies.py, собирающие новый граф при каждом вызове
+def get_category_service() -> CategoryService:
+    return CategoryService(CategoryRepository(), ServiceException)
+
+
+def get_position_service() -> PositionService:
+    return PositionService(
+        PositionRepository(), get_category_service(), ServiceException
+    )
+
+
+def get_order_service() -> OrderService:
+    return OrderService(OrderRepository(), UserRepository(), ServiceException)
+
+
+def get_user_service() -> UserService:
+    return UserService(UserRepository(), ServiceException)
+
+
+def per_update(data: dict[str, Any]):
+    """
+    Прежний ServicesMiddleware: фабрики get_*_service строят новый граф на каждый апдейт.
+
+    Аргументы:
+        data: Данные апдейта, передаваемые в обработчик
+    """
+    data["user_service"] = get_user_service()
+    data["category_service"] = get_category_service()
+    data["position_service"] = get_position_service()
+    data["order_service"] = get_order_service()
+
+
+container = get_container()
+workflow_data = {
+    "user_service": container.user_service,
+    "category_service": container.category_service,
+    "position_service": container.position_service,
+    "order_service": container.order_service,
+}
+
+
+def from_container(data: dict[str, Any]):
+    """
+    Сервисы контейнера в workflow data диспетчера: aiogram копирует их в данные апдейта.
+
+    Аргументы:
+        data: Данные апдейта, передаваемые в обработчик
+    """
+    data.update(workflow_data)
+
+
+INJECTORS = {
+    "граф на каждый апдейт (прежний ServicesMiddleware)": per_update,
+    "контейнер": from_container,
+}
+
+
+def measure(inject: Callable[[dict[str, Any]], None]) -> tuple[float, float, float]:
+    """
+    Замер внедрения сервисов.
+    Возвращает медианное время на апдейт в микросекундах,
+    количество и объем выделений памяти на апдейт в байтах.
+
+    Аргументы:
+        inject: Функция, добавляющая сервисы в данные апдейта
+    """
+    timings = []
+    for _ in range(REPEATS):
+        started_at = time.perf_counter()
+        for _ in range(UPDATES):
+            inject({})
+        timings.append((time.perf_counter() - started_at) / UPDATES * 10**6)
+
+    # Данные апдейтов удерживаются до снимка, чтобы учесть все созданные объекты
+    updates = [{} for _ in range(UPDATES)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for data in updates:
+        inject(data)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    return statistics.median(timings), blocks / UPDATES, size / UPDATES
+
+
+def main():
+    print("| Способ | Время на апдейт, мкс | Выделений на апдейт | Байт на апдейт |")
+    print("|---|---|---|---|")
+    for name, inject in INJECTORS.items():
+        elapsed, blocks, size = measure(inject)
+        print(f"| {name} | {elapsed:.2f} | {blocks:.1f} | {size:.0f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Сравнение преобразования 10 000 заказов с тремя позициями в pydantic схемы:
+прежний _convert_to_schema с ручной сборкой схем на каждый заказ,
+TypeAdapter списка одним вызовом и TypeAdapter схемы на каждый заказ,
+который используют сервисы.
+
+Заказы создаются в памяти в состоянии detached, как после загрузки из закрытой сессии,
+поэтому БД не нужна. Запуск из корня проекта:
+
+    python -m benchmarks.conversion
+"""
+
+import gc
+import statistics
+import time
+from datetime import datetime
+
+from pydantic import TypeAdapter
+from sqlalchemy import inspect
+from sqlalchemy.orm import configure_mappers, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.core.container import get_container
+from src.core.order.models import ObtainingMethod, Order, OrderPosition, Status
+from src.core.order.schemas import OrderGetSchema, OrderPositionGetSchema
+from src.core.order.service import OrderService
+from src.core.service import loaded_state
+
+ORDERS = 10_000
+POSITIONS_PER_ORDER = 3
+REPEATS = 20
+
+list_adapter = TypeAdapter(list[OrderGetSchema])
+
+
+def detached(model: type, **values):
+    """
+    Объект модели в состоянии detached с загруженными значениями.
+
+    Аргументы:
+        model: Sqlalchemy модель
+        values: Значения загруженных атрибутов
+    """
+    obj = model.__mapper__.class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(obj, key, value)
+    make_transient_to_detached(obj)
+    return obj
+
+
+def make_orders() -> list[Order]:
+    """
+    Заказы с загруженными позициями заказа без позиций меню, как в списке заказов.
+    """
+    configure_mappers()
+    return [
+        detached(
+            Order,
+            id=order_id,
+            user_id=order_id % 100 + 1,
+            date=datetime(2026, 1, 1),
+            status=Status.COMPLETED,
+            obtaining_method=ObtainingMethod.INPLACE,
+            total_price=450,
+            order_positions=[
+                detached(
+                    OrderPosition,
+                    order_id=order_id,
+                    position_id=position_id,
+                    quantity=1,
+                    weight=100,
+                    unit_price=150,
+                    position_name=f"Позиция {position_id}",
+                    line_total=150,
+                )
+                for position_id in range(1, POSITIONS_PER_ORDER + 1)
+            ],
+        )
+        for order_id in range(1, ORDERS + 1)
+    ]
+
+
+def is_loaded(obj, key: str) -> bool:
+    return key not in inspect(obj).unloaded
+
+
+def convert_by_hand(orders: list[Order]) -> list[OrderGetSchema]:
+    """
+    Прежний OrderService._convert_to_schema: схемы собираются вручную для каждого заказа.
+
+    Аргументы:
+        orders: Заказы
+    """
+    return [
+        OrderGetSchema(
+            id=obj.id,
+            user_id=obj.user_id,
+            date=obj.date,
+            status=Status(obj.status),
+            obtaining_method=ObtainingMethod(obj.obtaining_method),
+            total_price=obj.total_price,
+            order_positions=(
+                [
+                    OrderPositionGetSchema(
+                        position_id=position.position_id,
+                        quantity=position.quantity,
+                        weight=position.weight,
+                        unit_price=position.unit_price,
+                        position_name=position.position_name,
+                        line_total=position.line_total,
+                        position=None,
+                    )
+                    for position in obj.order_positions
+                ]
+                if is_loaded(obj, "order_positions")
+                else []
+            ),
+        )
+        for obj in orders
+    ]
+
+
+def convert_list(orders: list[Order]) -> list[OrderGetSchema]:
+    """
+    TypeAdapter списка: состояние всех заказов валидируется одним вызовом.
+
+    Аргументы:
+        orders: Заказы
+    """
+    return list_adapter.validate_python(
+        [loaded_state(obj, OrderService._schema_relations) for obj in orders]
+    )
+
+
+def convert_with_adapter(orders: list[Order]) -> list[OrderGetSchema]:
+    """
+    Текущий Service._convert_to_schemas: TypeAdapter схемы, созданный при объявлении
+    сервиса, на каждый заказ.
+
+    Аргументы:
+        orders: Заказы
+    """
+    return get_container().order_service._convert_to_schemas(orders)
+
+
+CONVERTERS = {
+    "ручная сборка схем (прежний _convert_to_schema)": convert_by_hand,
+    "TypeAdapter списка одним вызовом": convert_list,
+    "TypeAdapter на каждый заказ (текущий _convert_to_schemas)": convert_with_adapter,
+}
+
+
+def measure(orders: list[Order]) -> dict[str, float]:
+    """
+    Замер преобразования заказов всеми способами.
+    Способы чередуются в каждом повторе, чтобы шум машины влиял на них одинаково.
+    Возвращает медианное время каждого способа в миллисекундах.
+
+    Аргументы:
+        orders: Заказы
+    """
+    reference = convert_by_hand(orders)
+    for convert in CONVERTERS.values():
+        assert convert(orders) == reference
+
+    # Заказы живут все время замера, сборщик мусора не обходит их повторно
+    gc.collect()
+    gc.freeze()
+    timings = {name: [] for name in CONVERTERS}
+    for _ in range(REPEATS):
+        for name, convert in CONVERTERS.items():
+            started_at = time.perf_counter()
+            convert(orders)
+            timings[name].append((time.perf_counter() - started_at) * 1000)
+    gc.unfreeze()
+    return {name: statistics.median(values) for name, values in timings.items()}
+
+
+def main():
+    print("| Способ | Время на 10 000 заказов, мс |")
+    print("|---|---|")
+    for name, elapsed in measure(make_orders()).items():
+        print(f"| {name} | {elapsed:.1f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Сравнение стратегий загрузки связанных объектов UserRepository.get
+для пользователей с 1, 100 и 1000 заказов.
+
+Данные создаются в отдельной схеме БД из настроек POSTGRES_* и удаляются после замера.
+Запуск из корня проекта:
+
+    python -m benchmarks.loaders
+"""
+
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import event, text
+
+from src.core.category.models import Category
+from src.core.db import engine
+from src.core.models import Base
+from src.core.order.models import Order, OrderPosition
+from src.core.position.models import Position
+from src.core.repository import LoadStrategy, Related
+from src.core.user.models import User
+from src.core.user.respository import UserRepository
+
+SCHEMA = "bench_loaders"
+ORDER_COUNTS = (1, 100, 1000)
+POSITIONS_PER_ORDER = 3
+REPEATS = 50
+
+
+class ChainedUserRepository(UserRepository):
+    """
+    Репозиторий с прежней цепочкой связей до категорий позиций,
+    загружаемой через joinedload, для сравнения.
+    """
+
+    def _related_paths(self) -> list[tuple]:
+        return [
+            (
+                User.orders,
+                Order.order_positions,
+                OrderPosition.position,
+                Position.category,
+            )
+        ]
+
+
+STRATEGIES = {
+    "none": (UserRepository, Related(LoadStrategy.NONE)),
+    "auto": (UserRepository, Related(LoadStrategy.AUTO)),
+    "selectin": (UserRepository, Related(LoadStrategy.SELECTIN)),
+    "joined": (UserRepository, Related(LoadStrategy.JOINED)),
+    "auto, depth=1": (UserRepository, Related(LoadStrategy.AUTO, depth=1)),
+    "joined до категорий (прежняя цепочка)": (
+        ChainedUserRepository,
+        Related(LoadStrategy.JOINED),
+    ),
+}
+
+TABLES = [table.__table__ for table in (Category, Position, User, Order, OrderPosition)]
+
+
+def set_search_path(dbapi_connection, connection_record):
+    dbapi_connection.run_async(
+        lambda conn: conn.execute(f"SET search_path TO {SCHEMA}, public")
+    )
+
+
+async def seed():
+    """
+    Создание схемы и пользователей, ID которых равен количеству их заказов.
+    """
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    # Поиск в замере не участвует, поэтому триграммные индексы не создаются
+    for table in TABLES:
+        for index in table.indexes:
+            if "gin_trgm_ops" in index.dialect_options["postgresql"]["ops"].values():
+                index.ddl_if(callable_=lambda *args, **kwargs: False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES, checkfirst=False)
+        await conn.execute(text("INSERT INTO categories (id, name) VALUES (1, 'Кофе')"))
+        await conn.execute(
+            text(
+                f"INSERT INTO positions (id, name, category_id, price) "
+                f"SELECT i, 'Позиция ' || i, 1, 100 + i "
+                f"FROM generate_series(1, {POSITIONS_PER_ORDER}) i"
+            )
+        )
+        for orders in ORDER_COUNTS:
+            await conn.execute(
+                text(f"INSERT INTO users (id, role) VALUES ({orders}, 'CLIENT')")
+            )
+            await conn.execute(
+                text(
+                    f"INSERT INTO orders (date, status, obtaining_method, user_id, total_price) "
+                    f"SELECT now(), 'COMPLETED', 'INPLACE', {orders}, 300 "
+                    f"FROM generate_series(1, {orders})"
+                )
+            )
+        await conn.execute(
+            text(
+                f"INSERT INTO order_positions "
+                f"(order_id, position_id, quantity, weight, unit_price, position_name, line_total) "
+                f"SELECT o.id, p, 1, 100, 150, 'Позиция ' || p, 150 "
+                f"FROM orders o, generate_series(1, {POSITIONS_PER_ORDER}) p"
+            )
+        )
+        await conn.execute(text("ANALYZE"))
+
+
+async def drop():
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+async def measure(
+    repository: UserRepository, user_id: int, related: Related
+) -> tuple[int, int, int, float]:
+    """
+    Замер загрузки пользователя.
+    Возвращает количество SQL запросов, количество строк и ячеек (строк на столбцы),
+    полученных из БД, и медианное время загрузки в миллисекундах.
+
+    Аргументы:
+        repository: Репозиторий пользователей
+        user_id: ID пользователя
+        related: Параметры загрузки связанных объектов
+    """
+    queries = rows = cells = 0
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        nonlocal queries, rows, cells
+        queries += 1
+        rows += cursor.rowcount
+        cells += cursor.rowcount * len(cursor.description)
+
+    await repository.get(user_id, related)  # Прогрев пула и кэша запросов asyncpg
+
+    event.listen(engine.sync_engine, "after_cursor_execute", count)
+    try:
+        await repository.get(user_id, related)
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", count)
+
+    timings = []
+    for _ in range(REPEATS):
+        started_at = time.perf_counter()
+        await repository.get(user_id, related)
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return queries, rows, cells, statistics.median(timings)
+
+
+async def main():
+    event.listen(engine.sync_engine, "connect", set_search_path)
+    try:
+        await seed()
+        print("| Заказов | Стратегия | Запросов | Строк | Ячеек | Время, мс |")
+        print("|---|---|---|---|---|---|")
+        for orders in ORDER_COUNTS:
+            for name, (repository, related) in STRATEGIES.items():
+                queries, rows, cells, elapsed = await measure(
+                    repository(), orders, related
+                )
+                print(
+                    f"| {orders} | {name} | {queries} | {rows} | {cells} "
+                    f"| {elapsed:.2f} |"
+                )
+    finally:
+        await drop()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
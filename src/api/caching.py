@@ -0,0 +1,109 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from src.api.settings import http_cache_settings
+from src.core.cache import QueryCache, menu_cache
+from src.core.category.models import Category
+from src.core.position.models import Position
+
+
+class VersionedResponseCache:
+    """
+    Кэш JSON ответов GET запросов с ETag по содержимому.
+    Ответ привязан к версии таблиц в кэше запросов: пока версия не изменилась,
+    запрос с совпадающим If-None-Match получает 304, а остальные - сохраненный ответ,
+    в обоих случаях без обращения к БД.
+    """
+
+    def __init__(
+        self,
+        cache: QueryCache,
+        tables: tuple[str, ...],
+        max_age: int,
+        stale_while_revalidate: int,
+        max_entries: int = 256,
+    ):
+        """
+        Аргументы:
+            cache: Кэш запросов, по версиям которого определяется актуальность ответа
+            tables: Таблицы, из которых строится ответ
+            max_age: Время свежести ответа для клиента в секундах
+            stale_while_revalidate: Время использования устаревшего ответа
+                во время его обновления в секундах
+            max_entries: Максимальное количество сохраненных ответов
+        """
+        self._cache = cache
+        self._tables = tables
+        self._max_entries = max_entries
+        self._cache_control = (
+            f"public, max-age={max_age}, "
+            f"stale-while-revalidate={stale_while_revalidate}"
+        )
+        # Путь с параметрами -> (версия, время создания, ETag, тело ответа)
+        self._responses: OrderedDict[str, tuple[tuple, float, str, bytes]] = (
+            OrderedDict()
+        )
+
+    async def respond(
+        self, request: Request, produce: Callable[[], Awaitable[BaseModel]]
+    ) -> Response:
+        """
+        Ответ на GET запрос с учетом ETag.
+
+        Аргументы:
+            request: Запрос
+            produce: Функция получения данных ответа, вызывается только при смене версии
+        """
+        key = request.url.path + "?" + request.url.query
+        version = self._cache.version(self._tables)
+
+        entry = self._responses.get(key)
+        if (
+            entry is None
+            or entry[0] != version
+            or entry[1] + self._cache.ttl < time.monotonic()
+        ):
+            body = to_json(await produce())
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            entry = (version, time.monotonic(), etag, body)
+            self._responses[key] = entry
+            while len(self._responses) > self._max_entries:
+                self._responses.popitem(last=False)
+        self._responses.move_to_end(key)
+
+        etag, body = entry[2], entry[3]
+        headers = {"ETag": etag, "Cache-Control": self._cache_control}
+        if self._etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    @staticmethod
+    def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+        """
+        Проверка заголовка If-None-Match слабым сравнением ETag.
+
+        Аргументы:
+            if_none_match: Значение заголовка If-None-Match
+            etag: Текущий ETag ответа
+        """
+        if not if_none_match:
+            return False
+        return any(
+            candidate.strip().removeprefix("W/") in ("*", etag)
+            for candidate in if_none_match.split(",")
+        )
+
+
+# Ответы меню для табло, опрашивающих его каждые несколько секунд
+menu_responses = VersionedResponseCache(
+    menu_cache,
+    (Category.__tablename__, Position.__tablename__),
+    http_cache_settings.max_age,
+    http_cache_settings.stale_while_revalidate,
+)
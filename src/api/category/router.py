@@ -1,21 +1,98 @@
-from typing import List
-
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from src.api.caching import menu_responses
 from src.api.category.settings import router_settings
-from src.core.category.dependencies import get_category_service
+from src.api.dependencies import get_category_service
+from src.api.responses import SchemaResponse
+from src.api.settings import pagination_settings
 from src.core.category.schemas import CategoryCreateSchema, CategoryGetSchema
+from src.core.category.service import CategoryService
+from src.core.schemas import BulkDeleteResultSchema, BulkResultSchema, PageSchema
 
 router = APIRouter(**router_settings.model_dump())
 
 
+@router.post(
+    "/batch",
+    response_model=BulkResultSchema[CategoryGetSchema],
+    status_code=status.HTTP_200_OK,
+    description="Пакетное создание категорий одной транзакцией с ошибками по элементам",
+)
+async def bulk_create(
+    data: list[CategoryCreateSchema],
+    service: CategoryService = Depends(get_category_service),
+) -> SchemaResponse:
+    """
+    Пакетное создание категорий.
+
+    Аргументы:
+        data: Данные для создания категорий
+
+    Возвращает:
+        BulkResultSchema[CategoryGetSchema]: Созданные объекты и ошибки по индексам элементов
+    """
+    return SchemaResponse(await service.bulk_create(data, include_related=False))
+
+
+@router.post(
+    "/batch/delete",
+    response_model=BulkDeleteResultSchema,
+    status_code=status.HTTP_200_OK,
+    description="Пакетное удаление категорий по списку ID одной транзакцией",
+)
+async def bulk_delete(
+    ids: list[int], service: CategoryService = Depends(get_category_service)
+) -> SchemaResponse:
+    """
+    Пакетное удаление категорий.
+
+    Аргументы:
+        ids: Список ID категорий для удаления
+
+    Возвращает:
+        BulkDeleteResultSchema: ID удаленных объектов и ошибки по индексам элементов
+    """
+    return SchemaResponse(await service.bulk_delete(ids))
+
+
+@router.get(
+    "/search",
+    response_model=list[CategoryGetSchema],
+    status_code=status.HTTP_200_OK,
+    description="Нечеткий поиск категорий по названию с сортировкой по похожести",
+)
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="Строка поиска"),
+    limit: int = Query(
+        pagination_settings.search_default_limit,
+        ge=1,
+        le=pagination_settings.max_limit,
+    ),
+    service: CategoryService = Depends(get_category_service),
+) -> SchemaResponse:
+    """
+    Нечеткий поиск категорий по названию.
+
+    Аргументы:
+        q: Строка поиска
+        limit: Максимальное количество объектов
+
+    Возвращает:
+        list[CategoryGetSchema]: Найденные категории, самые похожие первыми
+    """
+    return SchemaResponse(await service.search(q, limit, include_related=False))
+
+
 @router.get(
     "/{id}",
     response_model=CategoryGetSchema,
     status_code=status.HTTP_200_OK,
     description="Получение категории по ID",
+    responses={304: {"description": "Данные не изменились с версии из If-None-Match"}},
 )
-async def get(id: int) -> CategoryGetSchema:
+async def get(
+    id: int, request: Request, service: CategoryService = Depends(get_category_service)
+) -> Response:
     """
     Получение категории по ID.
 
@@ -25,25 +102,42 @@ async def get(id: int) -> CategoryGetSchema:
     Возвращает:
         CategoryGetSchema: Данные категории
     """
-    service = get_category_service(HTTPException)
-    return await service.get(id, include_related=False)
+    return await menu_responses.respond(
+        request, lambda: service.get(id, include_related=False)
+    )
 
 
 @router.get(
     "/",
-    response_model=List[CategoryGetSchema],
+    response_model=PageSchema[CategoryGetSchema],
     status_code=status.HTTP_200_OK,
-    description="Получение списка всех категорий",
+    description="Получение списка категорий с курсорной пагинацией",
+    responses={304: {"description": "Данные не изменились с версии из If-None-Match"}},
 )
-async def get_all() -> List[CategoryGetSchema]:
+async def get_all(
+    request: Request,
+    limit: int = Query(
+        pagination_settings.default_limit, ge=1, le=pagination_settings.max_limit
+    ),
+    cursor: int | None = Query(
+        None, description="ID последнего объекта предыдущей страницы"
+    ),
+    service: CategoryService = Depends(get_category_service),
+) -> Response:
     """
-    Получение списка всех категорий.
+    Получение списка категорий с курсорной пагинацией.
+    Ответ содержит ETag, при совпадении с If-None-Match возвращается 304.
+
+    Аргументы:
+        limit: Максимальное количество объектов на странице
+        cursor: Курсор - ID последнего объекта предыдущей страницы
 
     Возвращает:
-        List[CategoryGetSchema]: Список категорий
+        PageSchema[CategoryGetSchema]: Страница категорий и курсор следующей страницы
     """
-    service = get_category_service(HTTPException)
-    return await service.get_all(include_related=False)
+    return await menu_responses.respond(
+        request, lambda: service.get_page(cursor, limit, include_related=False)
+    )
 
 
 @router.post(
@@ -52,7 +146,9 @@ async def get_all() -> List[CategoryGetSchema]:
     status_code=status.HTTP_201_CREATED,
     description="Создание новой категории",
 )
-async def create(data: CategoryCreateSchema) -> CategoryGetSchema:
+async def create(
+    data: CategoryCreateSchema, service: CategoryService = Depends(get_category_service)
+) -> SchemaResponse:
     """
     Создание новой категории.
 
@@ -62,8 +158,10 @@ async def create(data: CategoryCreateSchema) -> CategoryGetSchema:
     Возвращает:
         CategoryGetSchema: Созданная категория
     """
-    service = get_category_service(HTTPException)
-    return await service.create(data, include_related=False)
+    return SchemaResponse(
+        await service.create(data, include_related=False),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.delete(
@@ -71,7 +169,7 @@ async def create(data: CategoryCreateSchema) -> CategoryGetSchema:
     status_code=status.HTTP_204_NO_CONTENT,
     description="Удаление категории по ID. Рекурсивно удаляет все позиции в этой категории",
 )
-async def delete(id: int):
+async def delete(id: int, service: CategoryService = Depends(get_category_service)):
     """
     Удаление категории по ID.
 
@@ -81,5 +179,4 @@ async def delete(id: int):
     Возвращает:
         None
     """
-    service = get_category_service(HTTPException)
     await service.delete(id)
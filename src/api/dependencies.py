@@ -0,0 +1,48 @@
+from typing import AsyncGenerator
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.category.service import CategoryService
+from src.core.container import get_container
+from src.core.db import unit_of_work
+from src.core.order.service import OrderService
+from src.core.position.service import PositionService
+from src.core.user.service import UserService
+
+
+async def get_unit_of_work() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Зависимость, открывающая единицу работы на время обработки запроса.
+    Все репозитории внутри запроса используют одну сессию и один коммит.
+    """
+    async with unit_of_work() as session:
+        yield session
+
+
+def get_category_service() -> CategoryService:
+    """
+    Зависимость, возвращающая общий для всех запросов сервис категорий.
+    """
+    return get_container(HTTPException).category_service
+
+
+def get_position_service() -> PositionService:
+    """
+    Зависимость, возвращающая общий для всех запросов сервис позиций.
+    """
+    return get_container(HTTPException).position_service
+
+
+def get_order_service() -> OrderService:
+    """
+    Зависимость, возвращающая общий для всех запросов сервис заказов.
+    """
+    return get_container(HTTPException).order_service
+
+
+def get_user_service() -> UserService:
+    """
+    Зависимость, возвращающая общий для всех запросов сервис пользователей.
+    """
+    return get_container(HTTPException).user_service
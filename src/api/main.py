@@ -1,16 +1,38 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.category.router import router as category_router
+from src.api.dependencies import get_unit_of_work
 from src.api.order.router import router as order_router
 from src.api.position.router import router as position_router
 from src.api.settings import api_settings
 from src.api.user.router import router as user_router
+from src.core.changes import change_feed
 from src.core.settings import settings
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Запуск и остановка фоновых задач API.
+    """
+    # Лента изменений сбрасывает кэши при записи из других процессов
+    await change_feed.start()
+    yield
+    await change_feed.stop()
+
+
 # Настройка API
-app = FastAPI(**api_settings.model_dump())
+app = FastAPI(
+    **api_settings.model_dump(),
+    # Единица работы фиксируется до отправки ответа, поэтому клиент получает
+    # ответ только после коммита и узнает об ошибке коммита
+    dependencies=[Depends(get_unit_of_work, scope="function")],
+    lifespan=lifespan,
+)
 
 
 # Настройка CORS
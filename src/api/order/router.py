@@ -1,10 +1,17 @@
-from typing import List
-
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, Header, Query, status
 
+from src.api.dependencies import get_order_service
 from src.api.order.settings import router_settings
-from src.core.order.dependencies import get_order_service
+from src.api.responses import (
+    NDJSON_MEDIA_TYPE,
+    NDJSONResponse,
+    SchemaResponse,
+    wants_ndjson,
+)
+from src.api.settings import pagination_settings
 from src.core.order.schemas import OrderCreateSchema, OrderGetSchema, OrderUpdateSchema
+from src.core.order.service import OrderService
+from src.core.schemas import PageSchema
 
 router = APIRouter(**router_settings.model_dump())
 
@@ -15,7 +22,9 @@ router = APIRouter(**router_settings.model_dump())
     status_code=status.HTTP_200_OK,
     description="Получение заказа по ID",
 )
-async def get(id: int) -> OrderGetSchema:
+async def get(
+    id: int, service: OrderService = Depends(get_order_service)
+) -> SchemaResponse:
     """
     Получение заказа по ID.
 
@@ -25,25 +34,47 @@ async def get(id: int) -> OrderGetSchema:
     Возвращает:
         OrderGetSchema: Данные заказа
     """
-    service = get_order_service(HTTPException)
-    return await service.get(id)
+    return SchemaResponse(await service.get(id))
 
 
 @router.get(
     "/",
-    response_model=List[OrderGetSchema],
+    response_model=PageSchema[OrderGetSchema],
     status_code=status.HTTP_200_OK,
-    description="Получение списка всех заказов",
+    description=(
+        "Получение списка заказов с курсорной пагинацией. "
+        "С заголовком Accept: application/x-ndjson все заказы выгружаются потоком"
+    ),
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
 )
-async def get_all() -> List[OrderGetSchema]:
+async def get_all(
+    limit: int = Query(
+        pagination_settings.default_limit, ge=1, le=pagination_settings.max_limit
+    ),
+    cursor: int | None = Query(
+        None, description="ID последнего объекта предыдущей страницы"
+    ),
+    accept: str | None = Header(None),
+    service: OrderService = Depends(get_order_service),
+) -> SchemaResponse | NDJSONResponse:
     """
-    Получение списка всех заказов.
+    Получение списка заказов с курсорной пагинацией
+    или потоковая выгрузка всех заказов в формате NDJSON.
+
+    Аргументы:
+        limit: Максимальное количество объектов на странице
+        cursor: Курсор - ID последнего объекта предыдущей страницы
+        accept: Заголовок Accept, application/x-ndjson включает потоковую выгрузку
 
     Возвращает:
-        List[OrderGetSchema]: Список заказов
+        PageSchema[OrderGetSchema]: Страница заказов и курсор следующей страницы
     """
-    service = get_order_service(HTTPException)
-    return await service.get_all()
+    if wants_ndjson(accept):
+        # Строки читаются из серверного курсора в отдельной сессии
+        return NDJSONResponse(
+            service.stream(batch_size=pagination_settings.stream_batch_size)
+        )
+    return SchemaResponse(await service.get_page(cursor, limit))
 
 
 @router.post(
@@ -52,7 +83,9 @@ async def get_all() -> List[OrderGetSchema]:
     status_code=status.HTTP_201_CREATED,
     description="Создание нового заказа",
 )
-async def create(data: OrderCreateSchema) -> OrderGetSchema:
+async def create(
+    data: OrderCreateSchema, service: OrderService = Depends(get_order_service)
+) -> SchemaResponse:
     """
     Создание нового заказа.
 
@@ -62,8 +95,9 @@ async def create(data: OrderCreateSchema) -> OrderGetSchema:
     Возвращает:
         OrderGetSchema: Созданный заказ
     """
-    service = get_order_service(HTTPException)
-    return await service.create(data)
+    return SchemaResponse(
+        await service.create(data), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.put(
@@ -72,7 +106,9 @@ async def create(data: OrderCreateSchema) -> OrderGetSchema:
     status_code=status.HTTP_200_OK,
     description="Обновление заказа по ID",
 )
-async def update(id: int, data: OrderUpdateSchema) -> OrderGetSchema:
+async def update(
+    id: int, data: OrderUpdateSchema, service: OrderService = Depends(get_order_service)
+) -> SchemaResponse:
     """
     Обновление заказа по ID.
 
@@ -83,8 +119,7 @@ async def update(id: int, data: OrderUpdateSchema) -> OrderGetSchema:
     Возвращает:
         OrderGetSchema: Обновленный заказ
     """
-    service = get_order_service(HTTPException)
-    return await service.update(id, data)
+    return SchemaResponse(await service.update(id, data))
 
 
 @router.delete(
@@ -92,7 +127,7 @@ async def update(id: int, data: OrderUpdateSchema) -> OrderGetSchema:
     status_code=status.HTTP_204_NO_CONTENT,
     description="Удаление заказа по ID",
 )
-async def delete(id: int):
+async def delete(id: int, service: OrderService = Depends(get_order_service)):
     """
     Удаление заказа по ID.
 
@@ -102,5 +137,4 @@ async def delete(id: int):
     Возвращает:
         None
     """
-    service = get_order_service(HTTPException)
     await service.delete(id)
@@ -1,25 +1,131 @@
-from typing import List
-
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from src.api.caching import menu_responses
+from src.api.dependencies import get_position_service
 from src.api.position.settings import router_settings
-from src.core.position.dependencies import get_position_service
+from src.api.responses import SchemaResponse
+from src.api.settings import pagination_settings
 from src.core.position.schemas import (
     PositionCreateSchema,
     PositionGetSchema,
     PositionUpdateSchema,
 )
+from src.core.position.service import PositionService
+from src.core.schemas import (
+    BulkDeleteResultSchema,
+    BulkResultSchema,
+    BulkUpdateItemSchema,
+    PageSchema,
+)
 
 router = APIRouter(**router_settings.model_dump())
 
 
+@router.post(
+    "/batch",
+    response_model=BulkResultSchema[PositionGetSchema],
+    status_code=status.HTTP_200_OK,
+    description="Пакетное создание позиций одной транзакцией с ошибками по элементам",
+)
+async def bulk_create(
+    data: list[PositionCreateSchema],
+    service: PositionService = Depends(get_position_service),
+) -> SchemaResponse:
+    """
+    Пакетное создание позиций.
+
+    Аргументы:
+        data: Данные для создания позиций
+
+    Возвращает:
+        BulkResultSchema[PositionGetSchema]: Созданные объекты и ошибки по индексам элементов
+    """
+    return SchemaResponse(await service.bulk_create(data))
+
+
+@router.put(
+    "/batch",
+    response_model=BulkResultSchema[PositionGetSchema],
+    status_code=status.HTTP_200_OK,
+    description="Пакетное обновление позиций одной транзакцией с ошибками по элементам",
+)
+async def bulk_update(
+    data: list[BulkUpdateItemSchema[PositionUpdateSchema]],
+    service: PositionService = Depends(get_position_service),
+) -> SchemaResponse:
+    """
+    Пакетное обновление позиций.
+
+    Аргументы:
+        data: ID и данные для обновления позиций
+
+    Возвращает:
+        BulkResultSchema[PositionGetSchema]: Обновленные объекты и ошибки по индексам элементов
+    """
+    return SchemaResponse(
+        await service.bulk_update([(item.id, item.data) for item in data])
+    )
+
+
+@router.post(
+    "/batch/delete",
+    response_model=BulkDeleteResultSchema,
+    status_code=status.HTTP_200_OK,
+    description="Пакетное удаление позиций по списку ID одной транзакцией",
+)
+async def bulk_delete(
+    ids: list[int], service: PositionService = Depends(get_position_service)
+) -> SchemaResponse:
+    """
+    Пакетное удаление позиций.
+
+    Аргументы:
+        ids: Список ID позиций для удаления
+
+    Возвращает:
+        BulkDeleteResultSchema: ID удаленных объектов и ошибки по индексам элементов
+    """
+    return SchemaResponse(await service.bulk_delete(ids))
+
+
+@router.get(
+    "/search",
+    response_model=list[PositionGetSchema],
+    status_code=status.HTTP_200_OK,
+    description="Нечеткий поиск позиций по названию с сортировкой по похожести",
+)
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="Строка поиска"),
+    limit: int = Query(
+        pagination_settings.search_default_limit,
+        ge=1,
+        le=pagination_settings.max_limit,
+    ),
+    service: PositionService = Depends(get_position_service),
+) -> SchemaResponse:
+    """
+    Нечеткий поиск позиций по названию.
+
+    Аргументы:
+        q: Строка поиска
+        limit: Максимальное количество объектов
+
+    Возвращает:
+        list[PositionGetSchema]: Найденные позиции, самые похожие первыми
+    """
+    return SchemaResponse(await service.search(q, limit))
+
+
 @router.get(
     "/{id}",
     response_model=PositionGetSchema,
     status_code=status.HTTP_200_OK,
     description="Получение позиции по ID",
+    responses={304: {"description": "Данные не изменились с версии из If-None-Match"}},
 )
-async def get(id: int) -> PositionGetSchema:
+async def get(
+    id: int, request: Request, service: PositionService = Depends(get_position_service)
+) -> Response:
     """
     Получение позиции по ID.
 
@@ -29,25 +135,40 @@ async def get(id: int) -> PositionGetSchema:
     Возвращает:
         PositionGetSchema: Данные позиции
     """
-    service = get_position_service(HTTPException)
-    return await service.get(id)
+    return await menu_responses.respond(request, lambda: service.get(id))
 
 
 @router.get(
     "/",
-    response_model=List[PositionGetSchema],
+    response_model=PageSchema[PositionGetSchema],
     status_code=status.HTTP_200_OK,
-    description="Получение списка всех позиций",
+    description="Получение списка позиций с курсорной пагинацией",
+    responses={304: {"description": "Данные не изменились с версии из If-None-Match"}},
 )
-async def get_all() -> List[PositionGetSchema]:
+async def get_all(
+    request: Request,
+    limit: int = Query(
+        pagination_settings.default_limit, ge=1, le=pagination_settings.max_limit
+    ),
+    cursor: int | None = Query(
+        None, description="ID последнего объекта предыдущей страницы"
+    ),
+    service: PositionService = Depends(get_position_service),
+) -> Response:
     """
-    Получение списка всех позиций.
+    Получение списка позиций с курсорной пагинацией.
+    Ответ содержит ETag, при совпадении с If-None-Match возвращается 304.
+
+    Аргументы:
+        limit: Максимальное количество объектов на странице
+        cursor: Курсор - ID последнего объекта предыдущей страницы
 
     Возвращает:
-        List[PositionGetSchema]: Список позиций
+        PageSchema[PositionGetSchema]: Страница позиций и курсор следующей страницы
     """
-    service = get_position_service(HTTPException)
-    return await service.get_all()
+    return await menu_responses.respond(
+        request, lambda: service.get_page(cursor, limit)
+    )
 
 
 @router.post(
@@ -56,7 +177,9 @@ async def get_all() -> List[PositionGetSchema]:
     status_code=status.HTTP_201_CREATED,
     description="Создание новой позиции",
 )
-async def create(data: PositionCreateSchema) -> PositionGetSchema:
+async def create(
+    data: PositionCreateSchema, service: PositionService = Depends(get_position_service)
+) -> SchemaResponse:
     """
     Создание новой позиции.
 
@@ -66,8 +189,9 @@ async def create(data: PositionCreateSchema) -> PositionGetSchema:
     Возвращает:
         PositionGetSchema: Созданная позиция
     """
-    service = get_position_service(HTTPException)
-    return await service.create(data)
+    return SchemaResponse(
+        await service.create(data), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.put(
@@ -76,7 +200,11 @@ async def create(data: PositionCreateSchema) -> PositionGetSchema:
     status_code=status.HTTP_200_OK,
     description="Обновление позиции по ID",
 )
-async def update(id: int, data: PositionUpdateSchema) -> PositionGetSchema:
+async def update(
+    id: int,
+    data: PositionUpdateSchema,
+    service: PositionService = Depends(get_position_service),
+) -> SchemaResponse:
     """
     Обновление позиции по ID.
 
@@ -87,8 +215,7 @@ async def update(id: int, data: PositionUpdateSchema) -> PositionGetSchema:
     Возвращает:
         PositionGetSchema: Обновленная позиция
     """
-    service = get_position_service(HTTPException)
-    return await service.update(id, data)
+    return SchemaResponse(await service.update(id, data))
 
 
 @router.delete(
@@ -96,7 +223,7 @@ async def update(id: int, data: PositionUpdateSchema) -> PositionGetSchema:
     status_code=status.HTTP_204_NO_CONTENT,
     description="Удаление позиции по ID",
 )
-async def delete(id: int):
+async def delete(id: int, service: PositionService = Depends(get_position_service)):
     """
     Удаление позиции по ID.
 
@@ -106,5 +233,4 @@ async def delete(id: int):
     Возвращает:
         None
     """
-    service = get_position_service(HTTPException)
     await service.delete(id)
@@ -0,0 +1,57 @@
+from typing import Any, AsyncIterator
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+# Тип содержимого потокового ответа: по одному JSON объекту на строку
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class SchemaResponse(JSONResponse):
+    """
+    Ответ из pydantic схем, уже проверенных сервисом.
+    Обработчик возвращает экземпляр ответа, поэтому FastAPI не валидирует
+    данные повторно по response_model, а сериализация выполняется в pydantic-core.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class NDJSONResponse(StreamingResponse):
+    """
+    Потоковый ответ в формате NDJSON.
+    Схемы кодируются pydantic-core по одной, без промежуточного словаря,
+    и сразу отправляются клиенту, поэтому память не зависит от размера выгрузки.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    def __init__(self, items: AsyncIterator[BaseModel], **kwargs):
+        """
+        Аргументы:
+            items: Асинхронный итератор схем
+        """
+        super().__init__(self._encode(items), **kwargs)
+
+    @staticmethod
+    async def _encode(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+        """
+        Кодирование схем в строки NDJSON.
+
+        Аргументы:
+            items: Асинхронный итератор схем
+        """
+        async for item in items:
+            yield to_json(item) + b"\n"
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    """
+    Запрошен ли потоковый ответ в формате NDJSON.
+
+    Аргументы:
+        accept: Значение заголовка Accept
+    """
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
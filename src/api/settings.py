@@ -8,6 +8,18 @@ class CorsSettings(BaseModel):
     allow_headers: list[str] = ["*"]
 
 
+class PaginationSettings(BaseModel):
+    default_limit: int = 50
+    max_limit: int = 500
+    search_default_limit: int = 20
+    stream_batch_size: int = 1000
+
+
+class HTTPCacheSettings(BaseModel):
+    max_age: int = 5
+    stale_while_revalidate: int = 30
+
+
 class APISettings(BaseModel):
     title: str = "API кофейни"
     root_path: str = "/api"
@@ -17,3 +29,5 @@ class APISettings(BaseModel):
 
 
 api_settings = APISettings()
+pagination_settings = PaginationSettings()
+http_cache_settings = HTTPCacheSettings()
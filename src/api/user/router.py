@@ -1,21 +1,101 @@
-from typing import List
-
-from fastapi import APIRouter, HTTPException, status
-
+from fastapi import APIRouter, Depends, Header, Query, status
+
+from src.api.dependencies import get_user_service
+from src.api.responses import (
+    NDJSON_MEDIA_TYPE,
+    NDJSONResponse,
+    SchemaResponse,
+    wants_ndjson,
+)
+from src.api.settings import pagination_settings
 from src.api.user.settings import router_settings
-from src.core.user.dependencies import get_user_service
+from src.core.schemas import (
+    BulkDeleteResultSchema,
+    BulkResultSchema,
+    BulkUpdateItemSchema,
+    PageSchema,
+)
 from src.core.user.schemas import UserCreateSchema, UserGetSchema, UserUpdateSchema
+from src.core.user.service import UserService
 
 router = APIRouter(**router_settings.model_dump())
 
 
+@router.post(
+    "/batch",
+    response_model=BulkResultSchema[UserGetSchema],
+    status_code=status.HTTP_200_OK,
+    description="Пакетное создание пользователей одной транзакцией с ошибками по элементам",
+)
+async def bulk_create(
+    data: list[UserCreateSchema], service: UserService = Depends(get_user_service)
+) -> SchemaResponse:
+    """
+    Пакетное создание пользователей.
+
+    Аргументы:
+        data: Данные для создания пользователей
+
+    Возвращает:
+        BulkResultSchema[UserGetSchema]: Созданные объекты и ошибки по индексам элементов
+    """
+    return SchemaResponse(await service.bulk_create(data))
+
+
+@router.put(
+    "/batch",
+    response_model=BulkResultSchema[UserGetSchema],
+    status_code=status.HTTP_200_OK,
+    description="Пакетное обновление пользователей одной транзакцией с ошибками по элементам",
+)
+async def bulk_update(
+    data: list[BulkUpdateItemSchema[UserUpdateSchema]],
+    service: UserService = Depends(get_user_service),
+) -> SchemaResponse:
+    """
+    Пакетное обновление пользователей.
+
+    Аргументы:
+        data: ID и данные для обновления пользователей
+
+    Возвращает:
+        BulkResultSchema[UserGetSchema]: Обновленные объекты и ошибки по индексам элементов
+    """
+    return SchemaResponse(
+        await service.bulk_update([(item.id, item.data) for item in data])
+    )
+
+
+@router.post(
+    "/batch/delete",
+    response_model=BulkDeleteResultSchema,
+    status_code=status.HTTP_200_OK,
+    description="Пакетное удаление пользователей по списку ID одной транзакцией",
+)
+async def bulk_delete(
+    ids: list[int], service: UserService = Depends(get_user_service)
+) -> SchemaResponse:
+    """
+    Пакетное удаление пользователей.
+
+    Аргументы:
+        ids: Список ID пользователей для удаления
+
+    Возвращает:
+        BulkDeleteResultSchema: ID удаленных объектов и ошибки по индексам элементов
+    """
+    return SchemaResponse(await service.bulk_delete(ids))
+
+
 @router.get(
     "/{id}",
     response_model=UserGetSchema,
     status_code=status.HTTP_200_OK,
     description="Получение пользователя по ID",
 )
-async def get(id: int) -> UserGetSchema:
+async def get(
+    id: int, service: UserService = Depends(get_user_service)
+) -> SchemaResponse:
     """
     Получение пользователя по ID.
 
@@ -25,25 +105,47 @@ async def get(id: int) -> UserGetSchema:
     Возвращает:
         UserGetSchema: Данные пользователя
     """
-    service = get_user_service(HTTPException)
-    return await service.get(id)
+    return SchemaResponse(await service.get(id))
 
 
 @router.get(
     "/",
-    response_model=List[UserGetSchema],
+    response_model=PageSchema[UserGetSchema],
     status_code=status.HTTP_200_OK,
-    description="Получение списка всех пользователей",
+    description=(
+        "Получение списка пользователей с курсорной пагинацией. "
+        "С заголовком Accept: application/x-ndjson все пользователи выгружаются потоком"
+    ),
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
 )
-async def get_all() -> List[UserGetSchema]:
+async def get_all(
+    limit: int = Query(
+        pagination_settings.default_limit, ge=1, le=pagination_settings.max_limit
+    ),
+    cursor: int | None = Query(
+        None, description="ID последнего объекта предыдущей страницы"
+    ),
+    accept: str | None = Header(None),
+    service: UserService = Depends(get_user_service),
+) -> SchemaResponse | NDJSONResponse:
     """
-    Получение списка всех пользователей.
+    Получение списка пользователей с курсорной пагинацией
+    или потоковая выгрузка всех пользователей в формате NDJSON.
+
+    Аргументы:
+        limit: Максимальное количество объектов на странице
+        cursor: Курсор - ID последнего объекта предыдущей страницы
+        accept: Заголовок Accept, application/x-ndjson включает потоковую выгрузку
 
     Возвращает:
-        List[UserGetSchema]: Список пользователей
+        PageSchema[UserGetSchema]: Страница пользователей и курсор следующей страницы
     """
-    service = get_user_service(HTTPException)
-    return await service.get_all()
+    if wants_ndjson(accept):
+        # Строки читаются из серверного курсора в отдельной сессии
+        return NDJSONResponse(
+            service.stream(batch_size=pagination_settings.stream_batch_size)
+        )
+    return SchemaResponse(await service.get_page(cursor, limit))
 
 
 @router.post(
@@ -52,7 +154,9 @@ async def get_all() -> List[UserGetSchema]:
     status_code=status.HTTP_201_CREATED,
     description="Создание нового пользователя",
 )
-async def create(data: UserCreateSchema) -> UserGetSchema:
+async def create(
+    data: UserCreateSchema, service: UserService = Depends(get_user_service)
+) -> SchemaResponse:
     """
     Создание нового пользователя.
 
@@ -62,8 +166,9 @@ async def create(data: UserCreateSchema) -> UserGetSchema:
     Возвращает:
         UserGetSchema: Созданный пользователь
     """
-    service = get_user_service(HTTPException)
-    return await service.create(data)
+    return SchemaResponse(
+        await service.create(data), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.put(
@@ -72,7 +177,9 @@ async def create(data: UserCreateSchema) -> UserGetSchema:
     status_code=status.HTTP_200_OK,
     description="Обновление пользователя по ID",
 )
-async def update(id: int, data: UserUpdateSchema) -> UserGetSchema:
+async def update(
+    id: int, data: UserUpdateSchema, service: UserService = Depends(get_user_service)
+) -> SchemaResponse:
     """
     Обновление пользователя по ID.
 
@@ -83,8 +190,7 @@ async def update(id: int, data: UserUpdateSchema) -> UserGetSchema:
     Возвращает:
         UserGetSchema: Обновленный пользователь
     """
-    service = get_user_service(HTTPException)
-    return await service.update(id, data)
+    return SchemaResponse(await service.update(id, data))
 
 
 @router.delete(
@@ -92,7 +198,7 @@ async def update(id: int, data: UserUpdateSchema) -> UserGetSchema:
     status_code=status.HTTP_204_NO_CONTENT,
     description="Удаление пользователя по ID",
 )
-async def delete(id: int):
+async def delete(id: int, service: UserService = Depends(get_user_service)):
     """
     Удаление пользователя по ID.
 
@@ -102,5 +208,4 @@ async def delete(id: int):
     Возвращает:
         None
     """
-    service = get_user_service(HTTPException)
     await service.delete(id)
@@ -5,6 +5,7 @@ from src.bot.utils import format_order_text
 from src.core.order.models import Status
 from src.core.order.schemas import OrderUpdateSchema
 from src.core.order.service import OrderService
+from src.core.outbox.service import OutboxService
 from src.core.types import ServiceException
 from src.core.user.models import Role
 from src.core.user.service import UserService
@@ -14,7 +15,10 @@ router = Router()
 
 @router.callback_query(F.data.startswith("status:"))
 async def status_callback(
-    callback: CallbackQuery, user_service: UserService, order_service: OrderService
+    callback: CallbackQuery,
+    user_service: UserService,
+    order_service: OrderService,
+    outbox_service: OutboxService,
 ):
     """Обработчик изменения статуса заказа."""
     try:
@@ -42,9 +46,9 @@ async def status_callback(
         )
         return
 
-    bot = callback.bot
-    await bot.send_message(
-        order.user_id, f"Статус вашего заказа #{order.id} изменен на: {status}"
+    # Сообщение клиенту записывается в транзакции изменения статуса
+    await outbox_service.enqueue(
+        [order.user_id], f"Статус вашего заказа #{order.id} изменен на: {status}"
     )
 
     await callback.message.edit_text(format_order_text(order))
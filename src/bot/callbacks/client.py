@@ -1,8 +1,9 @@
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.bot.cart import get_cart
+from src.bot.cart import CartStore
 from src.bot.keyboards import (
     get_cart_keyboard,
     get_categories_keyboard,
@@ -11,14 +12,14 @@ from src.bot.keyboards import (
     get_quantity_keyboard,
     get_weight_keyboard,
 )
+from src.bot.menu import Menu
 from src.bot.states import OrderStates
 from src.bot.utils import format_cart_text
-from src.core.category.service import CategoryService
-from src.core.order.models import ObtainingMethod
+from src.core.db import after_commit
+from src.core.order.models import ObtainingMethod, OrderPosition
 from src.core.order.schemas import OrderCreateSchema
 from src.core.order.service import OrderService
-from src.core.position.schemas import PositionUpdateSchema
-from src.core.position.service import PositionService
+from src.core.outbox.service import OutboxService
 from src.core.types import ServiceException
 from src.core.user.models import Role
 from src.core.user.schemas import UserUpdateSchema
@@ -28,19 +29,14 @@ router = Router()
 
 
 @router.callback_query(OrderStates.selecting_category, F.data.startswith("category:"))
-async def category_callback(
-    callback: CallbackQuery, state: FSMContext, position_service: PositionService
-):
+async def category_callback(callback: CallbackQuery, state: FSMContext, menu: Menu):
     """Обработчик выбора категории."""
     category_id = int(callback.data.split(":")[1])
 
     await state.update_data(category_id=category_id)
 
-    try:
-        positions = await position_service.get_all(
-            filters=PositionUpdateSchema(category_id=category_id)
-        )
-    except ServiceException:
+    category = menu.snapshot.get_category(category_id)
+    if not category or not category.positions:
         await callback.message.answer(
             "Отсутствуют позиции в этой категории.\n" "Свяжитесь с администратором"
         )
@@ -48,23 +44,22 @@ async def category_callback(
 
     await state.set_state(OrderStates.selecting_position)
     await callback.message.edit_text(
-        "Выберите позицию:", reply_markup=get_positions_keyboard(positions, category_id)
+        "Выберите позицию:",
+        reply_markup=get_positions_keyboard(category.positions, category_id),
     )
 
 
 @router.callback_query(OrderStates.selecting_position, F.data.startswith("position:"))
-async def position_callback(
-    callback: CallbackQuery, state: FSMContext, position_service: PositionService
-):
+async def position_callback(callback: CallbackQuery, state: FSMContext, menu: Menu):
     """Обработчик выбора позиции."""
     position_id = int(callback.data.split(":")[1])
-    try:
-        position = await position_service.get(position_id)
-    except ServiceException:
+    position = menu.snapshot.get_position(position_id)
+    if not position:
         await callback.message.answer("Отсутствует позиция с таким ID.")
         return
 
-    await state.update_data(position=position)
+    # В состоянии хранится только ID, данные позиции берутся из снимка меню
+    await state.update_data(position_id=position_id)
     await state.set_state(OrderStates.selecting_weight)
     await callback.message.edit_text(
         f"Выберите вес для {position.name} (цена за 100г - {position.price}₽):",
@@ -73,13 +68,15 @@ async def position_callback(
 
 
 @router.callback_query(OrderStates.selecting_weight, F.data.startswith("weight:"))
-async def weight_callback(callback: CallbackQuery, state: FSMContext):
+async def weight_callback(callback: CallbackQuery, state: FSMContext, menu: Menu):
     """Обработчик выбора веса."""
     position_id = int(callback.data.split(":")[1])
     weight = int(callback.data.split(":")[2])
 
-    data = await state.get_data()
-    position = data["position"]
+    position = menu.snapshot.get_position(position_id)
+    if not position:
+        await callback.message.answer("Отсутствует позиция с таким ID.")
+        return
 
     await state.update_data(weight=weight)
     await state.set_state(OrderStates.selecting_quantity)
@@ -91,31 +88,37 @@ async def weight_callback(callback: CallbackQuery, state: FSMContext):
 
 @router.callback_query(OrderStates.selecting_quantity, F.data.startswith("quantity:"))
 async def quantity_callback(
-    callback: CallbackQuery, state: FSMContext, category_service: CategoryService
+    callback: CallbackQuery, state: FSMContext, menu: Menu, carts: CartStore
 ):
     """Обработчик выбора количества."""
+    position_id = int(callback.data.split(":")[1])
     quantity = int(callback.data.split(":")[2])
 
     data = await state.get_data()
-    position = data["position"]
     weight = data["weight"]
 
-    cart = get_cart(callback.from_user.id)
-    cart.add_item(position, quantity, weight)
+    position = menu.snapshot.get_position(position_id)
+    if not position:
+        await callback.message.answer("Отсутствует позиция с таким ID.")
+        return
+
+    cart = await carts.get(callback.from_user.id)
+    cart.add_item(position.to_schema(), quantity, weight)
+    carts.save(callback.from_user.id, cart)
 
-    price = int((weight / 100) * position.price) * quantity
+    price = OrderPosition.calculate_line_total(position.price, weight, quantity)
 
     await callback.message.edit_text(
         f"{position.name} ({weight}г) x{quantity} - {price}₽ добавлено в корзину",
-        reply_markup=get_categories_keyboard(await category_service.get_all()),
+        reply_markup=get_categories_keyboard(menu.snapshot.categories),
     )
     await state.set_state(OrderStates.selecting_category)
 
 
 @router.callback_query(F.data == "cart")
-async def cart_callback(callback: CallbackQuery, state: FSMContext):
+async def cart_callback(callback: CallbackQuery, state: FSMContext, carts: CartStore):
     """Обработчик просмотра корзины."""
-    cart = get_cart(callback.from_user.id)
+    cart = await carts.get(callback.from_user.id)
     await callback.message.edit_text(
         format_cart_text(cart), reply_markup=get_cart_keyboard()
     )
@@ -123,15 +126,19 @@ async def cart_callback(callback: CallbackQuery, state: FSMContext):
 
 @router.callback_query(F.data == "clear_cart")
 async def clear_cart_callback(
-    callback: CallbackQuery, state: FSMContext, category_service: CategoryService
+    callback: CallbackQuery,
+    state: FSMContext,
+    menu: Menu,
+    carts: CartStore,
+    session: AsyncSession,
 ):
     """Обработчик очистки корзины."""
-    cart = get_cart(callback.from_user.id)
-    cart.clear()
+    # Корзина очищается вместе с фиксацией состояния апдейта
+    user_id = callback.from_user.id
+    after_commit(session, lambda: carts.clear(user_id))
 
-    try:
-        categories = await category_service.get_all()
-    except ServiceException:
+    categories = menu.snapshot.categories
+    if not categories:
         await callback.message.answer(
             "Отсутствуют категории товаров.\n" "Свяжитесь с администратором"
         )
@@ -144,9 +151,11 @@ async def clear_cart_callback(
 
 
 @router.callback_query(F.data == "checkout")
-async def checkout_callback(callback: CallbackQuery, state: FSMContext):
+async def checkout_callback(
+    callback: CallbackQuery, state: FSMContext, carts: CartStore
+):
     """Обработчик оформления заказа."""
-    cart = get_cart(callback.from_user.id)
+    cart = await carts.get(callback.from_user.id)
     if cart.is_empty:
         await callback.answer("Корзина пуста")
         return
@@ -166,11 +175,14 @@ async def obtaining_method_callback(
     state: FSMContext,
     order_service: OrderService,
     user_service: UserService,
+    outbox_service: OutboxService,
+    carts: CartStore,
+    session: AsyncSession,
 ):
     """Обработчик выбора способа получения."""
     obtaining_method = ObtainingMethod(callback.data.split(":")[1])
 
-    cart = get_cart(callback.from_user.id)
+    cart = await carts.get(callback.from_user.id)
     try:
         order = await order_service.create(
             OrderCreateSchema(
@@ -187,32 +199,35 @@ async def obtaining_method_callback(
         )
         return
 
-    cart.clear()
+    # Сообщения всем баристам записываются в исходящую очередь в транзакции заказа
+    # и отправляются в фоне, не задерживая ответ клиенту
+    try:
+        baristas = await user_service.get_all(
+            filters=UserUpdateSchema(role=Role.BARISTA), include_related=False
+        )
+    except ServiceException:  # Если баристы не найдены, ничего не делаем
+        baristas = []
+    await outbox_service.enqueue(
+        [barista.id for barista in baristas], f"Появился новый заказ #{order.id}!"
+    )
+
+    # Корзина очищается только после коммита заказа, при откате она сохраняется
+    user_id = callback.from_user.id
+    after_commit(session, lambda: carts.clear(user_id))
     await state.clear()
     await callback.message.edit_text(
         f"Заказ #{order.id} успешно создан!\n"
         "Используйте /menu чтобы сделать новый заказ"
     )
 
-    # Отправляем сообщение всем баристам
-    bot = callback.bot
-    try:
-        for barista in await user_service.get_all(
-            filters=UserUpdateSchema(role=Role.BARISTA)
-        ):
-            await bot.send_message(barista.id, f"Появился новый заказ #{order.id}!")
-    except ServiceException:  # Если баристы не найдены, ничего не делаем
-        pass
-
 
 @router.callback_query(F.data == "categories")
 async def back_to_categories_callback(
-    callback: CallbackQuery, state: FSMContext, category_service: CategoryService
+    callback: CallbackQuery, state: FSMContext, menu: Menu
 ):
     """Обработчик возврата к категориям."""
-    try:
-        categories = await category_service.get_all()
-    except ServiceException:
+    categories = menu.snapshot.categories
+    if not categories:
         await callback.message.answer(
             "Отсутствуют категории товаров.\n" "Свяжитесь с администратором"
         )
@@ -226,24 +241,18 @@ async def back_to_categories_callback(
 
 @router.callback_query(F.data == "back_to_positions")
 async def back_to_positions_callback(
-    callback: CallbackQuery,
-    state: FSMContext,
-    position_service: PositionService,
-    category_service: CategoryService,
+    callback: CallbackQuery, state: FSMContext, menu: Menu
 ):
     """Обработчик возврата к позициям."""
     data = await state.get_data()
     category_id = data.get("category_id")
     if not category_id:
         # Если категория не сохранена, возвращаемся к выбору категории
-        await back_to_categories_callback(callback, state, category_service)
+        await back_to_categories_callback(callback, state, menu)
         return
 
-    try:
-        positions = await position_service.get_all(
-            filters=PositionUpdateSchema(category_id=category_id)
-        )
-    except ServiceException:
+    category = menu.snapshot.get_category(category_id)
+    if not category or not category.positions:
         await callback.message.answer(
             "Отсутствуют позиции в этой категории.\n" "Свяжитесь с администратором"
         )
@@ -251,5 +260,6 @@ async def back_to_positions_callback(
 
     await state.set_state(OrderStates.selecting_position)
     await callback.message.edit_text(
-        "Выберите позицию:", reply_markup=get_positions_keyboard(positions, category_id)
+        "Выберите позицию:",
+        reply_markup=get_positions_keyboard(category.positions, category_id),
     )
@@ -1,9 +1,15 @@
+import asyncio
+import time
+from collections import OrderedDict
 from typing import Dict, List
 
 from pydantic import BaseModel, Field
 
+from src.core.cart.respository import CartRepository
+from src.core.logger import get_logger
 from src.core.order.schemas import OrderPositionCreateSchema
 from src.core.position.schemas import PositionGetSchema
+from src.core.settings import settings
 
 
 class CartItem(BaseModel):
@@ -82,17 +88,185 @@ class Cart(BaseModel):
         return [item.to_order_position() for item in self.items.values()]
 
 
-# Хранилище корзин пользователей
-user_carts: Dict[int, Cart] = {}
+class CartStore:
+    """
+    Хранилище корзин пользователей из двух уровней.
+    Недавно использованные корзины держатся в памяти (LRU с ограничением размера
+    и времени простоя), остальные загружаются из Postgres.
+    Изменения не пишутся в БД на каждое нажатие, а копятся и сохраняются
+    пачкой раз в flush_interval секунд. Брошенные корзины удаляются из БД по TTL.
+    Память не синхронизируется между процессами, поэтому хранилище рассчитано
+    на один процесс бота, что обеспечивает блокировка при запуске (src/bot/main.py).
+    """
 
+    _logger = get_logger("CartStore")
 
-def get_cart(user_id: int) -> Cart:
-    """
-    Получение корзины пользователя.
+    def __init__(
+        self,
+        repository: CartRepository,
+        max_size: int = settings.cart_cache_size,
+        idle_ttl: float = settings.cart_cache_ttl,
+        flush_interval: float = settings.cart_flush_interval,
+        expire_batch_size: int = settings.cart_expire_batch_size,
+    ):
+        """
+        Аргументы:
+            repository: Репозиторий корзин
+            max_size: Максимальное количество корзин в памяти
+            idle_ttl: Время, после которого неиспользуемая корзина выгружается из памяти,
+                в секундах
+            flush_interval: Интервал записи измененных корзин в БД в секундах
+            expire_batch_size: Количество брошенных корзин, удаляемых одним запросом
+        """
+        self._repository = repository
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._flush_interval = flush_interval
+        self._expire_batch_size = expire_batch_size
+        # ID пользователя -> (корзина, время последнего обращения)
+        self._carts: OrderedDict[int, tuple[Cart, float]] = OrderedDict()
+        # Корзины, ожидающие записи: ID пользователя -> корзина, None - удалить
+        self._dirty: dict[int, Cart | None] = {}
+        # Корзины, которые записываются сейчас, до коммита записи
+        self._flushing: dict[int, Cart | None] = {}
+        self._task: asyncio.Task | None = None
 
-    Аргументы:
-        user_id: ID пользователя
-    """
-    if user_id not in user_carts:
-        user_carts[user_id] = Cart()
-    return user_carts[user_id]
+    async def get(self, user_id: int) -> Cart:
+        """
+        Получение корзины пользователя.
+
+        Аргументы:
+            user_id: ID пользователя
+        """
+        entry = self._carts.get(user_id)
+        if entry is not None:
+            self._touch(user_id, entry[0])
+            return entry[0]
+
+        if user_id in self._dirty:
+            # Корзина выгружена из памяти или очищена, но еще не записана в БД
+            cart = self._dirty[user_id] or Cart()
+        elif user_id in self._flushing:
+            # Корзина записывается, в БД пока прежнее состояние
+            cart = self._flushing[user_id] or Cart()
+        else:
+            data = await self._repository.get(user_id)
+            # Корзина могла быть загружена параллельным апдейтом
+            entry = self._carts.get(user_id)
+            if entry is not None:
+                self._touch(user_id, entry[0])
+                return entry[0]
+            cart = Cart.model_validate(data) if data else Cart()
+
+        self._touch(user_id, cart)
+        while len(self._carts) > self._max_size:
+            # Измененная корзина остается в _dirty до записи
+            self._carts.popitem(last=False)
+        return cart
+
+    def save(self, user_id: int, cart: Cart):
+        """
+        Отметка корзины как измененной. Запись в БД выполняется в фоне.
+
+        Аргументы:
+            user_id: ID пользователя
+            cart: Корзина пользователя
+        """
+        self._dirty[user_id] = cart
+
+    def clear(self, user_id: int):
+        """
+        Удаление корзины пользователя из памяти и из БД при следующей записи.
+
+        Аргументы:
+            user_id: ID пользователя
+        """
+        self._carts.pop(user_id, None)
+        self._dirty[user_id] = None
+
+    async def start(self):
+        """
+        Запуск фоновой записи изменений и удаления брошенных корзин.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Остановка фоновой задачи с записью оставшихся изменений.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self):
+        """
+        Запись измененных корзин в БД одной пачкой.
+        До коммита записи корзины пачки читаются из памяти, а не из БД.
+        При ошибке или отмене корзины остаются в очереди на запись.
+        """
+        if not self._dirty or self._flushing:
+            return
+
+        batch = self._flushing = self._dirty
+        self._dirty = {}
+        try:
+            await self._repository.save_many(
+                {
+                    user_id: (
+                        None
+                        if cart is None or cart.is_empty
+                        else cart.model_dump(mode="json")
+                    )
+                    for user_id, cart in batch.items()
+                }
+            )
+        except BaseException:
+            # Более новые изменения, сделанные во время записи, важнее
+            for user_id, cart in batch.items():
+                self._dirty.setdefault(user_id, cart)
+            raise
+        finally:
+            self._flushing = {}
+        self._logger.debug("Записано корзин: %s", len(batch))
+
+    def _touch(self, user_id: int, cart: Cart):
+        """
+        Помещение корзины в конец LRU с обновлением времени обращения.
+
+        Аргументы:
+            user_id: ID пользователя
+            cart: Корзина пользователя
+        """
+        self._carts[user_id] = (cart, time.monotonic())
+        self._carts.move_to_end(user_id)
+
+    def _evict_idle(self):
+        """
+        Выгрузка из памяти корзин, к которым давно не обращались.
+        """
+        deadline = time.monotonic() - self._idle_ttl
+        while self._carts:
+            _, touched_at = next(iter(self._carts.values()))
+            if touched_at > deadline:
+                break
+            self._carts.popitem(last=False)
+
+    async def _run(self):
+        """
+        Периодическая запись изменений, выгрузка неиспользуемых
+        и удаление брошенных корзин.
+        """
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+                self._evict_idle()
+                await self._repository.delete_expired(self._expire_batch_size)
+            except Exception as e:
+                self._logger.error("Ошибка записи корзин: %s", e)
@@ -3,6 +3,7 @@ from aiogram.filters import Command, CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 
+from src.bot.cart import CartStore
 from src.bot.keyboards import get_role_keyboard
 from src.bot.states import UserStates
 from src.core.types import ServiceException
@@ -40,7 +41,9 @@ async def start_handler(message: Message, state: FSMContext, user_service: UserS
 
 
 @router.message(Command("exit"))
-async def exit_handler(message: Message, state: FSMContext, user_service: UserService):
+async def exit_handler(
+    message: Message, state: FSMContext, user_service: UserService, carts: CartStore
+):
     """Обработчик команды /exit."""
     try:
         await user_service.get(message.from_user.id, False)
@@ -51,6 +54,7 @@ async def exit_handler(message: Message, state: FSMContext, user_service: UserSe
         return
 
     await user_service.delete(message.from_user.id)
+    carts.clear(message.from_user.id)
 
     await message.answer(
         "Вы вышли из аккаунта\n" "Используйте /start чтобы начать работать с ботом"
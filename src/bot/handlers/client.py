@@ -4,8 +4,8 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
 from src.bot.keyboards import get_categories_keyboard
+from src.bot.menu import Menu
 from src.bot.states import OrderStates
-from src.core.category.service import CategoryService
 from src.core.types import ServiceException
 from src.core.user.models import Role
 from src.core.user.service import UserService
@@ -18,7 +18,7 @@ async def menu_handler(
     message: Message,
     state: FSMContext,
     user_service: UserService,
-    category_service: CategoryService,
+    menu: Menu,
 ):
     """Обработчик команды /menu."""
     try:
@@ -35,9 +35,8 @@ async def menu_handler(
 
     await state.set_state(OrderStates.selecting_category)
 
-    try:
-        categories = await category_service.get_all()
-    except ServiceException:
+    categories = menu.snapshot.categories
+    if not categories:
         await message.answer(
             "Отсутствуют категории товаров.\n" "Свяжитесь с администратором"
         )
@@ -2,12 +2,24 @@ import asyncio
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
-from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
 
 from src.bot.callbacks import register_callbacks
+from src.bot.cart import CartStore
 from src.bot.handlers import register_handlers
+from src.bot.menu import Menu
 from src.bot.middlewares import register_middlewares
+from src.bot.notifications import NotificationDispatcher
+from src.bot.outbox import OutboxDispatcher
+from src.bot.storage import PostgresStorage
+from src.core.cart.respository import CartRepository
+from src.core.changes import change_feed
+from src.core.container import get_container
+from src.core.db import advisory_lock
+from src.core.fsm.respository import FSMStateRepository
 from src.core.settings import settings
 
 
@@ -17,19 +29,145 @@ async def main():
     """
     bot = Bot(
         token=settings.bot_token,
+        session=AiohttpSession(timeout=settings.bot_request_timeout),
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
-    dp = Dispatcher(storage=MemoryStorage())
+    # Корзины и очередность апдейтов пользователя хранятся в памяти процесса,
+    # поэтому бот работает одним процессом, а второй завершается при запуске.
+    # При потере соединения с блокировкой бот останавливается, чтобы не работать
+    # одновременно со следующим процессом
+    async with advisory_lock(bot.id, settings.bot_lock_check_interval) as acquired:
+        if not acquired:
+            raise RuntimeError(f"Бот {bot.id} уже запущен в другом процессе")
+        await serve(bot)
+
+
+async def serve(bot: Bot):
+    """
+    Запуск диспетчера и фоновых задач бота.
+
+    Аргументы:
+        bot: Бот
+    """
+    # Состояния хранятся в Postgres и переживают перезапуск бота
+    storage = PostgresStorage(FSMStateRepository(settings.fsm_state_ttl))
+    await storage.start()
+    # FSMContextMiddleware регистрируется в register_middlewares после упорядочивания апдейтов
+    dp = Dispatcher(storage=storage, disable_fsm=True)
 
     # Регистрация обработчиков, middleware и callbackов
     register_handlers(dp)
     register_middlewares(dp)
     register_callbacks(dp)
 
+    # Сервисы создаются один раз и доступны в обработчиках как аргументы
+    container = get_container()
+    dp["user_service"] = container.user_service
+    dp["category_service"] = container.category_service
+    dp["position_service"] = container.position_service
+    dp["order_service"] = container.order_service
+    dp["outbox_service"] = container.outbox_service
+
+    # Корзины держатся в памяти и пачками записываются в БД,
+    # доступны в обработчиках как аргумент carts
+    carts = CartStore(CartRepository(settings.cart_ttl))
+    await carts.start()
+    dp["carts"] = carts
+
+    # Меню загружается один раз и перезагружается по ленте изменений,
+    # доступно в обработчиках как аргумент menu
+    menu = Menu(container.category_service, container.position_service)
+    await menu.refresh()
+    dp["menu"] = menu
+
+    # Сообщения из исходящей очереди отправляются через диспетчер уведомлений,
+    # который соблюдает лимиты Telegram
+    notifier = NotificationDispatcher()
+    await notifier.start(bot)
+    outbox_dispatcher = OutboxDispatcher(container.outbox_service, notifier)
+    await outbox_dispatcher.start()
+
+    # Лента изменений сбрасывает кэши при записи из других процессов
+    change_feed.subscribe(menu.on_change)
+    await change_feed.start()
+
     # Запуск бота
+    try:
+        if settings.bot_mode == "webhook":
+            await run_webhook(bot, dp)
+        else:
+            await run_polling(bot, dp)
+    finally:
+        await change_feed.stop()
+        await outbox_dispatcher.stop()
+        await carts.stop()
+        await notifier.stop()
+        await storage.close()
+
+
+async def run_polling(bot: Bot, dp: Dispatcher):
+    """
+    Получение апдейтов через long polling.
+
+    Аргументы:
+        bot: Бот
+        dp: Диспетчер
+    """
     await bot.delete_webhook(drop_pending_updates=True)
     await dp.start_polling(bot)
 
 
+async def run_webhook(bot: Bot, dp: Dispatcher):
+    """
+    Получение апдейтов через вебхук на aiohttp сервере.
+    Telegram получает ответ 200 сразу, а апдейт обрабатывается в фоне.
+    Как и при long polling, работает один процесс бота: корзины и очередность
+    апдейтов пользователя хранятся в памяти процесса.
+
+    Аргументы:
+        bot: Бот
+        dp: Диспетчер
+    """
+    if not settings.webhook_url:
+        raise ValueError("Для режима webhook нужно указать WEBHOOK_URL")
+
+    await bot.set_webhook(
+        url=settings.webhook_url.rstrip("/") + settings.webhook_path,
+        secret_token=settings.webhook_secret,
+        max_connections=settings.webhook_max_connections,
+        allowed_updates=dp.resolve_used_update_types(),
+    )
+
+    runner = web.AppRunner(create_webhook_app(bot, dp))
+    await runner.setup()
+    site = web.TCPSite(runner, settings.webhook_host, settings.webhook_port)
+    await site.start()
+    try:
+        # Сервер работает до отмены задачи
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def create_webhook_app(bot: Bot, dp: Dispatcher) -> web.Application:
+    """
+    Создание aiohttp приложения, принимающего апдейты вебхука.
+    Запросы без секретного токена отклоняются с ответом 401.
+
+    Аргументы:
+        bot: Бот
+        dp: Диспетчер
+    """
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        handle_in_background=True,
+        secret_token=settings.webhook_secret,
+    ).register(app, path=settings.webhook_path)
+    setup_application(app, dp, bot=bot)
+    return app
+
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,180 @@
+import asyncio
+from dataclasses import dataclass, field
+
+from src.core.category.models import Category
+from src.core.category.service import CategoryService
+from src.core.changes import TableChange
+from src.core.logger import get_logger
+from src.core.position.models import Position
+from src.core.position.schemas import PositionGetSchema
+from src.core.position.service import PositionService
+from src.core.types import ServiceException
+
+
+@dataclass(frozen=True, slots=True)
+class MenuPosition:
+    """Позиция меню в снимке."""
+
+    id: int
+    name: str
+    price: int
+    category_id: int
+
+    def to_schema(self) -> PositionGetSchema:
+        """Конвертация в pydantic схему позиции."""
+        return PositionGetSchema(id=self.id, name=self.name, price=self.price)
+
+
+@dataclass(frozen=True, slots=True)
+class MenuCategory:
+    """Категория меню в снимке с ее позициями."""
+
+    id: int
+    name: str
+    positions: tuple[MenuPosition, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class MenuSnapshot:
+    """
+    Неизменяемый снимок меню: категории с позициями и индекс позиций по ID.
+    Заменяется целиком при изменении меню, поэтому читается без блокировок.
+    """
+
+    version: int = 0
+    categories: tuple[MenuCategory, ...] = ()
+    _categories_by_id: dict[int, MenuCategory] = field(default_factory=dict)
+    _positions_by_id: dict[int, MenuPosition] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        categories: list[tuple[int, str]],
+        positions: list[MenuPosition],
+    ) -> "MenuSnapshot":
+        """
+        Создание снимка из категорий и позиций.
+
+        Аргументы:
+            version: Номер версии снимка
+            categories: Пары из ID и названия категории
+            positions: Позиции меню
+        """
+        category_positions: dict[int, list[MenuPosition]] = {}
+        for position in sorted(positions, key=lambda position: position.id):
+            category_positions.setdefault(position.category_id, []).append(position)
+
+        menu_categories = tuple(
+            MenuCategory(id, name, tuple(category_positions.get(id, ())))
+            for id, name in sorted(categories)
+        )
+        return cls(
+            version=version,
+            categories=menu_categories,
+            _categories_by_id={category.id: category for category in menu_categories},
+            _positions_by_id={position.id: position for position in positions},
+        )
+
+    def get_category(self, category_id: int) -> MenuCategory | None:
+        """
+        Получение категории по ID.
+
+        Аргументы:
+            category_id: ID категории
+        """
+        return self._categories_by_id.get(category_id)
+
+    def get_position(self, position_id: int) -> MenuPosition | None:
+        """
+        Получение позиции по ID.
+
+        Аргументы:
+            position_id: ID позиции
+        """
+        return self._positions_by_id.get(position_id)
+
+
+class Menu:
+    """
+    Меню бота в памяти процесса.
+    Загружается при запуске и перезагружается по ленте изменений,
+    поэтому навигация по меню не обращается к БД.
+    """
+
+    _logger = get_logger("Menu")
+
+    def __init__(
+        self, category_service: CategoryService, position_service: PositionService
+    ):
+        """
+        Аргументы:
+            category_service: Сервис для категорий
+            position_service: Сервис для позиций
+        """
+        self._category_service = category_service
+        self._position_service = position_service
+        self.snapshot = MenuSnapshot()
+        self._lock = asyncio.Lock()
+        self._stale = False
+
+    async def refresh(self):
+        """
+        Перезагрузка снимка меню.
+        Изменения, пришедшие во время загрузки, объединяются в одну повторную загрузку.
+        """
+        self._stale = True
+        if self._lock.locked():
+            return
+
+        async with self._lock:
+            while self._stale:
+                self._stale = False
+                try:
+                    self.snapshot = await self._load(self.snapshot.version + 1)
+                except Exception as e:
+                    # Остается предыдущий снимок, следующее изменение повторит загрузку
+                    self._logger.error("Ошибка загрузки меню: %s", e)
+                    return
+                self._logger.info(
+                    "Меню загружено, версия: %s, категорий: %s",
+                    self.snapshot.version,
+                    len(self.snapshot.categories),
+                )
+
+    async def on_change(self, change: TableChange):
+        """
+        Подписчик ленты изменений: перезагружает меню при изменении категорий или позиций.
+
+        Аргументы:
+            change: Изменение таблиц
+        """
+        if change.affects(Category.__tablename__, Position.__tablename__):
+            await self.refresh()
+
+    async def _load(self, version: int) -> MenuSnapshot:
+        """
+        Вспомогательный метод для загрузки снимка меню из БД.
+
+        Аргументы:
+            version: Номер версии нового снимка
+        """
+        try:
+            categories = await self._category_service.get_all(include_related=False)
+        except ServiceException:  # Категорий нет
+            categories = []
+        try:
+            positions = await self._position_service.get_all()
+        except ServiceException:  # Позиций нет
+            positions = []
+
+        return MenuSnapshot.build(
+            version,
+            [(category.id, category.name) for category in categories],
+            [
+                MenuPosition(
+                    position.id, position.name, position.price, position.category.id
+                )
+                for position in positions
+            ],
+        )
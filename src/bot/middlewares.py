@@ -1,12 +1,13 @@
+import asyncio
 from typing import Any, Awaitable, Callable, Dict
 
 from aiogram import Dispatcher
-from aiogram.types import TelegramObject
+from aiogram.types import TelegramObject, User
 
-from src.core.category.dependencies import get_category_service
-from src.core.order.dependencies import get_order_service
-from src.core.position.dependencies import get_position_service
-from src.core.user.dependencies import get_user_service
+from src.bot.storage import PostgresStorage
+from src.core.db import unit_of_work
+from src.core.logger import get_logger
+from src.core.settings import settings
 
 
 class ServiceException(Exception):
@@ -16,12 +17,121 @@ class ServiceException(Exception):
 
 
 def register_middlewares(dp: Dispatcher):
-    """Регистрация всех middleware."""
-    dp.update.outer_middleware(ServicesMiddleware())
+    """
+    Регистрация всех middleware.
+    Диспетчер создается с disable_fsm=True, а FSMContextMiddleware регистрируется здесь,
+    чтобы состояние читалось уже после упорядочивания апдейтов пользователя
+    и внутри его единицы работы.
+    """
+    dp.update.outer_middleware(UserSerialMiddleware())
+    dp.update.outer_middleware(UnitOfWorkMiddleware())
+    dp.update.outer_middleware(dp.fsm)
+    if isinstance(dp.storage, PostgresStorage):
+        dp.update.outer_middleware(FSMStorageMiddleware(dp.storage))
 
 
-class ServicesMiddleware:
-    """Middleware для внедрения сервисов в хендлеры."""
+class _UserQueue:
+    """Очередь апдейтов одного пользователя."""
+
+    __slots__ = ("lock", "size")
+
+    def __init__(self):
+        # asyncio.Lock пропускает ожидающих в порядке очереди
+        self.lock = asyncio.Lock()
+        self.size = 0  # Выполняющийся и ожидающие апдейты
+
+
+class UserSerialMiddleware:
+    """
+    Middleware, обрабатывающий апдейты одного пользователя по очереди,
+    а апдейты разных пользователей - параллельно.
+    Общее количество одновременно обрабатываемых апдейтов ограничено,
+    а апдейты сверх длины очереди пользователя или общей очереди отбрасываются.
+    Очереди создаются при первом апдейте пользователя и удаляются, когда опустеют.
+    Очередность соблюдается в пределах процесса, поэтому бот работает одним процессом.
+    """
+
+    _logger = get_logger("UserSerialMiddleware")
+
+    def __init__(
+        self,
+        max_concurrency: int = settings.bot_max_concurrency,
+        max_user_queue: int = settings.bot_max_user_queue,
+        max_pending: int = settings.bot_max_pending_updates,
+    ):
+        """
+        Аргументы:
+            max_concurrency: Максимальное количество одновременно обрабатываемых апдейтов
+            max_user_queue: Максимальное количество апдейтов в очереди одного пользователя
+            max_pending: Максимальное количество апдейтов в обработке и ожидании
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_user_queue = max_user_queue
+        self._max_pending = max_pending
+        self._queues: dict[int, _UserQueue] = {}
+        self._pending = 0
+        self.dropped = 0
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        user: User | None = data.get("event_from_user")
+        if self._pending >= self._max_pending:
+            return self._drop(user, "общая очередь заполнена")
+
+        if user is None:
+            # Апдейты без пользователя не упорядочиваются
+            self._pending += 1
+            try:
+                async with self._semaphore:
+                    return await handler(event, data)
+            finally:
+                self._pending -= 1
+
+        queue = self._queues.get(user.id)
+        if queue is None:
+            queue = self._queues[user.id] = _UserQueue()
+        elif queue.size >= self._max_user_queue:
+            return self._drop(user, "очередь пользователя заполнена")
+
+        queue.size += 1
+        self._pending += 1
+        try:
+            # Место в общем лимите занимается только после своей очереди,
+            # чтобы ожидающие апдейты пользователя не блокировали других
+            async with queue.lock, self._semaphore:
+                return await handler(event, data)
+        finally:
+            queue.size -= 1
+            self._pending -= 1
+            if not queue.size:
+                del self._queues[user.id]
+
+    def _drop(self, user: User | None, reason: str) -> None:
+        """
+        Отбрасывание апдейта при перегрузке.
+
+        Аргументы:
+            user: Пользователь апдейта
+            reason: Причина
+        """
+        self.dropped += 1
+        self._logger.warning(
+            "Апдейт пользователя %s отброшен: %s, всего отброшено: %s",
+            user.id if user else None,
+            reason,
+            self.dropped,
+        )
+
+
+class UnitOfWorkMiddleware:
+    """
+    Middleware, открывающий одну сессию и транзакцию на весь апдейт.
+    Сессия доступна в обработчиках как аргумент session.
+    """
 
     async def __call__(
         self,
@@ -29,10 +139,30 @@ class ServicesMiddleware:
         event: TelegramObject,
         data: Dict[str, Any],
     ) -> Any:
-        # Добавляем сервисы в data
-        data["user_service"] = get_user_service()
-        data["category_service"] = get_category_service()
-        data["position_service"] = get_position_service()
-        data["order_service"] = get_order_service()
+        async with unit_of_work() as session:
+            data["session"] = session
+            return await handler(event, data)
+
+
+class FSMStorageMiddleware:
+    """
+    Middleware, записывающий состояния конечного автомата один раз в конце апдейта.
+    Регистрируется после UnitOfWorkMiddleware, поэтому состояние фиксируется
+    в одной транзакции с остальными изменениями апдейта.
+    """
 
-        return await handler(event, data)
+    def __init__(self, storage: PostgresStorage):
+        """
+        Аргументы:
+            storage: Хранилище состояний
+        """
+        self._storage = storage
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        async with self._storage.scope():
+            return await handler(event, data)
@@ -0,0 +1,376 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+
+from src.core.logger import get_logger
+from src.core.settings import settings
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты по алгоритму token bucket.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Аргументы:
+            rate: Количество токенов, добавляемых в секунду
+            capacity: Максимальное количество токенов
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Резервирование токена в долг.
+        Возвращает время в секундах, которое нужно подождать до его появления.
+        """
+        self._refill()
+        self._tokens -= 1
+        return 0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_acquire(self) -> float:
+        """
+        Получение токена без долга.
+        Возвращает 0, если токен получен, иначе время до появления токена в секундах.
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    def pause(self, seconds: float):
+        """
+        Блокировка выдачи токенов на заданное время.
+
+        Аргументы:
+            seconds: Время блокировки в секундах
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0) - seconds * self.rate
+
+    @property
+    def is_full(self) -> bool:
+        """Бакет полон, то есть давно не использовался."""
+        self._refill()
+        return self._tokens >= self.capacity
+
+
+@dataclass
+class NotificationStats:
+    """Статистика доставки уведомлений."""
+
+    sent: int = 0
+    failed: int = 0
+    retried: int = 0
+    cancelled: int = 0
+    pending: int = 0
+
+
+@dataclass
+class _Notification:
+    """Уведомление в очереди."""
+
+    chat_id: int
+    text: str
+    kwargs: dict[str, Any]
+    future: asyncio.Future
+    attempts: int = 0
+    withdrawn: bool = False  # Снято с отправки во время запроса, повтора не будет
+
+
+class NotificationDispatcher:
+    """
+    Диспетчер уведомлений Telegram.
+    Отправляет сообщения из очереди фиксированным числом воркеров
+    с учетом общего лимита бота и лимита на чат (token bucket).
+    При TelegramRetryAfter сообщение возвращается в очередь после паузы,
+    поэтому обработчики не ждут доставки.
+    """
+
+    _logger = get_logger("NotificationDispatcher")
+
+    # Максимальное количество бакетов чатов, после которого удаляются неиспользуемые
+    _MAX_CHAT_BUCKETS = 10000
+
+    def __init__(
+        self,
+        workers: int = settings.notify_workers,
+        global_rate: float = settings.notify_global_rate,
+        chat_rate: float = settings.notify_chat_rate,
+        chat_burst: float = settings.notify_chat_burst,
+        max_attempts: int = settings.notify_max_attempts,
+    ):
+        """
+        Аргументы:
+            workers: Количество одновременных отправок
+            global_rate: Общий лимит сообщений в секунду
+            chat_rate: Лимит сообщений в секунду для одного чата
+            chat_burst: Количество сообщений в чат, отправляемых без ожидания
+            max_attempts: Максимальное количество попыток отправки при ошибках сети
+        """
+        self._workers_count = workers
+        self._global_bucket = TokenBucket(global_rate, global_rate)
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._max_attempts = max_attempts
+        self._chat_buckets: dict[int, TokenBucket] = {}
+        self._queue: asyncio.Queue[_Notification] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        # Сообщения, запрос отправки которых уже выполняется, по их future
+        self._sending: dict[asyncio.Future, _Notification] = {}
+        self._delayed: set[asyncio.TimerHandle] = set()
+        self._bot: Bot | None = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.stats = NotificationStats()
+
+    async def start(self, bot: Bot):
+        """
+        Запуск воркеров.
+
+        Аргументы:
+            bot: Бот, от имени которого отправляются сообщения
+        """
+        self._bot = bot
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self._workers_count)
+            ]
+
+    async def stop(self, timeout: float = 10):
+        """
+        Остановка воркеров с ожиданием отправки оставшихся сообщений.
+
+        Аргументы:
+            timeout: Максимальное время ожидания в секундах
+        """
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            self._logger.warning(
+                "Не отправлено уведомлений при остановке: %s", self.stats.pending
+            )
+
+        for handle in self._delayed:
+            handle.cancel()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, chat_id: int, text: str, **kwargs) -> asyncio.Future:
+        """
+        Постановка сообщения в очередь.
+        Возвращает future, который завершается True при доставке и False при ошибке.
+        Снять сообщение с отправки можно через withdraw.
+
+        Аргументы:
+            chat_id: ID чата
+            text: Текст сообщения
+            kwargs: Дополнительные аргументы Bot.send_message
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.stats.pending += 1
+        self._idle.clear()
+        self._queue.put_nowait(_Notification(chat_id, text, kwargs, future))
+        return future
+
+    def withdraw(self, future: asyncio.Future) -> bool:
+        """
+        Снятие сообщения с отправки, если запрос отправки еще не начат.
+        Возвращает False, если сообщение уже отправляется или обработано:
+        отменить запрос к Telegram нельзя, и сообщение может быть доставлено.
+        Такое сообщение не повторяется после ошибки, а future завершится
+        результатом текущего запроса.
+
+        Аргументы:
+            future: Future, полученный от submit
+        """
+        if future.done():
+            return False
+        notification = self._sending.get(future)
+        if notification is not None:
+            notification.withdrawn = True
+            return False
+        return future.cancel()
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        """
+        Получение бакета чата.
+
+        Аргументы:
+            chat_id: ID чата
+        """
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self._chat_buckets) >= self._MAX_CHAT_BUCKETS:
+                self._chat_buckets = {
+                    id: bucket
+                    for id, bucket in self._chat_buckets.items()
+                    if not bucket.is_full
+                }
+            bucket = TokenBucket(self._chat_rate, self._chat_burst)
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _requeue(self, notification: _Notification, delay: float):
+        """
+        Возврат сообщения в очередь после задержки, не занимая воркер.
+
+        Аргументы:
+            notification: Уведомление
+            delay: Задержка в секундах
+        """
+
+        def put():
+            self._delayed.discard(handle)
+            self._queue.put_nowait(notification)
+
+        handle = asyncio.get_running_loop().call_later(delay, put)
+        self._delayed.add(handle)
+
+    def _retry(self, notification: _Notification, delay: float):
+        """
+        Повтор отправки после задержки.
+        Сообщение, снятое с отправки во время запроса, не повторяется.
+
+        Аргументы:
+            notification: Уведомление
+            delay: Задержка в секундах
+        """
+        if notification.withdrawn:
+            self._finish(notification, False)
+            return
+        self.stats.retried += 1
+        self._requeue(notification, delay)
+
+    async def _worker(self):
+        """
+        Воркер, отправляющий сообщения из очереди.
+        """
+        while True:
+            notification = await self._queue.get()
+            try:
+                await self._process(notification)
+            except Exception as e:
+                self._logger.error("Ошибка воркера уведомлений: %s", e)
+                self._finish(notification, False)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, notification: _Notification):
+        """
+        Отправка одного сообщения с учетом лимитов.
+
+        Аргументы:
+            notification: Уведомление
+        """
+        if notification.future.cancelled():
+            self._skip(notification)
+            return
+
+        # Чат превысил свой лимит - сообщение ждет вне воркера,
+        # чтобы не задерживать сообщения в другие чаты
+        delay = self._chat_bucket(notification.chat_id).try_acquire()
+        if delay > 0:
+            self._requeue(notification, delay)
+            return
+
+        delay = self._global_bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if notification.future.cancelled():
+            self._skip(notification)
+            return
+
+        notification.attempts += 1
+        self._sending[notification.future] = notification
+        try:
+            await self._bot.send_message(
+                notification.chat_id, notification.text, **notification.kwargs
+            )
+        except TelegramRetryAfter as e:
+            # Telegram просит подождать - пауза для чата и для всех отправок
+            self._logger.warning(
+                "Превышен лимит Telegram для чата %s, повтор через %s с",
+                notification.chat_id,
+                e.retry_after,
+            )
+            self._chat_bucket(notification.chat_id).pause(e.retry_after)
+            self._global_bucket.pause(e.retry_after)
+            self._retry(notification, e.retry_after)
+        except (TelegramForbiddenError, TelegramBadRequest) as e:
+            # Бот заблокирован или чат не существует - повтор не поможет
+            self._logger.warning(
+                "Сообщение в чат %s не доставлено: %s", notification.chat_id, e
+            )
+            self._finish(notification, False)
+        except TelegramAPIError as e:
+            if notification.attempts >= self._max_attempts:
+                self._logger.error(
+                    "Сообщение в чат %s не доставлено после %s попыток: %s",
+                    notification.chat_id,
+                    notification.attempts,
+                    e,
+                )
+                self._finish(notification, False)
+            else:
+                self._retry(notification, 2**notification.attempts)
+        else:
+            self._finish(notification, True)
+        finally:
+            self._sending.pop(notification.future, None)
+
+    def _finish(self, notification: _Notification, delivered: bool):
+        """
+        Завершение обработки сообщения.
+
+        Аргументы:
+            notification: Уведомление
+            delivered: Доставлено ли сообщение
+        """
+        self._done()
+        if delivered:
+            self.stats.sent += 1
+        else:
+            self.stats.failed += 1
+        if not notification.future.done():
+            notification.future.set_result(delivered)
+
+    def _skip(self, notification: _Notification):
+        """
+        Пропуск сообщения, снятого с отправки до начала запроса.
+
+        Аргументы:
+            notification: Уведомление
+        """
+        self._done()
+        self.stats.cancelled += 1
+
+    def _done(self):
+        """
+        Учет обработанного сообщения в очереди.
+        """
+        self.stats.pending -= 1
+        if not self.stats.pending:
+            self._idle.set()
@@ -0,0 +1,162 @@
+import asyncio
+
+from src.bot.notifications import NotificationDispatcher
+from src.core.logger import get_logger
+from src.core.outbox.service import OutboxService
+from src.core.settings import settings
+
+
+class OutboxDispatcher:
+    """
+    Отправитель сообщений из исходящей очереди (transactional outbox).
+    Воркеры захватывают сообщения пачками и отправляют их через NotificationDispatcher,
+    который переиспользует сессию бота и соблюдает лимиты Telegram.
+    Доставленные сообщения удаляются, недоставленные возвращаются в очередь
+    по истечении захвата, пока не закончатся попытки.
+    Отправка пачки ожидается send_timeout: сообщения, запрос отправки которых
+    еще не начат, снимаются с отправки и сразу возвращаются в очередь.
+    Начатый запрос отменить нельзя, поэтому его сообщение остается захваченным
+    до ответа Telegram без повторов, а ответ ограничен таймаутом запроса бота.
+    send_timeout вместе с request_timeout меньше времени захвата, поэтому другой
+    отправитель не захватит и не отправит повторно сообщение, которое еще отправляется.
+    """
+
+    _logger = get_logger("OutboxDispatcher")
+
+    def __init__(
+        self,
+        outbox_service: OutboxService,
+        notifier: NotificationDispatcher,
+        workers: int = settings.outbox_workers,
+        batch_size: int = settings.outbox_batch_size,
+        lease: float = settings.outbox_lease,
+        send_timeout: float = settings.outbox_send_timeout,
+        request_timeout: float = settings.bot_request_timeout,
+        poll_interval: float = settings.outbox_poll_interval,
+        max_attempts: int = settings.outbox_max_attempts,
+    ):
+        """
+        Аргументы:
+            outbox_service: Сервис для исходящей очереди
+            notifier: Диспетчер уведомлений
+            workers: Количество воркеров
+            batch_size: Количество сообщений, захватываемых за раз
+            lease: Время захвата сообщений в секундах
+            send_timeout: Время ожидания отправки пачки в секундах, после которого
+                не начатые отправки возвращаются в очередь
+            request_timeout: Таймаут запроса бота к Telegram в секундах,
+                вместе с send_timeout должен быть меньше времени захвата
+            poll_interval: Интервал опроса очереди в секундах,
+                если о новых сообщениях не было сигнала
+            max_attempts: Максимальное количество попыток отправки сообщения
+        """
+        self._outbox_service = outbox_service
+        self._notifier = notifier
+        if send_timeout + request_timeout >= lease:
+            raise ValueError(
+                "Время ожидания отправки вместе с таймаутом запроса бота "
+                "должно быть меньше времени захвата сообщений"
+            )
+
+        self._workers_count = workers
+        self._batch_size = batch_size
+        self._lease = lease
+        self._send_timeout = send_timeout
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._workers: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    async def start(self):
+        """
+        Запуск воркеров и подписка на новые сообщения текущего процесса.
+        Сообщения других процессов забираются опросом.
+        """
+        if not self._workers:
+            self._outbox_service.subscribe(self._wakeup.set)
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self._workers_count)
+            ]
+
+    async def stop(self):
+        """
+        Остановка воркеров. Захваченные, но не отправленные сообщения
+        вернутся в очередь по истечении захвата.
+        """
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self):
+        """
+        Воркер, отправляющий сообщения из очереди.
+        """
+        while True:
+            self._wakeup.clear()
+            try:
+                sent = await self._process_batch()
+            except Exception as e:
+                self._logger.error("Ошибка отправки сообщений из очереди: %s", e)
+                sent = 0
+
+            # Пачка была полной - в очереди могут быть еще сообщения
+            if sent >= self._batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _process_batch(self) -> int:
+        """
+        Захват и отправка одной пачки сообщений.
+        Возвращает количество захваченных сообщений.
+        """
+        messages = await self._outbox_service.claim(self._batch_size, self._lease)
+        if not messages:
+            return 0
+
+        futures = [
+            self._notifier.submit(message.chat_id, message.text) for message in messages
+        ]
+        try:
+            _, pending = await asyncio.wait(futures, timeout=self._send_timeout)
+            # Сообщения, запрос отправки которых не начат, снимаются с отправки,
+            # а начатые запросы без повторов дожидаются ответа не дольше request_timeout
+            sending = [
+                future for future in pending if not self._notifier.withdraw(future)
+            ]
+            if sending:
+                await asyncio.wait(sending)
+        finally:
+            # При остановке воркера не начатые сообщения не будут отправлены позже
+            for future in futures:
+                self._notifier.withdraw(future)
+
+        completed, released = [], []
+        delivered = 0
+        for message, future in zip(messages, futures):
+            if future.cancelled():
+                released.append(message.id)
+            elif future.result():
+                delivered += 1
+                completed.append(message.id)
+            elif message.attempts >= self._max_attempts:
+                self._logger.error(
+                    "Сообщение %s в чат %s удалено после %s попыток",
+                    message.id,
+                    message.chat_id,
+                    message.attempts,
+                )
+                completed.append(message.id)
+        await self._outbox_service.complete(completed)
+        await self._outbox_service.release(released)
+
+        self._logger.info(
+            "Отправлено сообщений из очереди: %s из %s, возвращено в очередь: %s",
+            delivered,
+            len(messages),
+            len(released),
+        )
+        return len(messages)
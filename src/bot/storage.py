@@ -0,0 +1,173 @@
+import asyncio
+import copy
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+
+from src.core.fsm.respository import FSMKey, FSMStateRepository
+from src.core.logger import get_logger
+from src.core.settings import settings
+
+
+@dataclass
+class _Entry:
+    """Состояние в локальном кэше апдейта."""
+
+    state: str | None
+    data: dict[str, Any]
+    dirty: bool = False
+
+
+# Локальный кэш состояний текущего апдейта. Создается при первом обращении
+# в задаче апдейта, так как FSMContextMiddleware читает состояние раньше остальных middleware
+_entries: ContextVar[dict[FSMKey, _Entry] | None] = ContextVar(
+    "fsm_entries", default=None
+)
+# Выполняется ли код внутри PostgresStorage.scope
+_in_scope: ContextVar[bool] = ContextVar("fsm_in_scope", default=False)
+
+
+class PostgresStorage(BaseStorage):
+    """
+    Хранилище состояний конечного автомата в Postgres.
+    Состояния общие для всех процессов бота и переживают перезапуск.
+
+    Внутри апдейта состояние читается из БД один раз, а изменения копятся
+    в локальном кэше и записываются одним upsert в flush в конце обработки.
+    Устаревшие состояния удаляются фоновой задачей.
+    Ключ состояния - (bot_id, chat_id, user_id), бот не использует топики
+    и destiny, поэтому остальные поля StorageKey не учитываются.
+    """
+
+    _logger = get_logger("PostgresStorage")
+
+    def __init__(
+        self,
+        repository: FSMStateRepository,
+        sweep_interval: float = settings.fsm_sweep_interval,
+        sweep_batch_size: int = settings.fsm_sweep_batch_size,
+    ):
+        """
+        Аргументы:
+            repository: Репозиторий состояний
+            sweep_interval: Интервал удаления устаревших состояний в секундах
+            sweep_batch_size: Количество состояний, удаляемых одним запросом
+        """
+        self._repository = repository
+        self._sweep_interval = sweep_interval
+        self._sweep_batch_size = sweep_batch_size
+        self._sweeper: asyncio.Task | None = None
+
+    async def start(self):
+        """
+        Запуск фонового удаления устаревших состояний.
+        """
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def close(self):
+        """
+        Остановка фонового удаления устаревших состояний.
+        """
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        return (await self._entry(key)).state
+
+    async def set_state(self, key: StorageKey, state: StateType = None):
+        entry = await self._entry(key)
+        entry.state = state.state if isinstance(state, State) else state
+        await self._write(entry)
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        return copy.deepcopy((await self._entry(key)).data)
+
+    async def set_data(self, key: StorageKey, data: dict[str, Any]):
+        entry = await self._entry(key)
+        entry.data = copy.deepcopy(data)
+        await self._write(entry)
+
+    async def flush(self):
+        """
+        Запись измененных состояний текущего апдейта в БД.
+        """
+        entries = _entries.get()
+        if not entries:
+            return
+
+        dirty = {key: entry for key, entry in entries.items() if entry.dirty}
+        await self._repository.save_many(
+            {key: (entry.state, entry.data) for key, entry in dirty.items()}
+        )
+        for entry in dirty.values():
+            entry.dirty = False
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncGenerator[None, None]:
+        """
+        Область обработки апдейта: изменения состояний копятся в локальном кэше
+        и записываются при успешном выходе, при исключении отбрасываются.
+        """
+        token = _in_scope.set(True)
+        try:
+            yield
+            await self.flush()
+        finally:
+            _in_scope.reset(token)
+            _entries.set(None)
+
+    async def _entry(self, key: StorageKey) -> _Entry:
+        """
+        Получение состояния из локального кэша апдейта с загрузкой из БД при первом обращении.
+
+        Аргументы:
+            key: Ключ хранилища
+        """
+        entries = _entries.get()
+        if entries is None:
+            entries = {}
+            _entries.set(entries)
+
+        fsm_key = (key.bot_id, key.chat_id, key.user_id)
+        entry = entries.get(fsm_key)
+        if entry is None:
+            state, data = await self._repository.get(fsm_key)
+            entry = entries[fsm_key] = _Entry(state, data)
+        return entry
+
+    async def _write(self, entry: _Entry):
+        """
+        Отметка состояния как измененного.
+        Вне области scope состояние записывается сразу.
+
+        Аргументы:
+            entry: Состояние
+        """
+        entry.dirty = True
+        if not _in_scope.get():
+            await self.flush()
+
+    async def _sweep(self):
+        """
+        Периодическое удаление устаревших состояний пачками.
+        """
+        while True:
+            await asyncio.sleep(self._sweep_interval)
+            try:
+                deleted = self._sweep_batch_size
+                while deleted >= self._sweep_batch_size:
+                    deleted = await self._repository.delete_expired(
+                        self._sweep_batch_size
+                    )
+            except Exception as e:
+                self._logger.error("Ошибка удаления устаревших состояний: %s", e)
@@ -34,10 +34,7 @@ def format_order_text(order: OrderGetSchema) -> str:
     text += f"Способ получения: {obtaining_method_text[order.obtaining_method]}\n\n"
 
     for position in order.order_positions:
-        total_price = (
-            int((position.weight / 100) * position.position.price) * position.quantity
-        )
-        text += f"• {position.position.name} ({position.weight}г) x{position.quantity} - {total_price}₽\n"
+        text += f"• {position.position_name} ({position.weight}г) x{position.quantity} - {position.line_total}₽\n"
 
     text += f"\nИтого: {order.total_price}₽"
     return text
@@ -0,0 +1,166 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+from weakref import WeakSet
+
+from src.core.settings import settings
+
+# Все созданные кэши, чтобы запись в любую таблицу сбрасывала их записи
+_caches: WeakSet["QueryCache"] = WeakSet()
+
+
+class QueryCache:
+    """
+    LRU кэш результатов запросов с ограничением времени жизни записей.
+    Каждая запись помечается тегами - названиями таблиц, из которых она прочитана,
+    и сбрасывается при записи в любую из этих таблиц.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Аргументы:
+            max_size: Максимальное количество записей, старые вытесняются
+            ttl: Время жизни записи в секундах
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any, frozenset[str]]] = (
+            OrderedDict()
+        )
+        self._tag_keys: dict[str, set[Hashable]] = {}
+        # Версии данных по тегам и общая эпоха, увеличиваемая при полном сбросе
+        self._tag_versions: dict[str, int] = {}
+        self._epoch = 0
+        _caches.add(self)
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        Получение записи по ключу.
+        Возвращает признак попадания и значение.
+
+        Аргументы:
+            key: Ключ записи
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def set(
+        self, key: Hashable, value: Any, tags: Iterable[str], version: tuple[int, ...]
+    ):
+        """
+        Сохранение записи.
+        Запись не сохраняется, если ее теги сбрасывались после начала чтения.
+        Сброс других тегов на сохранение не влияет.
+
+        Аргументы:
+            key: Ключ записи
+            value: Значение
+            tags: Названия таблиц, из которых прочитано значение
+            version: Версия тегов (version) на момент начала чтения
+        """
+        tags = tuple(tags)
+        if self.version(tags) != version:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        tags = frozenset(tags)
+        self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+        for tag in tags:
+            self._tag_keys.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags: Iterable[str]):
+        """
+        Сброс всех записей, помеченных любым из тегов.
+
+        Аргументы:
+            tags: Названия таблиц
+        """
+        for tag in tags:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            for key in self._tag_keys.pop(tag, set()):
+                self._remove(key)
+
+    def clear(self):
+        """
+        Сброс всех записей.
+        """
+        self._epoch += 1
+        self._entries.clear()
+        self._tag_keys.clear()
+
+    def version(self, tags: Iterable[str]) -> tuple[int, ...]:
+        """
+        Версия данных по тегам. Меняется при каждом сбросе любого из тегов
+        и при полном сбросе кэша.
+
+        Аргументы:
+            tags: Названия таблиц
+        """
+        return (self._epoch, *(self._tag_versions.get(tag, 0) for tag in tags))
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Счетчики попаданий и промахов и текущий размер кэша.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+        }
+
+    def _remove(self, key: Hashable):
+        """
+        Вспомогательный метод для удаления записи и ее ключа из индекса тегов.
+
+        Аргументы:
+            key: Ключ записи
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+
+def invalidate_tables(tables: Iterable[str]):
+    """
+    Сброс записей всех кэшей, прочитанных из указанных таблиц.
+
+    Аргументы:
+        tables: Названия таблиц
+    """
+    tables = list(tables)
+    for cache in list(_caches):
+        cache.invalidate(tables)
+
+
+def clear_all():
+    """
+    Сброс всех записей всех кэшей.
+    """
+    for cache in list(_caches):
+        cache.clear()
+
+
+# Кэш меню (категории и позиции): читается почти в каждом колбэке бота,
+# а меняется редко
+menu_cache = QueryCache(settings.menu_cache_size, settings.menu_cache_ttl)
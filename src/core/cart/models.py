@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.models import Base
+
+
+class StoredCart(Base):
+    """
+    Sqlalchemy модель сохраненной корзины пользователя бота.
+    """
+
+    __tablename__ = "carts"
+    __table_args__ = (
+        # Удаление брошенных корзин
+        Index("ix_carts_updated_at", "updated_at"),
+    )
+
+    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        nullable=False, server_default=func.now()
+    )
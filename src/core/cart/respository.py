@@ -0,0 +1,88 @@
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.cart.models import StoredCart
+from src.core.db import commit, get_db_session
+
+
+class CartRepository:
+    """
+    Репозиторий для сохраненных корзин.
+    Корзины хранятся как JSON и пишутся пачками, поэтому репозиторий
+    не наследует Repository.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Аргументы:
+            ttl: Время жизни корзины после последнего изменения в секундах
+        """
+        self._ttl = timedelta(seconds=ttl)
+
+    async def get(self, user_id: int) -> dict[str, Any] | None:
+        """
+        Получение данных корзины. Брошенные корзины не возвращаются.
+
+        Аргументы:
+            user_id: ID пользователя
+        """
+        async with get_db_session() as session:
+            stmt = select(StoredCart.data).where(
+                StoredCart.user_id == user_id,
+                StoredCart.updated_at > func.now() - self._ttl,
+            )
+            return (await session.execute(stmt)).scalar_one_or_none()
+
+    async def save_many(self, carts: dict[int, dict[str, Any] | None]):
+        """
+        Запись корзин одним INSERT ... ON CONFLICT DO UPDATE и удаление пустых.
+
+        Аргументы:
+            carts: ID пользователя -> данные корзины, None - удалить корзину
+        """
+        rows = [
+            {"user_id": user_id, "data": data, "updated_at": func.now()}
+            for user_id, data in carts.items()
+            if data is not None
+        ]
+        empty = [user_id for user_id, data in carts.items() if data is None]
+
+        async with get_db_session() as session:
+            if rows:
+                stmt = insert(StoredCart).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[StoredCart.user_id],
+                    set_={
+                        "data": stmt.excluded.data,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+                await session.execute(stmt)
+            if empty:
+                await session.execute(
+                    delete(StoredCart).where(StoredCart.user_id.in_(empty))
+                )
+            await commit(session)
+
+    async def delete_expired(self, batch_size: int) -> int:
+        """
+        Удаление пачки брошенных корзин.
+        Возвращает количество удаленных корзин.
+
+        Аргументы:
+            batch_size: Максимальное количество удаляемых корзин
+        """
+        async with get_db_session(isolated=True) as session:
+            expired = (
+                select(StoredCart.user_id)
+                .where(StoredCart.updated_at <= func.now() - self._ttl)
+                .limit(batch_size)
+            )
+            result = await session.execute(
+                delete(StoredCart).where(StoredCart.user_id.in_(expired))
+            )
+            await session.commit()
+            return result.rowcount
@@ -1,20 +1,32 @@
-from sqlalchemy import select
+from sqlalchemy import ARRAY, Integer, any_, bindparam, select
+from sqlalchemy.orm import InstrumentedAttribute
 
+from src.core.cache import menu_cache
 from src.core.category.models import Category
 from src.core.category.schemas import CategoryCreateSchema
 from src.core.db import get_db_session
-from src.core.repository import Repository
+from src.core.order.models import OrderPosition
+from src.core.position.models import Position
+from src.core.repository import Related, Repository, SearchRepositoryMixin
 
 
-class CategoryRepository(Repository[Category, CategoryCreateSchema, None]):
+class CategoryRepository(
+    SearchRepositoryMixin, Repository[Category, CategoryCreateSchema, None]
+):
     """
     Репозиторий для категорий.
     """
 
     def __init__(self):
-        super().__init__(Category)
+        super().__init__(Category, cache=menu_cache)
 
-    async def get_by_name(self, name: str, include_related: bool) -> Category:
+    def _search_column(self) -> InstrumentedAttribute:
+        """
+        Поиск категорий выполняется по названию.
+        """
+        return Category.name
+
+    async def get_by_name(self, name: str, include_related: bool | Related) -> Category:
         """
         Получение категории по названию.
 
@@ -25,6 +37,29 @@ class CategoryRepository(Repository[Category, CategoryCreateSchema, None]):
         async with get_db_session() as session:
             stmt = select(Category).where(Category.name == name)
             if include_related:
-                stmt = self._include_related(stmt)
+                stmt = self._include_related(stmt, include_related)
+            result = await session.execute(stmt)
+            return result.unique().scalar_one_or_none()
+
+    async def find_ordered(self, ids: list[int]) -> set[int]:
+        """
+        Получение ID категорий из списка, позиции которых есть в заказах, одним запросом.
+
+        Аргументы:
+            ids: Список ID категорий
+        """
+        if not ids:
+            return set()
+
+        async with get_db_session() as session:
+            stmt = (
+                select(Position.category_id)
+                .join(OrderPosition, OrderPosition.position_id == Position.id)
+                .where(
+                    Position.category_id
+                    == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+                )
+                .distinct()
+            )
             result = await session.execute(stmt)
-            return result.scalar_one_or_none()
+            return set(result.scalars().all())
@@ -4,16 +4,20 @@ from src.core.category.models import Category
 from src.core.category.respository import CategoryRepository
 from src.core.category.schemas import CategoryCreateSchema, CategoryGetSchema
 from src.core.logger import get_logger
-from src.core.service import Service
+from src.core.service import SearchServiceMixin, Service
 
 
 class CategoryService(
-    Service[Category, CategoryCreateSchema, CategoryGetSchema, None, CategoryRepository]
+    SearchServiceMixin,
+    Service[
+        Category, CategoryCreateSchema, CategoryGetSchema, None, CategoryRepository
+    ],
 ):
     """
     Сервис для категорий.
     """
 
+    _schema = CategoryGetSchema
     _logger: logging.Logger = get_logger("CategoryService")
 
     def __init__(self, repository: CategoryRepository, exception: Exception):
@@ -34,24 +38,73 @@ class CategoryService(
             data: Данные для создания объекта
             include_related: Загружать ли связанные объекты
         """
-        if await self._repository.get_by_name(data.name, False):
+        if await self._repository.exists_by(name=data.name):
             self._handle_error(
                 "Категория с таким названием уже существует", status_code=409
             )
 
-        self._logger.info(f"Создание объекта: {data.model_dump(exclude_unset=True)}")
+        self._logger.info("Создание объекта: %s", data)
         obj = await self._repository.create(data, include_related)
         if not obj:
             self._handle_error("Не удалось создать объект", status_code=400)
-        self._logger.info(f"Объект успешно создан с id: {obj.id}")
+        self._logger.info("Объект успешно создан с id: %s", obj.id)
 
         return self._convert_to_schema(obj)
 
-    def _convert_to_schema(self, obj: Category) -> CategoryGetSchema:
+    async def delete(self, id: int) -> bool:
         """
-        Преобразование модели в схему.
+        Удаление объекта. Проверяет, что позиций категории нет в заказах.
 
         Аргументы:
-            obj: Модель для преобразования
+            id: ID объекта
         """
-        return CategoryGetSchema(id=obj.id, name=obj.name)
+        if await self._repository.find_ordered([id]):
+            self._handle_error(
+                "Позиции категории есть в заказах, категория не может быть удалена",
+                status_code=409,
+            )
+
+        return await super().delete(id)
+
+    async def find_existing(self, ids: list[int]) -> set[int]:
+        """
+        Получение ID категорий из списка, которые есть в БД, одним запросом.
+
+        Аргументы:
+            ids: Проверяемые ID категорий
+        """
+        return await self._repository.find_existing("id", ids)
+
+    async def _validate_bulk_create(
+        self, data: list[CategoryCreateSchema]
+    ) -> dict[int, str]:
+        """
+        Проверка элементов пакетного создания: уникальность названий в БД и в пакете.
+
+        Аргументы:
+            data: Данные для создания объектов
+        """
+        existing_names = await self._repository.find_existing(
+            "name", [item.name for item in data]
+        )
+        errors, seen_names = {}, set()
+        for index, item in enumerate(data):
+            if item.name in existing_names or item.name in seen_names:
+                errors[index] = "Категория с таким названием уже существует"
+            seen_names.add(item.name)
+
+        return errors
+
+    async def _validate_bulk_delete(self, ids: list[int]) -> dict[int, str]:
+        """
+        Проверка элементов пакетного удаления: позиций категории нет в заказах.
+
+        Аргументы:
+            ids: Список ID объектов
+        """
+        ordered_ids = await self._repository.find_ordered(ids)
+        return {
+            index: "Позиции категории есть в заказах, категория не может быть удалена"
+            for index, id in enumerate(ids)
+            if id in ordered_ids
+        }
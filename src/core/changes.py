@@ -0,0 +1,218 @@
+import asyncio
+import inspect
+import json
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import clear_all, invalidate_tables
+from src.core.logger import get_logger
+from src.core.settings import settings
+
+# Канал LISTEN/NOTIFY, в который пишутся изменения таблиц
+CHANNEL = "table_changes"
+
+# Размер уведомления в Postgres ограничен 8000 байт,
+# при большом количестве ID передаются только таблицы
+MAX_PAYLOAD_SIZE = 7900
+
+
+@dataclass(frozen=True)
+class TableChange:
+    """
+    Изменение таблиц, полученное из ленты изменений.
+    Если tables равно None, изменения могли быть пропущены
+    и нужно сбросить все локальные данные.
+    """
+
+    tables: frozenset[str] | None
+    ids: tuple[int, ...] | None = None
+
+    def affects(self, *tables: str) -> bool:
+        """
+        Затрагивает ли изменение хотя бы одну из таблиц.
+
+        Аргументы:
+            tables: Названия таблиц
+        """
+        return self.tables is None or not self.tables.isdisjoint(tables)
+
+
+async def publish_changes(
+    session: AsyncSession, tables: set[str], ids: list[int] | None
+):
+    """
+    Отправка уведомления об изменении таблиц в транзакции сессии.
+    Postgres доставляет уведомление только после коммита транзакции,
+    при откате оно отбрасывается.
+
+    Аргументы:
+        session: Сессия, в которой выполнялась запись
+        tables: Названия измененных таблиц
+        ids: ID измененных объектов, None - неизвестно какие
+    """
+    payload = json.dumps({"tables": sorted(tables), "ids": ids})
+    if len(payload.encode()) > MAX_PAYLOAD_SIZE:
+        payload = json.dumps({"tables": sorted(tables), "ids": None})
+    await session.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+class ChangeFeed:
+    """
+    Слушатель ленты изменений таблиц через asyncpg add_listener.
+    Сбрасывает локальные кэши процесса и вызывает подписчиков.
+    После переподключения сбрасывает все кэши, так как уведомления
+    за время разрыва соединения потеряны.
+    """
+
+    _logger = get_logger("ChangeFeed")
+
+    def __init__(
+        self,
+        dsn: str,
+        reconnect_delay: float = 1,
+        max_reconnect_delay: float = 30,
+        keepalive_interval: float = 30,
+    ):
+        """
+        Аргументы:
+            dsn: Строка подключения к Postgres
+            reconnect_delay: Начальная задержка перед переподключением в секундах
+            max_reconnect_delay: Максимальная задержка перед переподключением в секундах
+            keepalive_interval: Интервал проверки соединения в секундах
+        """
+        self._dsn = dsn
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._keepalive_interval = keepalive_interval
+        self._subscribers: list[Callable[[TableChange], Awaitable[None] | None]] = []
+        self._task: asyncio.Task | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def subscribe(self, callback: Callable[[TableChange], Awaitable[None] | None]):
+        """
+        Подписка на изменения таблиц.
+
+        Аргументы:
+            callback: Функция или корутина, принимающая TableChange
+        """
+        self._subscribers.append(callback)
+
+    async def start(self):
+        """
+        Запуск слушателя в фоновой задаче.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Остановка слушателя.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        """
+        Цикл подключения к Postgres с переподключением при разрыве соединения.
+        """
+        delay = self._reconnect_delay
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(CHANNEL, self._on_notification)
+                self._logger.info("Подписка на канал %s установлена", CHANNEL)
+
+                # Уведомления до подписки могли быть пропущены
+                self._dispatch(TableChange(tables=None))
+                delay = self._reconnect_delay
+
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            lost.wait(), timeout=self._keepalive_interval
+                        )
+                    except asyncio.TimeoutError:
+                        await connection.execute("SELECT 1", timeout=10)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error("Ошибка подключения к ленте изменений: %s", e)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            self._logger.warning("Переподключение к ленте изменений через %s с", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str):
+        """
+        Обработчик уведомления asyncpg.
+
+        Аргументы:
+            connection: Соединение asyncpg
+            pid: ID процесса Postgres, отправившего уведомление
+            channel: Название канала
+            payload: JSON с названиями таблиц и ID объектов
+        """
+        try:
+            data = json.loads(payload)
+            change = TableChange(
+                tables=frozenset(data["tables"]),
+                ids=tuple(data["ids"]) if data.get("ids") is not None else None,
+            )
+        except (ValueError, KeyError, TypeError):
+            self._logger.error("Некорректное уведомление: %s", payload)
+            change = TableChange(tables=None)
+
+        self._dispatch(change)
+
+    def _dispatch(self, change: TableChange):
+        """
+        Сброс локальных кэшей и вызов подписчиков.
+
+        Аргументы:
+            change: Изменение таблиц
+        """
+        if change.tables is None:
+            clear_all()
+        else:
+            invalidate_tables(change.tables)
+
+        for callback in self._subscribers:
+            try:
+                result = callback(change)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self._background_tasks.add(task)
+                    task.add_done_callback(self._on_callback_done)
+            except Exception as e:
+                self._logger.error("Ошибка подписчика ленты изменений: %s", e)
+
+    def _on_callback_done(self, task: asyncio.Task):
+        """
+        Удаление завершенной задачи подписчика и логирование ее ошибки.
+
+        Аргументы:
+            task: Задача подписчика
+        """
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error(
+                "Ошибка подписчика ленты изменений: %s", task.exception()
+            )
+
+
+change_feed = ChangeFeed(settings.postgres_dsn)
@@ -0,0 +1,50 @@
+from src.core.category.respository import CategoryRepository
+from src.core.category.service import CategoryService
+from src.core.order.respository import OrderRepository
+from src.core.order.service import OrderService
+from src.core.outbox.respository import OutboxRepository
+from src.core.outbox.service import OutboxService
+from src.core.position.respository import PositionRepository
+from src.core.position.service import PositionService
+from src.core.types import ServiceException
+from src.core.user.respository import UserRepository
+from src.core.user.service import UserService
+
+
+class Container:
+    """
+    Контейнер сервисов приложения.
+    Граф сервисов и репозиториев создается один раз при запуске,
+    сервисы не хранят состояния запроса и переиспользуются всеми запросами и апдейтами.
+    """
+
+    def __init__(self, exception: Exception = ServiceException):
+        """
+        Аргументы:
+            exception: Исключение, которое будут использовать сервисы
+        """
+        self.category_service = CategoryService(CategoryRepository(), exception)
+        self.position_service = PositionService(
+            PositionRepository(), self.category_service, exception
+        )
+        user_repository = UserRepository()
+        self.order_service = OrderService(OrderRepository(), user_repository, exception)
+        self.user_service = UserService(user_repository, exception)
+        self.outbox_service = OutboxService(OutboxRepository(), exception)
+
+
+# Контейнеры по типу исключения
+_containers: dict[type, Container] = {}
+
+
+def get_container(exception: Exception = ServiceException) -> Container:
+    """
+    Получение контейнера сервисов для типа исключения.
+    Контейнер создается при первом вызове.
+
+    Аргументы:
+        exception: Исключение, которое будут использовать сервисы
+    """
+    if exception not in _containers:
+        _containers[exception] = Container(exception)
+    return _containers[exception]
@@ -1,14 +1,31 @@
+import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from contextvars import ContextVar
+from typing import AsyncGenerator, Callable
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from src.core.models import Base
 from src.core.settings import settings
 
 engine = create_async_engine(settings.database_url)
 
-AsyncSessionFactory = async_sessionmaker(engine, class_=AsyncSession)
+# Объекты не истекают после коммита, поэтому их не нужно перечитывать из БД
+AsyncSessionFactory = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
+
+# Сессия текущей единицы работы (запроса API или апдейта бота)
+_current_session: ContextVar[AsyncSession | None] = ContextVar(
+    "current_session", default=None
+)
 
 
 async def create_all_tables():
@@ -20,10 +37,49 @@ async def create_all_tables():
 
 
 @asynccontextmanager
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+async def unit_of_work() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Асинхронный контекстный менеджер единицы работы.
+    Открывает одну сессию на весь запрос или апдейт, к которой автоматически
+    присоединяются все репозитории, и делает один коммит в конце.
+    Вложенные вызовы переиспользуют уже открытую сессию.
+    """
+    session = _current_session.get()
+    if session is not None:
+        yield session
+        return
+
+    session = AsyncSessionFactory()
+    token = _current_session.set(session)
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        session.info.pop("after_commit", None)
+        await session.rollback()
+        raise
+    finally:
+        _current_session.reset(token)
+        await session.close()
+
+    for callback in session.info.pop("after_commit", []):
+        callback()
+
+
+@asynccontextmanager
+async def get_db_session(isolated: bool = False) -> AsyncGenerator[AsyncSession, None]:
     """
     Асинхронный контекстный менеджер для получения сессии.
+    Внутри единицы работы возвращает ее сессию, иначе открывает новую.
+
+    Аргументы:
+        isolated: Всегда открывать отдельную сессию, например для серверного курсора
     """
+    session = _current_session.get()
+    if session is not None and not isolated:
+        yield session
+        return
+
     session = AsyncSessionFactory()
     try:
         yield session
@@ -32,3 +88,119 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         raise
     finally:
         await session.close()
+
+
+async def commit(session: AsyncSession):
+    """
+    Фиксация изменений сессии.
+    Внутри единицы работы изменения только отправляются в БД,
+    а коммит выполняется один раз при выходе из нее.
+
+    Аргументы:
+        session: Сессия, изменения которой нужно зафиксировать
+    """
+    if session is _current_session.get():
+        await session.flush()
+    else:
+        await session.commit()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]):
+    """
+    Вызов функции после фиксации изменений сессии.
+    Внутри единицы работы вызов откладывается до ее коммита
+    и отменяется при откате, иначе функция вызывается сразу.
+
+    Аргументы:
+        session: Сессия, после коммита которой нужно вызвать функцию
+        callback: Функция без аргументов
+    """
+    if session is _current_session.get():
+        session.info.setdefault("after_commit", []).append(callback)
+    else:
+        callback()
+
+
+@asynccontextmanager
+async def advisory_lock(
+    key: int, check_interval: float | None = None
+) -> AsyncGenerator[bool, None]:
+    """
+    Сессионная advisory блокировка Postgres на время контекста.
+    Возвращает, получена ли блокировка: она не ждет, если ключ уже занят
+    другим процессом. Соединение с блокировкой удерживается до выхода из контекста.
+    Postgres снимает блокировку при обрыве соединения, поэтому с check_interval
+    соединение проверяется периодически. При потере соединения задача внутри контекста
+    отменяется, а из контекста выбрасывается RuntimeError.
+
+    Аргументы:
+        key: Ключ блокировки
+        check_interval: Интервал проверки соединения в секундах
+    """
+    async with engine.connect() as conn:
+        acquired = await conn.scalar(select(func.pg_try_advisory_lock(key)))
+        # Блокировка сессионная, поэтому соединение не держит открытую транзакцию
+        await conn.commit()
+        if not acquired:
+            yield False
+            return
+
+        lost = asyncio.Event()
+        # Проверка и снятие блокировки не выполняются на соединении одновременно
+        checking = asyncio.Lock()
+        watcher = None
+        if check_interval is not None:
+            watcher = asyncio.create_task(
+                _watch_lock_connection(
+                    conn, check_interval, checking, lost, asyncio.current_task()
+                )
+            )
+        try:
+            yield True
+        except asyncio.CancelledError:
+            if lost.is_set():
+                raise RuntimeError(
+                    f"Advisory блокировка {key} потеряна вместе с соединением"
+                ) from None
+            raise
+        finally:
+            if watcher is not None:
+                async with checking:
+                    watcher.cancel()
+                await asyncio.gather(watcher, return_exceptions=True)
+            if lost.is_set():
+                # Оборванное соединение не возвращается в пул
+                await conn.invalidate()
+            else:
+                await conn.execute(select(func.pg_advisory_unlock(key)))
+                await conn.commit()
+
+
+async def _watch_lock_connection(
+    conn: AsyncConnection,
+    interval: float,
+    checking: asyncio.Lock,
+    lost: asyncio.Event,
+    owner: asyncio.Task,
+):
+    """
+    Периодическая проверка соединения, удерживающего advisory блокировку.
+    Если соединение оборвано или не отвечает за interval, блокировка считается
+    потерянной и задача владельца блокировки отменяется.
+
+    Аргументы:
+        conn: Соединение с блокировкой
+        interval: Интервал и таймаут проверки в секундах
+        checking: Блокировка на время проверки
+        lost: Событие потери блокировки
+        owner: Задача, удерживающая блокировку
+    """
+    while True:
+        await asyncio.sleep(interval)
+        async with checking:
+            try:
+                await asyncio.wait_for(conn.scalar(select(1)), interval)
+            except (DBAPIError, asyncio.TimeoutError):
+                lost.set()
+                owner.cancel()
+                return
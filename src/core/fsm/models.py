@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.models import Base
+
+
+class FSMState(Base):
+    """
+    Sqlalchemy модель состояния конечного автомата бота для пары чат-пользователь.
+    """
+
+    __tablename__ = "fsm_states"
+    __table_args__ = (
+        # Удаление устаревших состояний
+        Index("ix_fsm_states_expires_at", "expires_at"),
+    )
+
+    bot_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    chat_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    user_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    state: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    data: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    expires_at: Mapped[datetime] = mapped_column(nullable=False)
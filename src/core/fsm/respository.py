@@ -0,0 +1,119 @@
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.db import commit, get_db_session
+from src.core.fsm.models import FSMState
+
+# Ключ состояния: (bot_id, chat_id, user_id)
+FSMKey = tuple[int, int, int]
+
+
+class FSMStateRepository:
+    """
+    Репозиторий для состояний конечного автомата бота.
+    Ключ состояния составной, поэтому репозиторий не наследует Repository,
+    работающий с объектами по ID.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Аргументы:
+            ttl: Время жизни состояния после последней записи в секундах
+        """
+        self._ttl = timedelta(seconds=ttl)
+
+    async def get(self, key: FSMKey) -> tuple[str | None, dict[str, Any]]:
+        """
+        Получение состояния и данных одним запросом.
+        Устаревшие состояния считаются пустыми.
+
+        Аргументы:
+            key: Ключ состояния
+        """
+        async with get_db_session() as session:
+            stmt = select(FSMState.state, FSMState.data).where(
+                tuple_(FSMState.bot_id, FSMState.chat_id, FSMState.user_id) == key,
+                FSMState.expires_at > func.now(),
+            )
+            row = (await session.execute(stmt)).one_or_none()
+            return (row.state, row.data) if row else (None, {})
+
+    async def save_many(self, states: dict[FSMKey, tuple[str | None, dict[str, Any]]]):
+        """
+        Запись состояний одним INSERT ... ON CONFLICT DO UPDATE.
+        Пустые состояния удаляются, а не хранятся.
+
+        Аргументы:
+            states: Ключ -> (состояние, данные)
+        """
+        if not states:
+            return
+
+        rows = [
+            {
+                "bot_id": key[0],
+                "chat_id": key[1],
+                "user_id": key[2],
+                "state": state,
+                "data": data,
+                "expires_at": func.now() + self._ttl,
+            }
+            for key, (state, data) in states.items()
+            if state is not None or data
+        ]
+        empty = [
+            key for key, (state, data) in states.items() if state is None and not data
+        ]
+
+        async with get_db_session() as session:
+            if rows:
+                stmt = insert(FSMState).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[
+                        FSMState.bot_id,
+                        FSMState.chat_id,
+                        FSMState.user_id,
+                    ],
+                    set_={
+                        "state": stmt.excluded.state,
+                        "data": stmt.excluded.data,
+                        "expires_at": stmt.excluded.expires_at,
+                    },
+                )
+                await session.execute(stmt)
+            if empty:
+                await session.execute(
+                    delete(FSMState).where(
+                        tuple_(FSMState.bot_id, FSMState.chat_id, FSMState.user_id).in_(
+                            empty
+                        )
+                    )
+                )
+            await commit(session)
+
+    async def delete_expired(self, batch_size: int) -> int:
+        """
+        Удаление пачки устаревших состояний.
+        Возвращает количество удаленных состояний.
+
+        Аргументы:
+            batch_size: Максимальное количество удаляемых состояний
+        """
+        async with get_db_session(isolated=True) as session:
+            expired = (
+                select(FSMState.bot_id, FSMState.chat_id, FSMState.user_id)
+                .where(FSMState.expires_at <= func.now())
+                .limit(batch_size)
+            )
+            result = await session.execute(
+                delete(FSMState).where(
+                    tuple_(FSMState.bot_id, FSMState.chat_id, FSMState.user_id).in_(
+                        expired
+                    )
+                )
+            )
+            await session.commit()
+            return result.rowcount
@@ -1,19 +1,99 @@
+import atexit
+import json
 import logging
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
 
+from src.core.settings import settings
 
-def get_logger(name: str) -> logging.Logger:
+# Признак частого лога чтения, который пишется только с вероятностью
+# settings.log_read_sample_rate. Передается как extra=SAMPLED
+SAMPLED = {"sampled": True}
+
+_listener: QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
     """
-    Получение дефолтного логгера.
+    Форматтер логов в JSON, по одному объекту на строку.
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
 
-    # Логирование в консоль
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Фильтр, пропускающий логи с признаком SAMPLED с заданной вероятностью.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Аргументы:
+            rate: Доля пропускаемых логов от 0 до 1
+        """
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False):
+            return True
+        return self.rate >= 1 or random.random() < self.rate
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Обработчик, передающий записи в очередь без форматирования.
+    Сообщение форматируется в потоке QueueListener, а не в цикле событий.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging():
+    """
+    Настройка логирования один раз на процесс.
+    Логгеры пишут в очередь, а вывод в консоль выполняет QueueListener
+    в отдельном потоке. Уровень и формат задаются в настройках.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(
+        JsonFormatter()
+        if settings.log_json
+        else logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
 
-    return logger
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(settings.log_read_sample_rate))
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(settings.log_level.upper())
+
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    # Запись оставшихся в очереди логов при завершении процесса
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Получение логгера. Логгеры пишут через общую очередь, настроенную в setup_logging.
+    """
+    setup_logging()
+    return logging.getLogger(name)
@@ -3,8 +3,7 @@ from enum import Enum
 from typing import List
 
 from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import ForeignKey
-from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy import ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models import Base
@@ -37,15 +36,30 @@ class OrderPosition(Base):
     """
 
     __tablename__ = "order_positions"
+    __table_args__ = (
+        # Поиск заказов с позицией и проверка ссылок при удалении позиций меню
+        Index("ix_order_positions_position_id", "position_id"),
+    )
 
     order_id: Mapped[int] = mapped_column(
         ForeignKey("orders.id", ondelete="CASCADE"), primary_key=True
     )
+    # Позицию меню нельзя удалить, пока она есть в заказах:
+    # строки заказа хранят снимок цены и суммы, на которых основана сумма заказа
     position_id: Mapped[int] = mapped_column(
-        ForeignKey("positions.id", ondelete="CASCADE"), primary_key=True
+        ForeignKey("positions.id", ondelete="RESTRICT"), primary_key=True
     )
     quantity: Mapped[int] = mapped_column(nullable=False, default=1)
     weight: Mapped[int] = mapped_column(nullable=False)  # Вес в граммах
+    unit_price: Mapped[int] = mapped_column(
+        nullable=False
+    )  # Цена за 100г на момент оформления заказа
+    position_name: Mapped[str] = mapped_column(
+        String(100), nullable=False
+    )  # Название позиции на момент оформления заказа
+    line_total: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )  # Стоимость позиции, вычисляется при записи заказа
 
     position: Mapped["Position"] = relationship(
         back_populates="order_positions"
@@ -54,10 +68,17 @@ class OrderPosition(Base):
         back_populates="order_positions"
     )  # Строковой литерал в целях измбегания рекурсии в импортах
 
-    @property
-    def total_price(self) -> int:
-        """Вычисляет общую стоимость позиции с учетом веса."""
-        return int((self.weight / 100) * self.position.price) * self.quantity
+    @staticmethod
+    def calculate_line_total(price: int, weight: int, quantity: int) -> int:
+        """
+        Вычисляет стоимость позиции с учетом веса.
+
+        Аргументы:
+            price: Цена за 100 грамм
+            weight: Вес в граммах
+            quantity: Количество
+        """
+        return int((weight / 100) * price) * quantity
 
 
 class Order(Base):
@@ -66,6 +87,17 @@ class Order(Base):
     """
 
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_user_id", "user_id"),
+        # Частичный индекс для списка активных заказов баристы
+        Index(
+            "ix_orders_processing",
+            "id",
+            postgresql_where=text("status = 'PROCESSING'"),
+        ),
+        # Даты заказов растут вместе с физическим порядком строк, BRIN компактнее B-tree
+        Index("ix_orders_date_brin", "date", postgresql_using="brin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     date: Mapped[datetime] = mapped_column(nullable=False, default=datetime.now)
@@ -80,10 +112,6 @@ class Order(Base):
     )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     user: Mapped[User] = relationship(back_populates="orders")
-
-    @hybrid_property
-    def total_price(self) -> int:
-        """Вычисляет общую сумму заказа."""
-        return sum(
-            order_position.total_price for order_position in self.order_positions
-        )
+    total_price: Mapped[int] = mapped_column(
+        nullable=False, default=0
+    )  # Сумма заказа, вычисляется при записи заказа
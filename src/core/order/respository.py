@@ -1,11 +1,16 @@
-from sqlalchemy import Select, delete, insert, select, update
-from sqlalchemy.orm import joinedload
+from sqlalchemy import ARRAY, Integer, any_, bindparam, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.db import get_db_session
 from src.core.order.models import Order, OrderPosition
-from src.core.order.schemas import OrderCreateSchema, OrderUpdateSchema
+from src.core.order.schemas import (
+    OrderCreateSchema,
+    OrderPositionCreateSchema,
+    OrderUpdateSchema,
+)
 from src.core.position.models import Position
-from src.core.repository import Repository
+from src.core.repository import Related, Repository
+from src.core.types import ObjectsNotFoundError
 
 
 class OrderRepository(Repository[Order, OrderCreateSchema, OrderUpdateSchema]):
@@ -16,7 +21,9 @@ class OrderRepository(Repository[Order, OrderCreateSchema, OrderUpdateSchema]):
     def __init__(self):
         super().__init__(Order)
 
-    async def create(self, data: OrderCreateSchema, include_related: bool) -> Order:
+    async def create(
+        self, data: OrderCreateSchema, include_related: bool | Related
+    ) -> Order:
         """
         Создание заказа.
 
@@ -25,39 +32,37 @@ class OrderRepository(Repository[Order, OrderCreateSchema, OrderUpdateSchema]):
             include_related: Загружать ли связанные объекты
         """
         async with get_db_session() as session:
+            order_positions_data, total_price = await self._prepare_order_positions(
+                session, data.order_positions
+            )
+
             # Создание заказа
-            stmt = insert(Order).values(
-                user_id=data.user_id,
-                obtaining_method=data.obtaining_method,
+            stmt = (
+                insert(Order)
+                .values(
+                    user_id=data.user_id,
+                    obtaining_method=data.obtaining_method,
+                    total_price=total_price,
+                )
+                .returning(Order)
             )
-            id = (await session.execute(stmt)).inserted_primary_key[0]
+            order = (await session.scalars(stmt)).one()
 
             # Создание позиций в заказе
-            order_positions_data = [
-                {
-                    "order_id": id,
-                    "position_id": order_position.position_id,
-                    "quantity": order_position.quantity,
-                    "weight": order_position.weight,
-                }
-                for order_position in data.order_positions
-            ]
+            for order_position_data in order_positions_data:
+                order_position_data["order_id"] = order.id
             stmt = insert(OrderPosition).values(order_positions_data)
             await session.execute(stmt)
 
-            await session.commit()
+            await self._commit(session, [order.id])
 
-            # Получение заказа с позициями
-            stmt = select(Order).where(Order.id == id)
+            # Получение заказа с позициями, только если они нужны
             if include_related:
-                stmt = self._include_related(stmt)
-
-            order = await session.execute(stmt)
-
-            return order.unique().scalar_one()
+                return (await self._reload(session, [order.id], include_related))[0]
+            return order
 
     async def update(
-        self, id: int, data: OrderUpdateSchema, include_related: bool
+        self, id: int, data: OrderUpdateSchema, include_related: bool | Related
     ) -> Order:
         """
         Обновление заказа.
@@ -77,10 +82,21 @@ class OrderRepository(Repository[Order, OrderCreateSchema, OrderUpdateSchema]):
                 order_data["status"] = data.status
             if data.obtaining_method:
                 order_data["obtaining_method"] = data.obtaining_method
+            if data.order_positions:
+                (
+                    order_positions_data,
+                    order_data["total_price"],
+                ) = await self._prepare_order_positions(session, data.order_positions)
 
+            order = None
             if order_data:
-                stmt = update(Order).where(Order.id == id).values(order_data)
-                await session.execute(stmt)
+                stmt = (
+                    update(Order)
+                    .where(Order.id == id)
+                    .values(order_data)
+                    .returning(Order)
+                )
+                order = (await session.scalars(stmt)).one_or_none()
 
             if data.order_positions:
                 # Удаление старых позиций в заказе
@@ -88,36 +104,85 @@ class OrderRepository(Repository[Order, OrderCreateSchema, OrderUpdateSchema]):
                 await session.execute(stmt)
 
                 # Обновление позиций в заказе
-                order_positions_data = [
-                    {
-                        "order_id": id,
-                        "position_id": order_position.position_id,
-                        "quantity": order_position.quantity,
-                        "weight": order_position.weight,
-                    }
-                    for order_position in data.order_positions
-                ]
+                for order_position_data in order_positions_data:
+                    order_position_data["order_id"] = id
                 stmt = insert(OrderPosition).values(order_positions_data)
                 await session.execute(stmt)
-            await session.commit()
-
-            stmt = select(Order).where(Order.id == id)
-            if include_related:
-                stmt = self._include_related(stmt)
-            order = await session.execute(stmt)
-
-            return order.unique().scalar_one()
-
-    def _include_related(self, stmt: Select) -> Select:
+            await self._commit(session, [id])
+
+            # Повторный запрос нужен только для связанных объектов,
+            # при замене позиций или если заказ не был изменен
+            if include_related or data.order_positions or order is None:
+                # Позиции заказа могли быть уже загружены в сессию единицы работы
+                stmt = (
+                    select(Order)
+                    .where(Order.id == id)
+                    .execution_options(populate_existing=True)
+                )
+                if include_related:
+                    stmt = self._include_related(stmt, include_related)
+                order = (await session.execute(stmt)).unique().scalar_one()
+
+            return order
+
+    async def _prepare_order_positions(
+        self,
+        session: AsyncSession,
+        order_positions: list[OrderPositionCreateSchema],
+    ) -> tuple[list[dict], int]:
         """
-        Вспомогательная функция для включения связанных объектов.
+        Вспомогательная функция для подготовки позиций заказа к записи.
+        Получает цены и названия всех позиций одним запросом, сохраняет их снимок
+        и вычисляет стоимость каждой позиции и сумму заказа.
+        Если часть позиций не найдена, вызывает ObjectsNotFoundError со всеми их ID.
 
         Аргументы:
-            stmt: SQLAlchemy запрос
+            session: Сессия, в которой выполняется запрос
+            order_positions: Позиции заказа
         """
-        stmt = stmt.options(
-            joinedload(self.model.order_positions)
-            .joinedload(OrderPosition.position)
-            .joinedload(Position.category)
+        stmt = select(Position.id, Position.price, Position.name).where(
+            Position.id
+            == any_(
+                bindparam(
+                    "ids",
+                    [order_position.position_id for order_position in order_positions],
+                    type_=ARRAY(Integer),
+                )
+            )
+        )
+        positions = {row.id: row for row in await session.execute(stmt)}
+        missing_ids = {
+            order_position.position_id for order_position in order_positions
+        } - positions.keys()
+        if missing_ids:
+            raise ObjectsNotFoundError(missing_ids)
+
+        order_positions_data = [
+            {
+                "position_id": order_position.position_id,
+                "quantity": order_position.quantity,
+                "weight": order_position.weight,
+                "unit_price": positions[order_position.position_id].price,
+                "position_name": positions[order_position.position_id].name,
+                "line_total": OrderPosition.calculate_line_total(
+                    positions[order_position.position_id].price,
+                    order_position.weight,
+                    order_position.quantity,
+                ),
+            }
+            for order_position in order_positions
+        ]
+        total_price = sum(
+            order_position_data["line_total"]
+            for order_position_data in order_positions_data
         )
-        return stmt
+
+        return order_positions_data, total_price
+
+    def _related_paths(self) -> list[tuple]:
+        """
+        Пути связей, загружаемых при include_related.
+        """
+        # Позиции заказа содержат снимок цены и названия, поэтому позиции меню
+        # и их категории не загружаются
+        return [(Order.order_positions,)]
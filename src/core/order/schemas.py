@@ -22,6 +22,9 @@ class OrderPositionGetSchema(OrderPositionCreateSchema):
     Pydantic схема для получения позиции в заказе.
     """
 
+    unit_price: int
+    position_name: str
+    line_total: int
     position: Optional[PositionGetSchema] = None
 
 
@@ -55,5 +58,5 @@ class OrderGetSchema(OrderCreateSchema):
     id: int
     date: datetime
     status: Status
-    total_price: int | None
-    order_positions: list[OrderPositionGetSchema]
+    total_price: int
+    order_positions: list[OrderPositionGetSchema] = []  # Пусто, если не загружены
@@ -1,18 +1,16 @@
 import logging
 
-from sqlalchemy.orm.exc import DetachedInstanceError
-
 from src.core.logger import get_logger
-from src.core.order.models import ObtainingMethod, Order, Status
+from src.core.order.models import Order
 from src.core.order.respository import OrderRepository
 from src.core.order.schemas import (
     OrderCreateSchema,
     OrderGetSchema,
-    OrderPositionGetSchema,
     OrderUpdateSchema,
 )
 from src.core.position.service import PositionService
 from src.core.service import Service
+from src.core.types import ObjectsNotFoundError
 from src.core.user.respository import UserRepository
 
 
@@ -25,24 +23,25 @@ class OrderService(
     Сервис для заказов.
     """
 
+    _schema = OrderGetSchema
+    _schema_relations = {
+        "order_positions": {"position": PositionService._schema_relations}
+    }
     _logger: logging.Logger = get_logger("OrderService")
 
     def __init__(
         self,
         repository: OrderRepository,
-        position_service: PositionService,
         user_repository: UserRepository,
         exception: Exception,
     ):
         """
         Аргументы:
             repository: Репозиторий, который будет использовать сервис
-            position_service: Сервис для позиций
             user_repository: Репозиторий для пользователей
             exception: Исключение, которое будет использовать сервис
         """
         super().__init__(repository, exception)
-        self._position_service = position_service
         self._user_repository = user_repository
 
     async def create(
@@ -55,20 +54,20 @@ class OrderService(
             data: Данные для создания объекта
             include_related: Загружать ли связанные объекты
         """
-        self._logger.info(f"Создание объекта: {data.model_dump(exclude_unset=True)}")
+        self._logger.info("Создание объекта: %s", data)
 
         # Проверка на наличие пользователя в бд
-        if not await self._user_repository.get(data.user_id, False):
+        if not await self._user_repository.exists(data.user_id):
             self._handle_error("Пользователь с таким ID не найден", status_code=404)
 
-        # Проверка на наличие позиций в бд
-        for order_position in data.order_positions:
-            await self._position_service.get(order_position.position_id, False)
-
-        obj: Order = await self._repository.create(data, include_related)
+        # Наличие позиций проверяется тем же запросом, которым загружаются их цены
+        try:
+            obj: Order = await self._repository.create(data, include_related)
+        except ObjectsNotFoundError as e:
+            self._handle_error(str(e), status_code=404)
         if not obj:
             self._handle_error("Не удалось создать объект", status_code=400)
-        self._logger.info(f"Объект успешно создан с id: {obj.id}")
+        self._logger.info("Объект успешно создан с id: %s", obj.id)
 
         return self._convert_to_schema(obj)
 
@@ -83,63 +82,25 @@ class OrderService(
             data: Данные для обновления объекта
             include_related: Загружать ли связанные объекты
         """
-        self._logger.info(
-            f"Обновление объекта с id: {id} и данными: {data.model_dump(exclude_unset=True)}"
-        )
-        await self.get(id)
+        self._logger.info("Обновление объекта с id: %s и данными: %s", id, data)
+        if not await self._repository.exists(id):
+            self._handle_error(f"Объект с id: {id} не найден", status_code=404)
 
         # Проверка на наличие пользователя в бд
-        if data.user_id is not None and not await self._user_repository.get(
-            data.user_id, False
+        if data.user_id is not None and not await self._user_repository.exists(
+            data.user_id
         ):
             self._handle_error("Пользователь с таким ID не найден", status_code=404)
 
-        # Проверка на наличие позиций в бд
-        if data.order_positions:
-            for order_position in data.order_positions:
-                await self._position_service.get(order_position.position_id)
-
-        obj: Order = await self._repository.update(id, data, include_related)
+        # Наличие позиций проверяется тем же запросом, которым загружаются их цены
+        try:
+            obj: Order = await self._repository.update(id, data, include_related)
+        except ObjectsNotFoundError as e:
+            self._handle_error(str(e), status_code=404)
         if not obj:
             self._handle_error(
                 f"Не удалось обновить объект с id: {id}", status_code=400
             )
-        self._logger.info(f"Объект с id: {id} успешно обновлен")
+        self._logger.info("Объект с id: %s успешно обновлен", id)
 
         return self._convert_to_schema(obj)
-
-    def _convert_to_schema(self, obj: Order) -> OrderGetSchema:
-        """
-        Преобразование модели в схему.
-
-        Аргументы:
-            obj: Модель для преобразования
-        """
-        try:
-            order_positions = [
-                OrderPositionGetSchema(
-                    position_id=position.position_id,
-                    quantity=position.quantity,
-                    weight=position.weight,
-                    position=self._position_service._convert_to_schema(
-                        position.position
-                    ),
-                )
-                for position in obj.order_positions
-            ]
-            total_price = obj.total_price
-        except (
-            DetachedInstanceError
-        ):  # Если объект не загружен, то возвращаем пустой список
-            order_positions = []
-            total_price = None
-
-        return OrderGetSchema(
-            id=obj.id,
-            user_id=obj.user_id,
-            date=obj.date,
-            status=Status(obj.status),
-            obtaining_method=ObtainingMethod(obj.obtaining_method),
-            total_price=total_price,
-            order_positions=order_positions,
-        )
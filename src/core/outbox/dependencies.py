@@ -0,0 +1,7 @@
+from src.core.container import get_container
+from src.core.outbox.service import OutboxService
+from src.core.types import ServiceException
+
+
+def get_outbox_service(exception: Exception = ServiceException) -> OutboxService:
+    return get_container(exception).outbox_service
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.models import Base
+
+
+class OutboxMessage(Base):
+    """
+    Sqlalchemy модель сообщения в исходящей очереди (transactional outbox).
+    Записывается в одной транзакции с изменением, о котором уведомляет,
+    и удаляется после отправки.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # Выборка сообщений, готовых к отправке
+        Index("ix_outbox_available_at", "available_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Время, с которого сообщение можно взять в отправку.
+    # При захвате сдвигается вперед, чтобы после сбоя отправителя сообщение вернулось
+    available_at: Mapped[datetime] = mapped_column(
+        nullable=False, server_default=func.now()
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        nullable=False, server_default=func.now()
+    )
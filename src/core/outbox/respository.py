@@ -0,0 +1,123 @@
+from datetime import timedelta
+from typing import Callable
+
+from sqlalchemy import delete, func, select, update
+
+from src.core.db import after_commit, get_db_session
+from src.core.outbox.models import OutboxMessage
+from src.core.outbox.schemas import (
+    OutboxMessageCreateSchema,
+    OutboxMessageUpdateSchema,
+)
+from src.core.repository import Repository
+
+
+class OutboxRepository(
+    Repository[OutboxMessage, OutboxMessageCreateSchema, OutboxMessageUpdateSchema]
+):
+    """
+    Репозиторий для исходящей очереди сообщений.
+    """
+
+    def __init__(self):
+        super().__init__(OutboxMessage)
+        self._listeners: list[Callable[[], None]] = []
+
+    def subscribe(self, callback: Callable[[], None]):
+        """
+        Подписка на появление новых сообщений.
+        Функция вызывается после коммита транзакции, в которой они записаны.
+
+        Аргументы:
+            callback: Функция без аргументов
+        """
+        self._listeners.append(callback)
+
+    async def enqueue(
+        self, data: list[OutboxMessageCreateSchema]
+    ) -> list[OutboxMessage]:
+        """
+        Запись сообщений в очередь в текущей транзакции.
+        Внутри единицы работы сообщения появятся в очереди только вместе
+        с остальными изменениями, при откате они отбрасываются.
+
+        Аргументы:
+            data: Данные сообщений
+        """
+        messages = await self.bulk_create(data, include_related=False)
+        if messages:
+            async with get_db_session() as session:
+                for callback in self._listeners:
+                    after_commit(session, callback)
+        return messages
+
+    async def claim(self, batch_size: int, lease: float) -> list[OutboxMessage]:
+        """
+        Захват готовых к отправке сообщений.
+        Строки блокируются через FOR UPDATE SKIP LOCKED, поэтому несколько отправителей
+        разбирают очередь параллельно, не получая одни и те же сообщения.
+        Захват фиксируется сразу и действует lease секунд: если отправитель упадет,
+        сообщения снова станут доступны.
+
+        Аргументы:
+            batch_size: Максимальное количество сообщений
+            lease: Время захвата в секундах
+        """
+        async with get_db_session(isolated=True) as session:
+            claimable = (
+                select(OutboxMessage.id)
+                .where(OutboxMessage.available_at <= func.now())
+                .order_by(OutboxMessage.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            stmt = (
+                update(OutboxMessage)
+                .where(OutboxMessage.id.in_(claimable))
+                .values(
+                    available_at=func.now() + timedelta(seconds=lease),
+                    attempts=OutboxMessage.attempts + 1,
+                )
+                .returning(OutboxMessage)
+            )
+            messages = list((await session.scalars(stmt)).all())
+            await session.commit()
+            return sorted(messages, key=lambda message: message.id)
+
+    async def complete(self, ids: list[int]):
+        """
+        Удаление отправленных сообщений.
+
+        Аргументы:
+            ids: ID сообщений
+        """
+        if not ids:
+            return
+
+        async with get_db_session(isolated=True) as session:
+            await session.execute(
+                delete(OutboxMessage).where(self._id_in(ids)),
+                execution_options={"synchronize_session": False},
+            )
+            await session.commit()
+
+    async def release(self, ids: list[int]):
+        """
+        Возврат захваченных, но не отправленных сообщений в очередь.
+        Сообщения сразу становятся доступны для захвата, попытка не засчитывается.
+
+        Аргументы:
+            ids: ID сообщений
+        """
+        if not ids:
+            return
+
+        async with get_db_session(isolated=True) as session:
+            await session.execute(
+                update(OutboxMessage)
+                .where(self._id_in(ids))
+                .values(available_at=func.now(), attempts=OutboxMessage.attempts - 1),
+                execution_options={"synchronize_session": False},
+            )
+            await session.commit()
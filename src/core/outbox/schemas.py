@@ -0,0 +1,30 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class OutboxMessageCreateSchema(BaseModel):
+    """
+    Pydantic схема для создания сообщения в исходящей очереди.
+    """
+
+    chat_id: int
+    text: str
+
+
+class OutboxMessageUpdateSchema(BaseModel):
+    """
+    Pydantic схема для обновления сообщения. Все поля необязательные.
+    """
+
+    chat_id: Optional[int] = None
+    text: Optional[str] = None
+
+
+class OutboxMessageGetSchema(OutboxMessageCreateSchema):
+    """
+    Pydantic схема для получения сообщения.
+    """
+
+    id: int
+    attempts: int
@@ -0,0 +1,86 @@
+import logging
+from typing import Callable
+
+from src.core.logger import get_logger
+from src.core.outbox.models import OutboxMessage
+from src.core.outbox.respository import OutboxRepository
+from src.core.outbox.schemas import (
+    OutboxMessageCreateSchema,
+    OutboxMessageGetSchema,
+    OutboxMessageUpdateSchema,
+)
+from src.core.service import Service
+
+
+class OutboxService(
+    Service[
+        OutboxMessage,
+        OutboxMessageCreateSchema,
+        OutboxMessageGetSchema,
+        OutboxMessageUpdateSchema,
+        OutboxRepository,
+    ]
+):
+    """
+    Сервис для исходящей очереди сообщений.
+    """
+
+    _schema = OutboxMessageGetSchema
+    _logger: logging.Logger = get_logger("OutboxService")
+
+    def subscribe(self, callback: Callable[[], None]):
+        """
+        Подписка на появление новых сообщений после коммита.
+
+        Аргументы:
+            callback: Функция без аргументов
+        """
+        self._repository.subscribe(callback)
+
+    async def enqueue(self, chat_ids: list[int], text: str) -> int:
+        """
+        Запись сообщения для нескольких чатов в очередь в текущей транзакции.
+        Возвращает количество записанных сообщений.
+
+        Аргументы:
+            chat_ids: ID чатов
+            text: Текст сообщения
+        """
+        messages = await self._repository.enqueue(
+            [
+                OutboxMessageCreateSchema(chat_id=chat_id, text=text)
+                for chat_id in chat_ids
+            ]
+        )
+        self._logger.info("В очередь записано сообщений: %s", len(messages))
+        return len(messages)
+
+    async def claim(
+        self, batch_size: int, lease: float
+    ) -> list[OutboxMessageGetSchema]:
+        """
+        Захват готовых к отправке сообщений.
+
+        Аргументы:
+            batch_size: Максимальное количество сообщений
+            lease: Время захвата в секундах, после которого сообщения снова доступны
+        """
+        return self._convert_to_schemas(await self._repository.claim(batch_size, lease))
+
+    async def complete(self, ids: list[int]):
+        """
+        Удаление обработанных сообщений из очереди.
+
+        Аргументы:
+            ids: ID сообщений
+        """
+        await self._repository.complete(ids)
+
+    async def release(self, ids: list[int]):
+        """
+        Возврат неотправленных сообщений в очередь без траты попытки.
+
+        Аргументы:
+            ids: ID сообщений
+        """
+        await self._repository.release(ids)
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models import Base
@@ -11,6 +11,15 @@ class Position(Base):
     """
 
     __tablename__ = "positions"
+    __table_args__ = (
+        # Триграммный индекс для нечеткого поиска и фильтрации по подстроке названия
+        Index(
+            "ix_positions_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
@@ -20,5 +29,5 @@ class Position(Base):
     category: Mapped["Category"] = relationship("Category", back_populates="positions")
     price: Mapped[int] = mapped_column(nullable=False)
     order_positions: Mapped[list[OrderPosition]] = relationship(  # type: ignore
-        "OrderPosition", back_populates="position", cascade="all, delete-orphan"
+        "OrderPosition", back_populates="position", passive_deletes="all"
     )
@@ -1,22 +1,39 @@
-from sqlalchemy import select
+from sqlalchemy import ARRAY, Integer, any_, bindparam, select
+from sqlalchemy.orm import InstrumentedAttribute
 
+from src.core.cache import menu_cache
 from src.core.db import get_db_session
+from src.core.order.models import OrderPosition
 from src.core.position.models import Position
 from src.core.position.schemas import PositionCreateSchema, PositionUpdateSchema
-from src.core.repository import Repository
+from src.core.repository import Related, Repository, SearchRepositoryMixin
 
 
 class PositionRepository(
-    Repository[Position, PositionCreateSchema, PositionUpdateSchema]
+    SearchRepositoryMixin,
+    Repository[Position, PositionCreateSchema, PositionUpdateSchema],
 ):
     """
     Репозиторий для позиций.
     """
 
     def __init__(self):
-        super().__init__(Position)
+        super().__init__(Position, cache=menu_cache)
 
-    async def get_by_name(self, name: str, include_related: bool) -> Position:
+    def _search_column(self) -> InstrumentedAttribute:
+        """
+        Поиск позиций выполняется по названию.
+        """
+        return Position.name
+
+    def _related_paths(self) -> list[tuple]:
+        """
+        Пути связей, загружаемых при include_related.
+        """
+        # Позиции заказов не нужны для меню и не должны попадать в его кэш
+        return [(Position.category,)]
+
+    async def get_by_name(self, name: str, include_related: bool | Related) -> Position:
         """
         Получение позиции по названию.
 
@@ -25,9 +42,30 @@ class PositionRepository(
             include_related: Загружать ли связанные объекты
         """
         async with get_db_session() as session:
-            result = await session.execute(
-                select(Position).where(Position.name == name)
-            )
+            stmt = select(Position).where(Position.name == name)
             if include_related:
-                result = self._include_related(result)
-            return result.scalar_one_or_none()
+                stmt = self._include_related(stmt, include_related)
+            result = await session.execute(stmt)
+            return result.unique().scalar_one_or_none()
+
+    async def find_ordered(self, ids: list[int]) -> set[int]:
+        """
+        Получение ID позиций из списка, которые есть в заказах, одним запросом.
+
+        Аргументы:
+            ids: Список ID позиций
+        """
+        if not ids:
+            return set()
+
+        async with get_db_session() as session:
+            stmt = (
+                select(OrderPosition.position_id)
+                .where(
+                    OrderPosition.position_id
+                    == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+                )
+                .distinct()
+            )
+            result = await session.execute(stmt)
+            return set(result.scalars().all())
@@ -1,7 +1,5 @@
 import logging
 
-from sqlalchemy.orm.exc import DetachedInstanceError
-
 from src.core.category.service import CategoryService
 from src.core.logger import get_logger
 from src.core.position.models import Position
@@ -11,22 +9,25 @@ from src.core.position.schemas import (
     PositionGetSchema,
     PositionUpdateSchema,
 )
-from src.core.service import Service
+from src.core.service import SearchServiceMixin, Service
 
 
 class PositionService(
+    SearchServiceMixin,
     Service[
         Position,
         PositionCreateSchema,
         PositionGetSchema,
         PositionUpdateSchema,
         PositionRepository,
-    ]
+    ],
 ):
     """
     Сервис для позиций.
     """
 
+    _schema = PositionGetSchema
+    _schema_relations = {"category": {}}
     _logger: logging.Logger = get_logger("PositionService")
 
     def __init__(
@@ -54,19 +55,19 @@ class PositionService(
             data: Данные для создания объекта
             include_related: Загружать ли связанные объекты
         """
-        if not await self._category_service.get(data.category_id, False):
+        if not await self._category_service.exists(data.category_id):
             self._handle_error("Категория с таким ID не найдена", status_code=404)
 
-        if await self._repository.get_by_name(data.name, False):
+        if await self._repository.exists_by(name=data.name):
             self._handle_error(
                 "Позиция с таким названием уже существует", status_code=409
             )
 
-        self._logger.info(f"Создание объекта: {data.model_dump(exclude_unset=True)}")
+        self._logger.info("Создание объекта: %s", data)
         obj: Position = await self._repository.create(data, include_related)
         if not obj:
             self._handle_error("Не удалось создать объект", status_code=400)
-        self._logger.info(f"Объект успешно создан с id: {obj.id}")
+        self._logger.info("Объект успешно создан с id: %s", obj.id)
 
         return self._convert_to_schema(obj)
 
@@ -81,49 +82,109 @@ class PositionService(
             data: Данные для обновления объекта
             include_related: Загружать ли связанные объекты
         """
-        self._logger.info(
-            f"Обновление объекта с id: {id} и данными: {data.model_dump(exclude_unset=True)}"
-        )
-        obj = await self.get(id, True)
-
+        self._logger.info("Обновление объекта с id: %s и данными: %s", id, data)
         if len(list(data.model_dump(exclude_unset=True).keys())) == 0:
-            self._logger.info(f"Объект с id: {id} не изменен")
-            return self._convert_to_schema(obj)
+            self._logger.info("Объект с id: %s не изменен", id)
+            return await self.get(id, include_related)
 
-        if data.category_id and not await self._category_service.get(
-            data.category_id, False
+        if data.category_id and not await self._category_service.exists(
+            data.category_id
         ):
             self._handle_error("Категория с таким ID не найдена", status_code=404)
 
-        if data.name and await self._repository.get_by_name(data.name, False):
+        if data.name and await self._repository.exists_by(name=data.name):
             self._handle_error(
                 "Позиция с таким названием уже существует", status_code=409
             )
 
         obj: Position = await self._repository.update(id, data, include_related)
         if not obj:
+            self._handle_error(f"Объект с id: {id} не найден", status_code=404)
+        self._logger.info("Объект с id: %s успешно обновлен", id)
+
+        return self._convert_to_schema(obj)
+
+    async def delete(self, id: int) -> bool:
+        """
+        Удаление объекта. Проверяет, что позиции нет в заказах.
+
+        Аргументы:
+            id: ID объекта
+        """
+        if await self._repository.find_ordered([id]):
             self._handle_error(
-                f"Не удалось обновить объект с id: {id}", status_code=400
+                "Позиция есть в заказах и не может быть удалена", status_code=409
             )
-        self._logger.info(f"Объект с id: {id} успешно обновлен")
 
-        return self._convert_to_schema(obj)
+        return await super().delete(id)
+
+    async def _validate_bulk_create(
+        self, data: list[PositionCreateSchema]
+    ) -> dict[int, str]:
+        """
+        Проверка элементов пакетного создания: наличие категорий
+        и уникальность названий в БД и в пакете.
+
+        Аргументы:
+            data: Данные для создания объектов
+        """
+        return await self._validate_positions(list(enumerate(data)), {})
 
-    def _convert_to_schema(self, obj: Position) -> PositionGetSchema:
+    async def _validate_bulk_update(
+        self, data: list[tuple[int, PositionUpdateSchema]]
+    ) -> dict[int, str]:
         """
-        Преобразование модели в схему.
+        Проверка элементов пакетного обновления: наличие позиций и категорий
+        и уникальность названий в БД и в пакете.
 
         Аргументы:
-            obj: Модель для преобразования
-        """
-        try:
-            category = self._category_service._convert_to_schema(obj.category)
-        except DetachedInstanceError:  # Если объект не загружен, то возвращаем None
-            category = None
-
-        return PositionGetSchema(
-            id=obj.id,
-            name=obj.name,
-            price=obj.price,
-            category=category,
+            data: Пары из ID объекта и данных для его обновления
+        """
+        errors = await super()._validate_bulk_update(data)
+        return await self._validate_positions(
+            [(index, item) for index, (_, item) in enumerate(data)], errors
         )
+
+    async def _validate_positions(
+        self,
+        data: list[tuple[int, PositionCreateSchema | PositionUpdateSchema]],
+        errors: dict[int, str],
+    ) -> dict[int, str]:
+        """
+        Вспомогательный метод для пакетной проверки категорий и названий позиций.
+
+        Аргументы:
+            data: Пары из индекса элемента и данных позиции
+            errors: Уже найденные ошибки по индексам элементов
+        """
+        existing_category_ids = await self._category_service.find_existing(
+            [item.category_id for _, item in data if item.category_id]
+        )
+        existing_names = await self._repository.find_existing(
+            "name", [item.name for _, item in data if item.name]
+        )
+        seen_names = set()
+        for index, item in data:
+            if index in errors:
+                continue
+            if item.category_id and item.category_id not in existing_category_ids:
+                errors[index] = "Категория с таким ID не найдена"
+            elif item.name and (item.name in existing_names or item.name in seen_names):
+                errors[index] = "Позиция с таким названием уже существует"
+            seen_names.add(item.name)
+
+        return errors
+
+    async def _validate_bulk_delete(self, ids: list[int]) -> dict[int, str]:
+        """
+        Проверка элементов пакетного удаления: позиции нет в заказах.
+
+        Аргументы:
+            ids: Список ID объектов
+        """
+        ordered_ids = await self._repository.find_ordered(ids)
+        return {
+            index: "Позиция есть в заказах и не может быть удалена"
+            for index, id in enumerate(ids)
+            if id in ordered_ids
+        }
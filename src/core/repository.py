@@ -1,26 +1,175 @@
-from typing import Generic, Type, TypeVar
+import copy
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Generic, Hashable, Type, TypeVar
 
-from sqlalchemy import Select, delete, func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import (
+    ARRAY,
+)
+from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy import (
+    Integer,
+    Result,
+    Select,
+    String,
+    any_,
+    bindparam,
+    column,
+    delete,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+    joinedload,
+    make_transient_to_detached,
+    selectinload,
+)
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.core.db import get_db_session
+from src.core.cache import QueryCache, invalidate_tables
+from src.core.changes import publish_changes
+from src.core.db import after_commit, commit, get_db_session
 from src.core.types import CreateSchemaType, ModelType, UpdateSchemaType
 
 
+class LoadStrategy(str, Enum):
+    """
+    Стратегия загрузки связанных объектов.
+    """
+
+    NONE = "none"  # Не загружать связанные объекты
+    # Коллекции через selectinload, ссылки на один объект через joinedload
+    AUTO = "auto"
+    SELECTIN = "selectin"  # Все связи отдельными запросами SELECT ... WHERE id IN
+    JOINED = "joined"  # Все связи через JOIN в одном запросе
+
+
+@dataclass(frozen=True)
+class Related:
+    """
+    Параметры загрузки связанных объектов для одного вызова репозитория.
+    Передается вместо include_related=True.
+    """
+
+    strategy: LoadStrategy = LoadStrategy.AUTO
+    depth: int | None = None  # Глубина загрузки по пути связей, None - весь путь
+
+    def __bool__(self) -> bool:
+        return self.strategy != LoadStrategy.NONE and self.depth != 0
+
+    def loader(self, attr: InstrumentedAttribute) -> Callable:
+        """
+        Функция загрузки для связи с учетом стратегии.
+
+        Аргументы:
+            attr: Атрибут связи модели
+        """
+        if self.strategy == LoadStrategy.JOINED:
+            return joinedload
+        if self.strategy == LoadStrategy.SELECTIN or attr.property.uselist:
+            return selectinload
+        return joinedload
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """
+    Неизменяемый снимок загруженного состояния объекта для кэша.
+    """
+
+    model: type
+    columns: tuple[tuple[str, Any], ...]
+    relations: tuple[tuple[str, Any], ...]
+
+
+def _freeze(value: Any, path: frozenset[int] = frozenset()) -> Any:
+    """
+    Снимок результата запроса: объекты модели заменяются снимками их загруженных
+    атрибутов, списки - кортежами. Связь, ведущая обратно к объекту на пути
+    от корня, в снимок не попадает.
+
+    Аргументы:
+        value: Результат запроса
+        path: ID объектов на пути от корня снимка
+    """
+    if isinstance(value, list):
+        return tuple(_freeze(item, path) for item in value)
+    if not hasattr(type(value), "__mapper__"):
+        return value
+
+    state = inspect(value)
+    loaded = state.dict
+    path = path | {id(value)}
+    relations = []
+    for relationship in state.mapper.relationships:
+        if relationship.key not in loaded:
+            continue
+        related = loaded[relationship.key]
+        items = related if isinstance(related, list) else [related]
+        if any(id(item) in path for item in items):
+            continue
+        relations.append((relationship.key, _freeze(related, path)))
+    return _Snapshot(
+        type(value),
+        tuple(
+            (attr.key, loaded[attr.key])
+            for attr in state.mapper.column_attrs
+            if attr.key in loaded
+        ),
+        tuple(relations),
+    )
+
+
+def _thaw(value: Any) -> Any:
+    """
+    Восстановление результата запроса из снимка.
+    Объекты создаются заново, отсоединенными от сессии, с теми же загруженными
+    атрибутами. Обращение к незагруженным атрибутам вызывает DetachedInstanceError.
+
+    Аргументы:
+        value: Снимок результата запроса
+    """
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    if not isinstance(value, _Snapshot):
+        return value
+
+    obj = value.model.__mapper__.class_manager.new_instance()
+    for key, column_value in value.columns:
+        # Изменяемые значения (JSON, массивы) копируются, остальные неизменяемы
+        if isinstance(column_value, (dict, list)):
+            column_value = copy.deepcopy(column_value)
+        set_committed_value(obj, key, column_value)
+    for key, related in value.relations:
+        set_committed_value(obj, key, _thaw(related))
+    make_transient_to_detached(obj)
+    return obj
+
+
 class Repository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
     Базовый класс для репозитория.
     Репозиторий нужен для работы с БД.
     """
 
-    def __init__(self, model: Type[ModelType]):
+    def __init__(self, model: Type[ModelType], cache: QueryCache | None = None):
         """
         Аргументы:
             model: Sqlalchemy модель, которую будет использовать репозиторий.
+            cache: Кэш результатов запросов на чтение, по умолчанию не используется
         """
         self.model = model
+        self._cache = cache
 
-    async def get(self, id: int, include_related: bool) -> ModelType | None:
+    async def get(self, id: int, include_related: bool | Related) -> ModelType | None:
         """
         Получение объекта по ID.
 
@@ -31,12 +180,82 @@ class Repository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         async with get_db_session() as session:
             stmt = select(self.model).where(self.model.id == id)
             if include_related:
-                stmt = self._include_related(stmt)
-            result = await session.execute(stmt)
-            return result.unique().scalar_one_or_none()
+                stmt = self._include_related(stmt, include_related)
+            return await self._execute_cached(
+                session,
+                stmt,
+                include_related,
+                lambda result: result.unique().scalar_one_or_none(),
+            )
+
+    async def get_many(
+        self, ids: list[int], include_related: bool | Related
+    ) -> list[ModelType]:
+        """
+        Получение объектов по списку ID одним запросом.
+        Список передается одним параметром-массивом (WHERE id = ANY(:ids)),
+        поэтому текст запроса не зависит от количества ID.
+
+        Аргументы:
+            ids: Список ID объектов
+            include_related: Загружать ли связанные объекты
+        """
+        async with get_db_session() as session:
+            stmt = select(self.model).where(self._id_in(ids))
+            if include_related:
+                stmt = self._include_related(stmt, include_related)
+            return await self._execute_cached(
+                session, stmt, include_related, self._fetch_all
+            )
+
+    async def exists(self, id: int) -> bool:
+        """
+        Проверка наличия объекта по ID без загрузки строки.
+
+        Аргументы:
+            id: ID объекта
+        """
+        return await self.exists_by(id=id)
+
+    async def exists_by(self, **filters) -> bool:
+        """
+        Проверка наличия объекта по значениям полей запросом SELECT EXISTS (SELECT id ...).
+
+        Аргументы:
+            filters: Значения полей модели
+        """
+        async with get_db_session() as session:
+            stmt = select(
+                select(self.model.id)
+                .where(
+                    *(
+                        getattr(self.model, key) == value
+                        for key, value in filters.items()
+                    )
+                )
+                .exists()
+            )
+            return await self._execute_cached(
+                session, stmt, False, lambda result: bool(result.scalar())
+            )
+
+    async def count(self, filters: UpdateSchemaType | None = None) -> int:
+        """
+        Подсчет количества объектов запросом count(*) без загрузки строк.
+
+        Аргументы:
+            filters: Фильтры для поиска
+        """
+        async with get_db_session() as session:
+            stmt = select(func.count()).select_from(self.model)
+            if filters:
+                stmt = stmt.where(*self._convert_filters_to_lower_case(filters))
+            return await self._execute_cached(
+                session, stmt, False, lambda result: result.scalar()
+            )
 
     async def get_all(
-        self, include_related: bool, filters: UpdateSchemaType | None = None
+        self, include_related: bool | Related, filters: UpdateSchemaType | None = None
     ) -> list[ModelType]:
         """
         Получение всех объектов с необязательными фильтрами.
@@ -48,78 +267,150 @@ class Repository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         async with get_db_session() as session:
             stmt = select(self.model)
             if include_related:
-                stmt = self._include_related(stmt)
+                stmt = self._include_related(stmt, include_related)
 
             if filters:
                 processed_filters = self._convert_filters_to_lower_case(filters)
                 stmt = stmt.where(*processed_filters)
 
-            result = await session.execute(stmt)
-            return list(result.unique().scalars().all())
+            return await self._execute_cached(
+                session, stmt, include_related, self._fetch_all
+            )
+
+    async def get_page(
+        self,
+        after_id: int | None,
+        limit: int,
+        include_related: bool | Related,
+        filters: UpdateSchemaType | None = None,
+    ) -> list[ModelType]:
+        """
+        Получение страницы объектов с курсорной (keyset) пагинацией по ID.
+
+        Аргументы:
+            after_id: ID последнего объекта предыдущей страницы
+            limit: Максимальное количество объектов на странице
+            include_related: Загружать ли связанные объекты
+            filters: Фильтры для поиска
+        """
+        async with get_db_session() as session:
+            stmt = select(self.model).order_by(self.model.id).limit(limit)
+            if after_id is not None:
+                stmt = stmt.where(self.model.id > after_id)
+            if include_related:
+                stmt = self._include_related(stmt, include_related)
+
+            if filters:
+                processed_filters = self._convert_filters_to_lower_case(filters)
+                stmt = stmt.where(*processed_filters)
+
+            return await self._execute_cached(
+                session, stmt, include_related, self._fetch_all
+            )
+
+    async def stream(
+        self,
+        include_related: bool | Related,
+        filters: UpdateSchemaType | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        """
+        Потоковое получение объектов через серверный курсор.
+        Объекты читаются из БД пачками и не накапливаются в памяти целиком.
+        Стратегия JOINED для коллекций несовместима с курсором, используйте AUTO или SELECTIN.
+
+        Аргументы:
+            include_related: Загружать ли связанные объекты
+            filters: Фильтры для поиска
+            batch_size: Количество строк, читаемых из курсора за раз
+        """
+        async with get_db_session(isolated=True) as session:
+            stmt = (
+                select(self.model)
+                .order_by(self.model.id)
+                .execution_options(yield_per=batch_size)
+            )
+            if include_related:
+                stmt = self._include_related(stmt, include_related)
 
-    async def create(self, data: CreateSchemaType, include_related: bool) -> ModelType:
+            if filters:
+                processed_filters = self._convert_filters_to_lower_case(filters)
+                stmt = stmt.where(*processed_filters)
+
+            result = await session.stream_scalars(stmt)
+            async for obj in result:
+                yield obj
+
+    async def create(
+        self, data: CreateSchemaType, include_related: bool | Related
+    ) -> ModelType:
         """
-        Создание объекта.
+        Создание объекта одним запросом INSERT ... RETURNING.
+        Связанные объекты загружаются отдельным запросом, только если они нужны.
 
         Аргументы:
             data: Данные для создания объекта
             include_related: Загружать ли связанные объекты
         """
         async with get_db_session() as session:
-            obj = self.model(**data.model_dump())
-            session.add(obj)
-            await session.commit()
-            await session.refresh(obj)
+            stmt = insert(self.model).values(**data.model_dump()).returning(self.model)
+            obj = (await session.scalars(stmt)).one()
+            await self._commit(session, [obj.id])
 
-            stmt = select(self.model).where(self.model.id == obj.id)
             if include_related:
-                stmt = self._include_related(stmt)
-            result = await session.execute(stmt)
-            return result.unique().scalar_one()
+                return (await self._reload(session, [obj.id], include_related))[0]
+            return obj
 
     async def update(
-        self, id: int, data: UpdateSchemaType, include_related: bool
+        self, id: int, data: UpdateSchemaType, include_related: bool | Related
     ) -> ModelType | None:
         """
-        Обновление объекта.
+        Обновление объекта одним запросом UPDATE ... RETURNING.
+        Связанные объекты загружаются отдельным запросом, только если они нужны.
 
         Аргументы:
             id: ID объекта
             data: Данные для обновления объекта
             include_related: Загружать ли связанные объекты
         """
+        update_data = {
+            key: value
+            for key, value in data.model_dump(exclude_unset=True).items()
+            if key in self.model.__table__.c
+        }
+        if not update_data:
+            return await self.get(id, include_related)
+
         async with get_db_session() as session:
-            stmt = select(self.model).where(self.model.id == id)
-            if include_related:
-                stmt = self._include_related(stmt)
-            result = await session.execute(stmt)
-            obj = result.unique().scalar_one_or_none()
-            if obj:
-                for key, value in data.model_dump(exclude_unset=True).items():
-                    setattr(obj, key, value)
-                await session.commit()
-                await session.refresh(obj)
+            stmt = (
+                update(self.model)
+                .where(self.model.id == id)
+                .values(update_data)
+                .returning(self.model)
+            )
+            obj = (await session.scalars(stmt)).one_or_none()
+            await self._commit(session, [id])
 
+            if obj and include_related:
+                return (await self._reload(session, [obj.id], include_related))[0]
             return obj
 
     async def delete(self, id: int) -> bool:
         """
-        Удаление объекта.
+        Удаление объекта одним запросом DELETE ... RETURNING.
+        Связанные объекты удаляются каскадно на уровне БД.
 
         Аргументы:
             id: ID объекта
         """
         async with get_db_session() as session:
-            stmt = select(self.model).where(self.model.id == id)
-            result = await session.execute(stmt)
-            obj = result.scalar_one_or_none()
-            if obj:
-                await session.delete(obj)
-                await session.commit()
-
-                return True
+            stmt = (
+                delete(self.model).where(self.model.id == id).returning(self.model.id)
+            )
+            deleted_id = (await session.scalars(stmt)).one_or_none()
+            await self._commit(session, [id])
 
-            return False
+            return deleted_id is not None
 
     async def delete_all(self):
         """
@@ -127,36 +418,396 @@ class Repository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         async with get_db_session() as session:
             await session.execute(delete(self.model))
-            await session.commit()
+            await self._commit(session, None)
+
+    async def find_existing(self, field: str, field_values: list) -> set:
+        """
+        Получение значений поля, которые уже есть в БД, одним запросом.
+
+        Аргументы:
+            field: Название поля модели
+            field_values: Проверяемые значения
+        """
+        if not field_values:
+            return set()
+
+        async with get_db_session() as session:
+            model_column = getattr(self.model, field)
+            stmt = select(model_column).where(
+                model_column
+                == any_(
+                    bindparam(
+                        "field_values", field_values, type_=ARRAY(model_column.type)
+                    )
+                )
+            )
+            result = await session.execute(stmt)
+            return set(result.scalars().all())
+
+    async def bulk_create(
+        self, data: list[CreateSchemaType], include_related: bool | Related
+    ) -> list[ModelType]:
+        """
+        Создание объектов одним многострочным INSERT ... RETURNING и одним коммитом.
+        Объекты возвращаются в порядке входных данных.
+
+        Аргументы:
+            data: Данные для создания объектов
+            include_related: Загружать ли связанные объекты
+        """
+        if not data:
+            return []
+
+        async with get_db_session() as session:
+            stmt = insert(self.model).returning(
+                self.model, sort_by_parameter_order=True
+            )
+            result = await session.scalars(stmt, [item.model_dump() for item in data])
+            objs = list(result.all())
+            await self._commit(session, [obj.id for obj in objs])
+
+            if include_related:
+                objs = await self._reload(
+                    session, [obj.id for obj in objs], include_related
+                )
+            return objs
+
+    async def bulk_update(
+        self, data: list[tuple[int, UpdateSchemaType]], include_related: bool | Related
+    ) -> list[ModelType]:
+        """
+        Обновление объектов через UPDATE ... FROM (VALUES ...) RETURNING и один коммит.
+        Объекты с одинаковым набором изменяемых полей обновляются одним запросом.
+        Возвращаются только найденные объекты в порядке входных данных.
+
+        Аргументы:
+            data: Пары из ID объекта и данных для его обновления
+            include_related: Загружать ли связанные объекты
+        """
+        if not data:
+            return []
+
+        # Группировка объектов по набору изменяемых полей
+        table = self.model.__table__
+        groups: dict[tuple[str, ...], list[tuple]] = {}
+        for id, item in data:
+            item_data = {
+                key: value
+                for key, value in item.model_dump(exclude_unset=True).items()
+                if key in table.c
+            }
+            fields = tuple(sorted(item_data))
+            groups.setdefault(fields, []).append(
+                (id, *(item_data[field] for field in fields))
+            )
+
+        async with get_db_session() as session:
+            objs = {}
+            for fields, rows in groups.items():
+                if not fields:  # Объекты без изменений просто получаем
+                    ids = [row[0] for row in rows]
+                    result = await session.scalars(
+                        select(self.model).where(self._id_in(ids))
+                    )
+                else:
+                    data_values = values(
+                        column("id", Integer),
+                        *(column(field, table.c[field].type) for field in fields),
+                        name="data",
+                    ).data(rows)
+                    stmt = (
+                        update(self.model)
+                        .where(self.model.id == data_values.c.id)
+                        .values({field: data_values.c[field] for field in fields})
+                        .returning(self.model)
+                        .execution_options(synchronize_session="fetch")
+                    )
+                    result = await session.scalars(stmt)
+                objs.update({obj.id: obj for obj in result.all()})
+            await self._commit(session, list(objs))
+
+            ids = [id for id, _ in data if id in objs]
+            if include_related:
+                return await self._reload(session, ids, include_related)
+            return [objs[id] for id in dict.fromkeys(ids)]
+
+    async def bulk_delete(self, ids: list[int]) -> list[int]:
+        """
+        Удаление объектов одним DELETE ... RETURNING и одним коммитом.
+        Возвращает ID удаленных объектов.
+
+        Аргументы:
+            ids: Список ID объектов
+        """
+        if not ids:
+            return []
+
+        async with get_db_session() as session:
+            stmt = (
+                delete(self.model)
+                .where(self._id_in(ids))
+                .returning(self.model.id)
+                .execution_options(synchronize_session="fetch")
+            )
+            result = await session.execute(stmt)
+            deleted_ids = list(result.scalars().all())
+            await self._commit(session, deleted_ids)
+            return deleted_ids
+
+    async def _reload(
+        self, session: AsyncSession, ids: list[int], include_related: bool | Related
+    ) -> list[ModelType]:
+        """
+        Вспомогательная функция для повторной загрузки объектов со связанными объектами.
+        Объекты возвращаются в порядке переданных ID.
+
+        Аргументы:
+            session: Сессия, в которой выполняется запрос
+            ids: Список ID объектов
+            include_related: Загружать ли связанные объекты
+        """
+        stmt = self._include_related(
+            select(self.model)
+            .where(self._id_in(ids))
+            .execution_options(populate_existing=True),
+            include_related,
+        )
+        result = await session.execute(stmt)
+        objs = {obj.id: obj for obj in result.unique().scalars().all()}
+        return [objs[id] for id in dict.fromkeys(ids) if id in objs]
+
+    async def _execute_cached(
+        self,
+        session: AsyncSession,
+        stmt: Select,
+        include_related: bool | Related,
+        fetch: Callable[[Result], Any],
+    ) -> Any:
+        """
+        Вспомогательная функция для выполнения запроса на чтение через кэш.
+        Без кэша или после записи в те же таблицы в текущей сессии
+        запрос выполняется напрямую.
+        В кэше хранится неизменяемый снимок результата, а при попадании возвращаются
+        новые отсоединенные объекты, поэтому объекты сессий в кэш не попадают.
+
+        Аргументы:
+            session: Сессия, в которой выполняется запрос
+            stmt: SQLAlchemy запрос
+            include_related: Загружать ли связанные объекты
+            fetch: Функция получения значения из результата запроса
+        """
+        tables = self._read_tables(include_related)
+        if self._cache is None or tables & session.info.get("written_tables", set()):
+            return fetch(await session.execute(stmt))
+
+        key = self._cache_key(session, stmt, include_related)
+        hit, value = self._cache.get(key)
+        if hit:
+            return _thaw(value)
+
+        version = self._cache.version(tables)
+        value = fetch(await session.execute(stmt))
+        self._cache.set(key, _freeze(value), tables, version)
+        return value
+
+    def _cache_key(
+        self, session: AsyncSession, stmt: Select, include_related: bool | Related
+    ) -> Hashable:
+        """
+        Вспомогательная функция для получения ключа кэша: текст запроса и его параметры.
+        Параметры загрузки связей добавляются в ключ, так как selectinload
+        не меняет текст основного запроса.
+
+        Аргументы:
+            session: Сессия, в которой выполняется запрос
+            stmt: SQLAlchemy запрос
+            include_related: Загружать ли связанные объекты
+        """
+        compiled = stmt.compile(dialect=session.bind.dialect)
+        return (
+            str(compiled),
+            repr(sorted(compiled.params.items())),
+            repr(include_related),
+        )
+
+    async def _commit(self, session: AsyncSession, ids: list[int] | None):
+        """
+        Вспомогательная функция для фиксации записи в таблицу модели.
+        Для репозиториев с кэшем в той же транзакции отправляется уведомление
+        в ленту изменений, чтобы другие процессы сбросили свои кэши.
+        Кэши текущего процесса сбрасываются сразу и повторно после коммита
+        единицы работы, а до него чтения из этих таблиц в текущей сессии идут мимо кэша.
+
+        Аргументы:
+            session: Сессия, в которой выполнялась запись
+            ids: ID измененных объектов, None - неизвестно какие
+        """
+        tables = self._written_tables()
+        if self._cache is not None:
+            await publish_changes(session, tables, ids)
+        await commit(session)
+
+        session.info.setdefault("written_tables", set()).update(tables)
+        invalidate_tables(tables)
+        after_commit(session, lambda: invalidate_tables(tables))
+
+    def _read_tables(self, include_related: bool | Related) -> set[str]:
+        """
+        Названия таблиц, из которых читает запрос: таблица модели
+        и таблицы загружаемых связей. Используются как теги записей кэша.
+
+        Аргументы:
+            include_related: Загружать ли связанные объекты
+        """
+        tables = {self.model.__tablename__}
+        if include_related:
+            for path in self._related_paths():
+                tables.update(attr.property.mapper.local_table.name for attr in path)
+        return tables
+
+    def _written_tables(self) -> set[str]:
+        """
+        Названия таблиц, которые может изменить запись в таблицу модели:
+        таблица модели и таблицы дочерних объектов, удаляемых каскадно.
+        """
+        return {self.model.__tablename__} | {
+            relationship.mapper.local_table.name
+            for relationship in self.model.__mapper__.relationships
+            if relationship.uselist
+        }
+
+    @staticmethod
+    def _fetch_all(result: Result) -> list[ModelType]:
+        """
+        Вспомогательная функция для получения списка объектов из результата запроса.
+
+        Аргументы:
+            result: Результат запроса
+        """
+        return list(result.unique().scalars().all())
+
+    def _id_in(self, ids: list[int]):
+        """
+        Вспомогательная функция для условия WHERE id = ANY(:ids).
+        Список ID передается одним параметром-массивом.
+
+        Аргументы:
+            ids: Список ID объектов
+        """
+        return self.model.id == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
 
     def _convert_filters_to_lower_case(self, filters: UpdateSchemaType) -> list:
         """
-        Вспомогательная функция для преобразования фильтров в нижний регистр.
+        Вспомогательная функция для преобразования фильтров в условия запроса.
+        Строковые поля сравниваются по вхождению без учета регистра (ILIKE),
+        остальные поля, включая перечисления, - на равенство.
 
         Аргументы:
             filters: Фильтры для поиска
         """
+        columns = self.model.__table__.c
         processed_filters = []
         for k, v in filters.model_dump(exclude_unset=True).items():
-            if isinstance(v, str) and v.lower() in self.model.__mapper__.columns:
-                processed_filters.append(
-                    func.lower(getattr(self.model, k)).ilike(f"%{v.lower()}%")
-                )
+            model_column = getattr(self.model, k)
+            if (
+                isinstance(v, str)
+                and k in columns
+                and isinstance(columns[k].type, String)
+                and not isinstance(columns[k].type, SQLAlchemyEnum)
+            ):
+                processed_filters.append(model_column.icontains(v, autoescape=True))
             else:
-                processed_filters.append(getattr(self.model, k) == v)
+                processed_filters.append(model_column == v)
 
         return processed_filters
 
-    def _include_related(self, stmt: Select) -> Select:
+    def _related_paths(self) -> list[tuple]:
+        """
+        Пути связей, загружаемых при include_related.
+        По умолчанию - все прямые связи модели. Переопределяется в дочерних классах.
+        """
+        return [
+            (getattr(self.model, relationship.key),)
+            for relationship in self.model.__mapper__.relationships
+        ]
+
+    def _include_related(
+        self, stmt: Select, include_related: bool | Related = True
+    ) -> Select:
         """
         Вспомогательная функция для включения связанных объектов.
 
         Аргументы:
             stmt: SQLAlchemy запрос
+            include_related: True или параметры загрузки связанных объектов
         """
-        for relationship in self.model.__mapper__.relationships:
-            stmt = stmt.options(joinedload(getattr(self.model, relationship.key)))
+        related = include_related if isinstance(include_related, Related) else Related()
+        if not include_related:
+            return stmt
+
+        for path in self._related_paths():
+            option = None
+            for attr in path[: related.depth]:
+                loader = related.loader(attr)
+                option = (
+                    loader(attr)
+                    if option is None
+                    else getattr(option, loader.__name__)(attr)
+                )
+            if option is not None:
+                stmt = stmt.options(option)
         return stmt
 
 
+class SearchRepositoryMixin(ABC):
+    """
+    Нечеткий поиск для репозиториев с текстовым полем поиска.
+    Подмешивается перед Repository: class Repo(SearchRepositoryMixin, Repository[...]).
+    """
+
+    @abstractmethod
+    def _search_column(self) -> InstrumentedAttribute:
+        """
+        Текстовое поле для нечеткого поиска.
+        """
+
+    async def search(
+        self, query: str, limit: int, include_related: bool | Related
+    ) -> list[ModelType]:
+        """
+        Нечеткий поиск объектов по текстовому полю с сортировкой по похожести.
+        Условия обслуживаются GIN индексом pg_trgm (gin_trgm_ops) по полю поиска,
+        поэтому время поиска не растет линейно с количеством строк.
+
+        Аргументы:
+            query: Строка поиска
+            limit: Максимальное количество объектов
+            include_related: Загружать ли связанные объекты
+        """
+        search_column = self._search_column()
+
+        async with get_db_session() as session:
+            query_param = bindparam("query", query, type_=String)
+            stmt = (
+                select(self.model)
+                .where(
+                    or_(
+                        # Похожесть строки поиска на любое слово поля (word_similarity)
+                        query_param.op("<%")(search_column),
+                        search_column.icontains(query, autoescape=True),
+                    )
+                )
+                .order_by(
+                    func.word_similarity(query_param, search_column).desc(),
+                    self.model.id,
+                )
+                .limit(limit)
+            )
+            if include_related:
+                stmt = self._include_related(stmt, include_related)
+            return await self._execute_cached(
+                session, stmt, include_related, self._fetch_all
+            )
+
+
 RepositoryType = TypeVar("RepositoryType", bound=Repository)
@@ -0,0 +1,50 @@
+from typing import Generic
+
+from pydantic import BaseModel
+
+from src.core.types import GetSchemaType, UpdateSchemaType
+
+
+class PageSchema(BaseModel, Generic[GetSchemaType]):
+    """
+    Pydantic схема для страницы объектов при курсорной пагинации.
+    """
+
+    items: list[GetSchemaType]
+    next_cursor: int | None = None
+
+
+class BulkErrorSchema(BaseModel):
+    """
+    Pydantic схема для ошибки обработки одного элемента пакета.
+    """
+
+    index: int
+    detail: str
+
+
+class BulkResultSchema(BaseModel, Generic[GetSchemaType]):
+    """
+    Pydantic схема для результата пакетного создания или обновления.
+    """
+
+    items: list[GetSchemaType] = []
+    errors: list[BulkErrorSchema] = []
+
+
+class BulkDeleteResultSchema(BaseModel):
+    """
+    Pydantic схема для результата пакетного удаления.
+    """
+
+    deleted_ids: list[int] = []
+    errors: list[BulkErrorSchema] = []
+
+
+class BulkUpdateItemSchema(BaseModel, Generic[UpdateSchemaType]):
+    """
+    Pydantic схема для элемента пакетного обновления.
+    """
+
+    id: int
+    data: UpdateSchemaType
@@ -1,8 +1,17 @@
 import logging
-from abc import abstractmethod
-from typing import Generic
+from typing import AsyncIterator, Generic
 
+from pydantic import TypeAdapter
+from sqlalchemy import inspect
+
+from src.core.logger import SAMPLED
 from src.core.repository import RepositoryType
+from src.core.schemas import (
+    BulkDeleteResultSchema,
+    BulkErrorSchema,
+    BulkResultSchema,
+    PageSchema,
+)
 from src.core.types import (
     CreateSchemaType,
     GetSchemaType,
@@ -12,6 +21,33 @@ from src.core.types import (
 )
 
 
+def loaded_state(obj: ModelType, relations: dict[str, dict]) -> dict:
+    """
+    Словарь загруженных атрибутов модели для валидации pydantic схемой.
+    Незагруженные атрибуты отсутствуют в словаре состояния (inspect(obj).dict),
+    поэтому ленивая загрузка не вызывается, а поля схемы получают значения по умолчанию.
+
+    Аргументы:
+        obj: Sqlalchemy модель
+        relations: Вложенные связи: название связи -> вложенные связи связанной модели
+    """
+    state = inspect(obj).dict
+    if not relations:
+        return state
+
+    data = dict(state)
+    for key, nested_relations in relations.items():
+        value = data.get(key)
+        if value is None:
+            continue
+        data[key] = (
+            [loaded_state(item, nested_relations) for item in value]
+            if isinstance(value, list)
+            else loaded_state(value, nested_relations)
+        )
+    return data
+
+
 class Service(
     Generic[
         ModelType,
@@ -26,6 +62,18 @@ class Service(
     """
 
     _logger: logging.Logger
+    # Pydantic схема для получения объекта, задается в дочерних классах
+    _schema: type[GetSchemaType]
+    # Связи модели, вложенные в схему
+    _schema_relations: dict[str, dict] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Создание адаптера схемы один раз при объявлении дочернего класса.
+        """
+        super().__init_subclass__(**kwargs)
+        if "_schema" in cls.__dict__:
+            cls._adapter = TypeAdapter(cls._schema)
 
     def __init__(
         self,
@@ -48,14 +96,49 @@ class Service(
             id: ID объекта
             include_related: Загружать ли связанные объекты
         """
-        self._logger.info(f"Получение объекта с id: {id}")
+        self._logger.info("Получение объекта с id: %s", id, extra=SAMPLED)
         data: ModelType = await self._repository.get(id, include_related)
         if not data:
             self._handle_error(f"Объект с id: {id} не найден", status_code=404)
-        self._logger.info(f"Объект с id: {id} успешно получен")
+        self._logger.info("Объект с id: %s успешно получен", id, extra=SAMPLED)
 
         return self._convert_to_schema(data)
 
+    async def exists(self, id: int) -> bool:
+        """
+        Проверка наличия объекта по ID без загрузки самого объекта.
+
+        Аргументы:
+            id: ID объекта
+        """
+        return await self._repository.exists(id)
+
+    async def get_many(
+        self, ids: list[int], include_related: bool = True
+    ) -> list[GetSchemaType]:
+        """
+        Получение объектов по списку ID одним запросом.
+        Если часть объектов не найдена, возвращает одну ошибку со всеми отсутствующими ID.
+
+        Аргументы:
+            ids: Список ID объектов
+            include_related: Загружать ли связанные объекты
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        self._logger.info("Получение объектов с id: %s", unique_ids, extra=SAMPLED)
+        data: list[ModelType] = await self._repository.get_many(
+            unique_ids, include_related
+        )
+        missing_ids = set(unique_ids) - {obj.id for obj in data}
+        if missing_ids:
+            self._handle_error(
+                f"Объекты с id: {', '.join(map(str, sorted(missing_ids)))} не найдены",
+                status_code=404,
+            )
+        self._logger.info("Успешно получено %s объектов", len(data), extra=SAMPLED)
+
+        return self._convert_to_schemas(data)
+
     async def get_all(
         self, filters: UpdateSchemaType | None = None, include_related: bool = True
     ) -> list[GetSchemaType]:
@@ -67,14 +150,68 @@ class Service(
             include_related: Загружать ли связанные объекты
         """
         self._logger.info(
-            f"Получение всех объектов с фильтрами: {filters.model_dump(exclude_unset=True) if filters else 'None'}"
+            "Получение всех объектов с фильтрами: %s", filters, extra=SAMPLED
         )
         data = await self._repository.get_all(include_related, filters)
         if not data:
             self._handle_error("Объекты не найдены", status_code=404)
-        self._logger.info(f"Успешно получено {len(data)} объектов")
+        self._logger.info("Успешно получено %s объектов", len(data), extra=SAMPLED)
+
+        return self._convert_to_schemas(data)
+
+    async def get_page(
+        self,
+        after_id: int | None = None,
+        limit: int = 50,
+        filters: UpdateSchemaType | None = None,
+        include_related: bool = True,
+    ) -> PageSchema[GetSchemaType]:
+        """
+        Получение страницы объектов с курсорной пагинацией.
+        В отличие от get_all, пустая страница не считается ошибкой.
 
-        return [self._convert_to_schema(obj) for obj in data]
+        Аргументы:
+            after_id: Курсор - ID последнего объекта предыдущей страницы
+            limit: Максимальное количество объектов на странице
+            filters: Фильтры для поиска
+            include_related: Загружать ли связанные объекты
+        """
+        self._logger.info(
+            "Получение страницы объектов после id: %s с лимитом: %s",
+            after_id,
+            limit,
+            extra=SAMPLED,
+        )
+        # Запрашиваем на один объект больше, чтобы понять, есть ли следующая страница
+        data = await self._repository.get_page(
+            after_id, limit + 1, include_related, filters
+        )
+        next_cursor = data[limit - 1].id if len(data) > limit else None
+        self._logger.info(
+            "Успешно получено %s объектов", len(data[:limit]), extra=SAMPLED
+        )
+
+        return PageSchema(
+            items=self._convert_to_schemas(data[:limit]),
+            next_cursor=next_cursor,
+        )
+
+    async def stream(
+        self,
+        filters: UpdateSchemaType | None = None,
+        include_related: bool = True,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[GetSchemaType]:
+        """
+        Потоковое получение объектов без загрузки всей выборки в память.
+
+        Аргументы:
+            filters: Фильтры для поиска
+            include_related: Загружать ли связанные объекты
+            batch_size: Количество строк, читаемых из БД за раз
+        """
+        async for obj in self._repository.stream(include_related, filters, batch_size):
+            yield self._convert_to_schema(obj)
 
     async def create(
         self, data: CreateSchemaType, include_related: bool = True
@@ -86,11 +223,11 @@ class Service(
             data: Данные для создания объекта
             include_related: Загружать ли связанные объекты
         """
-        self._logger.info(f"Создание объекта: {data.model_dump(exclude_unset=True)}")
+        self._logger.info("Создание объекта: %s", data)
         obj: ModelType = await self._repository.create(data, include_related)
         if not obj:
             self._handle_error("Не удалось создать объект", status_code=400)
-        self._logger.info(f"Объект успешно создан с id: {obj.id}")
+        self._logger.info("Объект успешно создан с id: %s", obj.id)
 
         return self._convert_to_schema(obj)
 
@@ -105,17 +242,11 @@ class Service(
             data: Данные для обновления объекта
             include_related: Загружать ли связанные объекты
         """
-        self._logger.info(
-            f"Обновление объекта с id: {id} и данными: {data.model_dump(exclude_unset=True)}"
-        )
-        await self.get(id)
-
+        self._logger.info("Обновление объекта с id: %s и данными: %s", id, data)
         obj: ModelType = await self._repository.update(id, data, include_related)
         if not obj:
-            self._handle_error(
-                f"Не удалось обновить объект с id: {id}", status_code=400
-            )
-        self._logger.info(f"Объект с id: {id} успешно обновлен")
+            self._handle_error(f"Объект с id: {id} не найден", status_code=404)
+        self._logger.info("Объект с id: %s успешно обновлен", id)
 
         return self._convert_to_schema(obj)
 
@@ -126,15 +257,144 @@ class Service(
         Аргументы:
             id: ID объекта
         """
-        self._logger.info(f"Удаление объекта с id: {id}")
-        await self.get(id)
-
+        self._logger.info("Удаление объекта с id: %s", id)
         if not await self._repository.delete(id):
-            self._handle_error(f"Не удалось удалить объект с id: {id}", status_code=400)
-        self._logger.info(f"Объект с id: {id} успешно удален")
+            self._handle_error(f"Объект с id: {id} не найден", status_code=404)
+        self._logger.info("Объект с id: %s успешно удален", id)
 
         return True
 
+    async def bulk_create(
+        self, data: list[CreateSchemaType], include_related: bool = True
+    ) -> BulkResultSchema[GetSchemaType]:
+        """
+        Пакетное создание объектов одним запросом и одним коммитом.
+        Элементы, не прошедшие проверку, не создаются и попадают в список ошибок.
+
+        Аргументы:
+            data: Данные для создания объектов
+            include_related: Загружать ли связанные объекты
+        """
+        self._logger.info("Пакетное создание %s объектов", len(data))
+        errors = await self._validate_bulk_create(data)
+        objs = await self._repository.bulk_create(
+            [item for index, item in enumerate(data) if index not in errors],
+            include_related,
+        )
+        self._logger.info(
+            "Успешно создано %s объектов, ошибок: %s", len(objs), len(errors)
+        )
+
+        return BulkResultSchema(
+            items=self._convert_to_schemas(objs),
+            errors=self._convert_bulk_errors(errors),
+        )
+
+    async def bulk_update(
+        self, data: list[tuple[int, UpdateSchemaType]], include_related: bool = True
+    ) -> BulkResultSchema[GetSchemaType]:
+        """
+        Пакетное обновление объектов и один коммит.
+        Элементы, не прошедшие проверку, не обновляются и попадают в список ошибок.
+
+        Аргументы:
+            data: Пары из ID объекта и данных для его обновления
+            include_related: Загружать ли связанные объекты
+        """
+        self._logger.info("Пакетное обновление %s объектов", len(data))
+        errors = await self._validate_bulk_update(data)
+        objs = await self._repository.bulk_update(
+            [item for index, item in enumerate(data) if index not in errors],
+            include_related,
+        )
+        self._logger.info(
+            "Успешно обновлено %s объектов, ошибок: %s", len(objs), len(errors)
+        )
+
+        return BulkResultSchema(
+            items=self._convert_to_schemas(objs),
+            errors=self._convert_bulk_errors(errors),
+        )
+
+    async def bulk_delete(self, ids: list[int]) -> BulkDeleteResultSchema:
+        """
+        Пакетное удаление объектов одним запросом и одним коммитом.
+        Отсутствующие ID и элементы, не прошедшие проверку, попадают в список ошибок.
+
+        Аргументы:
+            ids: Список ID объектов
+        """
+        self._logger.info("Пакетное удаление объектов с id: %s", ids)
+        errors = await self._validate_bulk_delete(ids)
+        deleted_ids = await self._repository.bulk_delete(
+            [id for index, id in enumerate(ids) if index not in errors]
+        )
+        for index, id in enumerate(ids):
+            if index not in errors and id not in deleted_ids:
+                errors[index] = f"Объект с id: {id} не найден"
+        self._logger.info(
+            "Успешно удалено %s объектов, ошибок: %s", len(deleted_ids), len(errors)
+        )
+
+        return BulkDeleteResultSchema(
+            deleted_ids=deleted_ids, errors=self._convert_bulk_errors(errors)
+        )
+
+    async def _validate_bulk_create(
+        self, data: list[CreateSchemaType]
+    ) -> dict[int, str]:
+        """
+        Проверка элементов пакетного создания.
+        Возвращает ошибки по индексам элементов. Переопределяется в дочерних классах.
+
+        Аргументы:
+            data: Данные для создания объектов
+        """
+        return {}
+
+    async def _validate_bulk_update(
+        self, data: list[tuple[int, UpdateSchemaType]]
+    ) -> dict[int, str]:
+        """
+        Проверка элементов пакетного обновления: наличие объектов с такими ID.
+        Возвращает ошибки по индексам элементов. Дополняется в дочерних классах.
+
+        Аргументы:
+            data: Пары из ID объекта и данных для его обновления
+        """
+        existing_ids = await self._repository.find_existing(
+            "id", [id for id, _ in data]
+        )
+        return {
+            index: f"Объект с id: {id} не найден"
+            for index, (id, _) in enumerate(data)
+            if id not in existing_ids
+        }
+
+    async def _validate_bulk_delete(self, ids: list[int]) -> dict[int, str]:
+        """
+        Проверка элементов пакетного удаления.
+        Возвращает ошибки по индексам элементов. Переопределяется в дочерних классах.
+
+        Аргументы:
+            ids: Список ID объектов
+        """
+        return {}
+
+    def _convert_bulk_errors(self, errors: dict[int, str]) -> list[BulkErrorSchema]:
+        """
+        Вспомогательный метод для преобразования ошибок пакетной операции в схемы.
+
+        Аргументы:
+            errors: Ошибки по индексам элементов
+        """
+        for index, message in sorted(errors.items()):
+            self._logger.error("Элемент пакета %s: %s", index, message)
+        return [
+            BulkErrorSchema(index=index, detail=message)
+            for index, message in sorted(errors.items())
+        ]
+
     def _handle_error(self, message: str = None, status_code: int = 400):
         """
         Вспомогающий метод для обработки ошибок.
@@ -149,13 +409,52 @@ class Service(
         else:
             raise self._exception(status_code=status_code, detail=message)
 
-    @abstractmethod
     def _convert_to_schema(self, obj: ModelType) -> GetSchemaType:
         """
-        Преобразует модель в схему.
-        Этот метод должен быть переопределен в дочерних классах.
+        Преобразование модели в схему через заранее созданный TypeAdapter.
 
         Аргументы:
             obj: Модель для преобразования
         """
-        raise NotImplementedError
+        return self._adapter.validate_python(loaded_state(obj, self._schema_relations))
+
+    def _convert_to_schemas(self, objs: list[ModelType]) -> list[GetSchemaType]:
+        """
+        Преобразование списка моделей в схемы.
+        Модели валидируются по одной, чтобы не держать в памяти словари состояния
+        всего списка: так быстрее, чем один вызов адаптера списка (benchmarks/conversion.py).
+
+        Аргументы:
+            objs: Модели для преобразования
+        """
+        return [
+            self._adapter.validate_python(loaded_state(obj, self._schema_relations))
+            for obj in objs
+        ]
+
+
+class SearchServiceMixin:
+    """
+    Нечеткий поиск для сервисов, репозиторий которых подмешивает SearchRepositoryMixin.
+    Подмешивается перед Service: class Svc(SearchServiceMixin, Service[...]).
+    """
+
+    async def search(
+        self, query: str, limit: int = 20, include_related: bool = True
+    ) -> list[GetSchemaType]:
+        """
+        Нечеткий поиск объектов с сортировкой по похожести.
+        В отличие от get_all, пустой результат не считается ошибкой.
+
+        Аргументы:
+            query: Строка поиска
+            limit: Максимальное количество объектов
+            include_related: Загружать ли связанные объекты
+        """
+        self._logger.info(
+            "Поиск объектов по запросу: %s с лимитом: %s", query, limit, extra=SAMPLED
+        )
+        data = await self._repository.search(query, limit, include_related)
+        self._logger.info("Успешно найдено %s объектов", len(data), extra=SAMPLED)
+
+        return self._convert_to_schemas(data)
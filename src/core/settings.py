@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -14,11 +16,56 @@ class Settings(BaseSettings):
     api_host: str
     api_port: int
     bot_token: str
+    # Таймаут запросов бота к Telegram в секундах
+    bot_request_timeout: float = 10
+    # Интервал проверки соединения с блокировкой единственного процесса бота
+    bot_lock_check_interval: float = 5
+    # Режим получения апдейтов: long polling или вебхук
+    bot_mode: Literal["polling", "webhook"] = "polling"
+    # Публичный адрес бота, например https://bot.example.com
+    webhook_url: str | None = None
+    webhook_path: str = "/webhook"
+    webhook_secret: str | None = None
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8080
+    webhook_max_connections: int = 40
+    menu_cache_size: int = 1024
+    menu_cache_ttl: float = 300
+    log_level: str = "INFO"
+    log_json: bool = False
+    log_read_sample_rate: float = 0.1
+    notify_workers: int = 8
+    notify_global_rate: float = 25
+    notify_chat_rate: float = 1
+    notify_chat_burst: float = 3
+    notify_max_attempts: int = 3
+    outbox_workers: int = 2
+    outbox_batch_size: int = 50
+    outbox_lease: float = 60
+    # Вместе с bot_request_timeout меньше outbox_lease
+    outbox_send_timeout: float = 45
+    outbox_poll_interval: float = 1
+    outbox_max_attempts: int = 5
+    fsm_state_ttl: float = 86400
+    fsm_sweep_interval: float = 600
+    fsm_sweep_batch_size: int = 1000
+    cart_cache_size: int = 10000
+    cart_cache_ttl: float = 1800
+    cart_flush_interval: float = 5
+    cart_ttl: float = 259200
+    cart_expire_batch_size: int = 1000
+    bot_max_concurrency: int = 50
+    bot_max_user_queue: int = 5
+    bot_max_pending_updates: int = 10000
 
     @property
     def database_url(self) -> str:
         return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
 
+    @property
+    def postgres_dsn(self) -> str:
+        return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+
     class Config:
         env_file = ".env"
         extra = "ignore"
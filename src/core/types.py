@@ -10,6 +10,18 @@ GetSchemaType = TypeVar("GetSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+class ObjectsNotFoundError(Exception):
+    """Исключение репозиториев: связанные объекты не найдены."""
+
+    def __init__(self, ids: set[int]):
+        """
+        Аргументы:
+            ids: ID ненайденных объектов
+        """
+        self.ids = ids
+        super().__init__(f"Объекты с id: {', '.join(map(str, sorted(ids)))} не найдены")
+
+
 class ServiceException(Exception):
     """Исключение для сервисов."""
 
@@ -1,6 +1,7 @@
 from enum import Enum
 
 from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.models import Base
@@ -17,6 +18,10 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Поиск всех барист для рассылки о новых заказах
+        Index("ix_users_role", "role"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     role: Mapped[Role] = mapped_column(SQLAlchemyEnum(Role), nullable=False)
@@ -1,8 +1,4 @@
-from sqlalchemy.orm import joinedload
-from sqlalchemy.sql import Select
-
-from src.core.order.models import Order, OrderPosition
-from src.core.position.models import Position
+from src.core.order.models import Order
 from src.core.repository import Repository
 from src.core.user.models import User
 from src.core.user.schemas import UserCreateSchema, UserUpdateSchema
@@ -16,11 +12,5 @@ class UserRepository(Repository[User, UserCreateSchema, UserUpdateSchema]):
     def __init__(self):
         super().__init__(User)
 
-    def _include_related(self, stmt: Select) -> Select:
-        stmt = stmt.options(
-            joinedload(User.orders)
-            .joinedload(Order.order_positions)
-            .joinedload(OrderPosition.position)
-            .joinedload(Position.category)
-        )
-        return stmt
+    def _related_paths(self) -> list[tuple]:
+        return [(User.orders, Order.order_positions)]
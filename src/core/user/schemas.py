@@ -28,4 +28,4 @@ class UserGetSchema(UserCreateSchema):
     Pydantic схема для получения пользователя.
     """
 
-    orders: list[OrderGetSchema]
+    orders: list[OrderGetSchema] = []  # Пусто, если не загружены
@@ -1,11 +1,9 @@
 import logging
 
-from sqlalchemy.orm.exc import DetachedInstanceError
-
 from src.core.logger import get_logger
 from src.core.order.service import OrderService
 from src.core.service import Service
-from src.core.user.models import Role, User
+from src.core.user.models import User
 from src.core.user.respository import UserRepository
 from src.core.user.schemas import UserCreateSchema, UserGetSchema, UserUpdateSchema
 
@@ -17,24 +15,19 @@ class UserService(
     Сервис для пользователей.
     """
 
+    _schema = UserGetSchema
+    _schema_relations = {"orders": OrderService._schema_relations}
     _logger: logging.Logger = get_logger("UserService")
 
-    def __init__(
-        self,
-        repository: UserRepository,
-        order_service: OrderService,
-        exception: Exception,
-    ):
+    def __init__(self, repository: UserRepository, exception: Exception):
         """
         Инициализация сервиса.
 
         Аргументы:
             repository: Репозиторий, который будет использовать сервис
-            order_service: Сервис для заказов
             exception: Исключение, которое будет использовать сервис
         """
         super().__init__(repository, exception)
-        self._order_service = order_service
 
     async def create(
         self, data: UserCreateSchema, include_related: bool = True
@@ -46,16 +39,16 @@ class UserService(
             data: Данные для создания объекта
             include_related: Загружать ли связанные объекты
         """
-        if await self._repository.get(data.id, False):
+        if await self._repository.exists(data.id):
             self._handle_error(
                 "Пользователь с таким ID уже существует", status_code=409
             )
 
-        self._logger.info(f"Создание объекта: {data.model_dump(exclude_unset=True)}")
+        self._logger.info("Создание объекта: %s", data)
         obj: User = await self._repository.create(data, include_related)
         if not obj:
             self._handle_error("Не удалось создать объект", status_code=400)
-        self._logger.info(f"Объект успешно создан с id: {obj.id}")
+        self._logger.info("Объект успешно создан с id: %s", obj.id)
 
         return self._convert_to_schema(obj)
 
@@ -70,47 +63,34 @@ class UserService(
             data: Данные для обновления объекта
             include_related: Загружать ли связанные объекты
         """
-        self._logger.info(
-            f"Обновление объекта с id: {id} и данными: {data.model_dump(exclude_unset=True)}"
-        )
-        obj = await self.get(id, True)
-
+        self._logger.info("Обновление объекта с id: %s и данными: %s", id, data)
         if len(list(data.model_dump(exclude_unset=True).keys())) == 0:
-            self._logger.info(f"Объект с id: {id} не изменен")
-            return self._convert_to_schema(obj)
-
-        if data.id and await self.get(data.id, False):
-            self._handle_error(
-                "Пользователь с таким ID уже существует", status_code=409
-            )
+            self._logger.info("Объект с id: %s не изменен", id)
+            return await self.get(id, include_related)
 
         obj: User = await self._repository.update(id, data, include_related)
         if not obj:
-            self._handle_error(
-                f"Не удалось обновить объект с id: {id}", status_code=400
-            )
-        self._logger.info(f"Объект с id: {id} успешно обновлен")
+            self._handle_error(f"Объект с id: {id} не найден", status_code=404)
+        self._logger.info("Объект с id: %s успешно обновлен", id)
 
         return self._convert_to_schema(obj)
 
-    def _convert_to_schema(self, obj: User) -> UserGetSchema:
+    async def _validate_bulk_create(
+        self, data: list[UserCreateSchema]
+    ) -> dict[int, str]:
         """
-        Преобразование модели в схему.
+        Проверка элементов пакетного создания: уникальность ID в БД и в пакете.
 
         Аргументы:
-            obj: Модель для преобразования
+            data: Данные для создания объектов
         """
-        try:
-            orders = [
-                self._order_service._convert_to_schema(order) for order in obj.orders
-            ]
-        except (
-            DetachedInstanceError
-        ):  # Если объект не загружен, то возвращаем пустой список
-            orders = []
-
-        return UserGetSchema(
-            id=obj.id,
-            role=Role(obj.role),
-            orders=orders,
+        existing_ids = await self._repository.find_existing(
+            "id", [item.id for item in data]
         )
+        errors, seen_ids = {}, set()
+        for index, item in enumerate(data):
+            if item.id in existing_ids or item.id in seen_ids:
+                errors[index] = "Пользователь с таким ID уже существует"
+            seen_ids.add(item.id)
+
+        return errors
@@ -0,0 +1,26 @@
+import asyncio
+
+from src.api.responses import NDJSON_MEDIA_TYPE, NDJSONResponse
+from src.core.category.schemas import CategoryGetSchema
+
+
+def test_ndjson_response_encodes_one_schema_per_line():
+    categories = [
+        CategoryGetSchema(id=1, name="Кофе"),
+        CategoryGetSchema(id=2, name="Чай"),
+    ]
+
+    async def items():
+        for category in categories:
+            yield category
+
+    async def read():
+        response = NDJSONResponse(items())
+        return response, [chunk async for chunk in response.body_iterator]
+
+    response, chunks = asyncio.run(read())
+
+    assert response.media_type == NDJSON_MEDIA_TYPE
+    assert chunks == [
+        (category.model_dump_json() + "\n").encode() for category in categories
+    ]
@@ -0,0 +1,66 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.api import dependencies
+from src.api.dependencies import get_category_service
+from src.api.main import app
+from src.core.category.schemas import CategoryGetSchema
+from tests.utils import asgi_request
+
+
+class FakeCategoryService:
+    def __init__(self, events: list[str]):
+        self.events = events
+
+    async def create(self, data, include_related=True):
+        self.events.append("handler")
+        return CategoryGetSchema(id=1, name=data.name)
+
+
+@pytest.fixture
+def events(monkeypatch):
+    events = []
+
+    @asynccontextmanager
+    async def unit_of_work():
+        yield None
+        events.append("commit")
+
+    monkeypatch.setattr(dependencies, "unit_of_work", unit_of_work)
+    app.dependency_overrides[get_category_service] = lambda: FakeCategoryService(events)
+    yield events
+    app.dependency_overrides.clear()
+
+
+def test_commit_happens_before_response(events):
+    async def send_and_record():
+        messages, status, _, _ = await asgi_request(
+            app, "POST", "/categories/", '{"name": "Кофе"}'.encode()
+        )
+        return messages, status
+
+    messages, status = asyncio.run(send_and_record())
+
+    assert status == 201
+    # Коммит выполнен до начала ответа
+    assert events == ["handler", "commit"]
+    assert messages[0] == "http.response.start"
+
+
+def test_failed_commit_is_reported(monkeypatch):
+    @asynccontextmanager
+    async def unit_of_work():
+        yield None
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(dependencies, "unit_of_work", unit_of_work)
+    app.dependency_overrides[get_category_service] = lambda: FakeCategoryService([])
+    try:
+        with pytest.raises(RuntimeError):
+            asyncio.run(
+                asgi_request(app, "POST", "/categories/", '{"name": "Кофе"}'.encode())
+            )
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,76 @@
+import asyncio
+from typing import Any
+
+from src.bot.cart import Cart, CartStore
+from src.core.cart.respository import CartRepository
+from src.core.position.schemas import PositionGetSchema
+
+
+class FakeCartRepository(CartRepository):
+    def __init__(self):
+        super().__init__(ttl=60)
+        self.saved: dict[int, dict[str, Any] | None] = {}
+
+    async def get(self, user_id: int) -> dict[str, Any] | None:
+        return None
+
+    async def save_many(self, carts: dict[int, dict[str, Any] | None]):
+        self.saved.update(carts)
+
+
+def test_memory_tier_is_bounded_and_evicted_carts_are_flushed():
+    repository = FakeCartRepository()
+    store = CartStore(repository, max_size=100)
+    position = PositionGetSchema(id=1, name="Латте", category_id=1, price=250)
+
+    async def fill():
+        for user_id in range(1000):
+            cart = await store.get(user_id)
+            cart.add_item(position)
+            store.save(user_id, cart)
+        await store.flush()
+
+    asyncio.run(fill())
+
+    assert len(store._carts) == 100
+    assert len(repository.saved) == 1000
+
+
+class SlowCartRepository(FakeCartRepository):
+    """Репозиторий, в котором до коммита записи лежит старая корзина."""
+
+    def __init__(self, stored: dict[str, Any]):
+        super().__init__()
+        self.stored = stored
+        self.commit = asyncio.Event()
+
+    async def get(self, user_id: int) -> dict[str, Any] | None:
+        return self.stored
+
+    async def save_many(self, carts: dict[int, dict[str, Any] | None]):
+        await self.commit.wait()
+        await super().save_many(carts)
+
+
+def test_cart_being_flushed_is_not_reread_from_database():
+    position = PositionGetSchema(id=1, name="Латте", category_id=1, price=250)
+    stale = Cart()
+    stale.add_item(position)
+    repository = SlowCartRepository(stale.model_dump(mode="json"))
+    store = CartStore(repository)
+
+    async def clear_during_flush():
+        await store.get(1)
+        # Корзина очищена при оформлении заказа, запись в БД еще не закоммичена
+        store.clear(1)
+        flush = asyncio.create_task(store.flush())
+        await asyncio.sleep(0)
+        cart = await store.get(1)
+        repository.commit.set()
+        await flush
+        return cart
+
+    cart = asyncio.run(clear_during_flush())
+
+    assert cart.is_empty
+    assert repository.saved == {1: None}
@@ -0,0 +1,28 @@
+import asyncio
+
+from src.bot.notifications import NotificationDispatcher
+from tests.bot.test_outbox import FakeBot
+
+
+def test_withdraw_skips_only_unstarted_messages():
+    bot = FakeBot()
+
+    async def send():
+        notifier = NotificationDispatcher(workers=1, global_rate=100)
+        await notifier.start(bot)
+        # Запрос в чат 3 начинается сразу, сообщение в чат 1 ждет свободного воркера
+        sending = notifier.submit(3, "Новый заказ")
+        queued = notifier.submit(1, "Новый заказ")
+        await asyncio.sleep(0.1)
+
+        withdrawn = notifier.withdraw(sending), notifier.withdraw(queued)
+        # Отмена future напрямую не отменяет начатый запрос
+        sending.cancel()
+        await notifier.stop()
+        return withdrawn, notifier.stats
+
+    withdrawn, stats = asyncio.run(send())
+
+    assert withdrawn == (False, True)
+    assert bot.sent == [3]
+    assert (stats.sent, stats.cancelled, stats.pending) == (1, 1, 0)
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from src.bot.notifications import NotificationDispatcher
+from src.bot.outbox import OutboxDispatcher
+from src.core.outbox.schemas import OutboxMessageGetSchema
+
+
+class FakeBot:
+    """
+    Бот, которому Telegram не дает писать в чаты 2 и 4
+    и медленно отвечает для чатов 3 и 4.
+    """
+
+    def __init__(self):
+        self.sent: list[int] = []
+
+    async def send_message(self, chat_id: int, text: str, **kwargs):
+        if chat_id in (3, 4):
+            await asyncio.sleep(0.4)
+        if chat_id in (2, 4):
+            raise TelegramRetryAfter(
+                SendMessage(chat_id=chat_id, text=text), "Too Many Requests", 1
+            )
+        self.sent.append(chat_id)
+
+
+class FakeOutboxService:
+    def __init__(self, messages: list[OutboxMessageGetSchema]):
+        self.messages = messages
+        self.completed: list[int] = []
+        self.released: list[int] = []
+
+    async def claim(self, batch_size: int, lease: float):
+        messages, self.messages = self.messages, []
+        return messages
+
+    async def complete(self, ids: list[int]):
+        self.completed.extend(ids)
+
+    async def release(self, ids: list[int]):
+        self.released.extend(ids)
+
+
+def process_batch(service: FakeOutboxService, bot: FakeBot):
+    """
+    Отправка одной пачки с ожиданием 0.2 с и таймаутом запроса 0.5 с.
+    Возвращает количество захваченных сообщений, время отправки пачки
+    и статистику диспетчера уведомлений.
+
+    Аргументы:
+        service: Сервис исходящей очереди
+        bot: Бот
+    """
+
+    async def process():
+        notifier = NotificationDispatcher(workers=3, global_rate=100)
+        await notifier.start(bot)
+        dispatcher = OutboxDispatcher(
+            service,
+            notifier,
+            lease=1,
+            send_timeout=0.2,
+            request_timeout=0.5,
+            max_attempts=5,
+        )
+
+        started_at = asyncio.get_running_loop().time()
+        claimed = await dispatcher._process_batch()
+        elapsed = asyncio.get_running_loop().time() - started_at
+
+        # Повтор после паузы Telegram не отправляет отмененное сообщение
+        await asyncio.sleep(1.2)
+        await notifier.stop(timeout=0)
+        return claimed, elapsed, notifier.stats
+
+    return asyncio.run(process())
+
+
+def test_unstarted_messages_are_released_before_lease_expires():
+    bot = FakeBot()
+    service = FakeOutboxService(
+        [
+            OutboxMessageGetSchema(id=1, chat_id=1, text="Новый заказ", attempts=1),
+            OutboxMessageGetSchema(id=2, chat_id=2, text="Новый заказ", attempts=1),
+        ]
+    )
+
+    claimed, elapsed, stats = process_batch(service, bot)
+
+    assert claimed == 2
+    assert elapsed < 1
+    assert service.completed == [1]
+    assert service.released == [2]
+    assert bot.sent == [1]
+    assert stats.cancelled == 1
+    assert stats.pending == 0
+
+
+def test_started_message_stays_claimed_until_telegram_answers():
+    bot = FakeBot()
+    service = FakeOutboxService(
+        [OutboxMessageGetSchema(id=3, chat_id=3, text="Новый заказ", attempts=1)]
+    )
+
+    claimed, elapsed, stats = process_batch(service, bot)
+
+    # Запрос начат до истечения send_timeout, поэтому сообщение не возвращается
+    # в очередь, а удаляется после доставки
+    assert claimed == 1
+    assert 0.4 <= elapsed < 1
+    assert service.completed == [3]
+    assert service.released == []
+    assert bot.sent == [3]
+    assert (stats.sent, stats.cancelled) == (1, 0)
+
+
+def test_started_message_is_not_retried_after_send_timeout():
+    bot = FakeBot()
+    service = FakeOutboxService(
+        [OutboxMessageGetSchema(id=4, chat_id=4, text="Новый заказ", attempts=1)]
+    )
+
+    claimed, elapsed, stats = process_batch(service, bot)
+
+    # Недоставленное сообщение остается захваченным и вернется по истечении захвата
+    assert claimed == 1
+    assert 0.4 <= elapsed < 1
+    assert service.completed == service.released == []
+    assert (stats.retried, stats.failed, stats.pending) == (0, 1, 0)
+
+
+def test_send_and_request_timeouts_must_be_shorter_than_lease():
+    with pytest.raises(ValueError):
+        OutboxDispatcher(
+            FakeOutboxService([]),
+            NotificationDispatcher(),
+            lease=10,
+            send_timeout=5,
+            request_timeout=5,
+        )
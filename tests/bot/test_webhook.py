@@ -0,0 +1,196 @@
+import asyncio
+import socket
+import time
+
+import pytest
+from aiogram import Bot, Dispatcher, Router
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Message
+from aiohttp import ClientConnectionError, ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from src.bot.main import run_webhook
+from src.bot.middlewares import register_middlewares
+from src.core.settings import settings
+
+SECRET = "webhook-secret"
+USER_ID = 7
+
+
+class FakeTelegram:
+    """
+    Локальный сервер Bot API, записывающий вызовы методов.
+    """
+
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+        self.app = web.Application()
+        self.app.router.add_post("/bot{token}/{method}", self._handle)
+
+    def methods(self, name: str) -> list[dict]:
+        return [data for method, data in self.calls if method == name]
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        data = dict(await request.post())
+        self.calls.append((method, data))
+        result = True
+        if method == "sendMessage":
+            result = {
+                "message_id": len(self.calls),
+                "date": 0,
+                "chat": {"id": int(data["chat_id"]), "type": "private"},
+                "text": data["text"],
+            }
+        return web.json_response({"ok": True, "result": result})
+
+
+def make_update(update_id: int, text: str) -> dict:
+    user = {"id": USER_ID, "is_bot": False, "first_name": "Тест"}
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": USER_ID, "type": "private"},
+            "from": user,
+            "text": text,
+        },
+    }
+
+
+def make_dispatcher() -> Dispatcher:
+    """
+    Диспетчер с middleware бота и обработчиком, отвечающим текстом сообщения.
+    Ответ на "медленно" задерживается, чтобы проверить фоновую обработку и очередность.
+    """
+    router = Router()
+
+    @router.message()
+    async def echo(message: Message):
+        if message.text == "медленно":
+            await asyncio.sleep(0.3)
+        await message.answer(message.text)
+
+    dp = Dispatcher(storage=MemoryStorage(), disable_fsm=True)
+    dp.include_router(router)
+    register_middlewares(dp)
+    return dp
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def webhook_settings(monkeypatch):
+    port = free_port()
+    monkeypatch.setattr(settings, "webhook_url", "https://bot.example.com")
+    monkeypatch.setattr(settings, "webhook_secret", SECRET)
+    monkeypatch.setattr(settings, "webhook_host", "127.0.0.1")
+    monkeypatch.setattr(settings, "webhook_port", port)
+    return f"http://127.0.0.1:{port}{settings.webhook_path}"
+
+
+async def run_harness(url: str, scenario, replies: int = 0) -> FakeTelegram:
+    """
+    Запуск бота в режиме webhook с фейковым Telegram и выполнение сценария.
+
+    Аргументы:
+        url: Адрес вебхука бота
+        scenario: Корутина-функция, отправляющая апдейты через HTTP сессию
+        replies: Количество ожидаемых ответов бота
+    """
+    telegram = FakeTelegram()
+    server = TestServer(telegram.app)
+    await server.start_server()
+    bot = Bot(
+        token=settings.bot_token,
+        session=AiohttpSession(
+            api=TelegramAPIServer.from_base(str(server.make_url("")).rstrip("/"))
+        ),
+    )
+    task = asyncio.create_task(run_webhook(bot, make_dispatcher()))
+    try:
+        async with ClientSession() as http:
+            # Ожидание запуска сервера вебхука
+            for _ in range(100):
+                try:
+                    async with http.get(url):
+                        break
+                except ClientConnectionError:
+                    await asyncio.sleep(0.05)
+            await scenario(http)
+            # Ожидание фоновой обработки апдейтов
+            for _ in range(100):
+                if len(telegram.methods("sendMessage")) >= replies:
+                    break
+                await asyncio.sleep(0.05)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await bot.session.close()
+        await server.close()
+    return telegram
+
+
+def test_webhook_is_registered_with_secret_and_limits(webhook_settings):
+    async def scenario(http):
+        pass
+
+    telegram = asyncio.run(run_harness(webhook_settings, scenario))
+
+    (call,) = telegram.methods("setWebhook")
+    assert call["url"] == "https://bot.example.com" + settings.webhook_path
+    assert call["secret_token"] == SECRET
+    assert call["max_connections"] == str(settings.webhook_max_connections)
+    assert "message" in call["allowed_updates"]
+
+
+def test_update_with_wrong_secret_is_rejected(webhook_settings):
+    statuses = []
+
+    async def scenario(http):
+        async with http.post(
+            webhook_settings,
+            json=make_update(1, "привет"),
+            headers={"X-Telegram-Bot-Api-Secret-Token": "wrong"},
+        ) as response:
+            statuses.append(response.status)
+
+    telegram = asyncio.run(run_harness(webhook_settings, scenario))
+
+    assert statuses == [401]
+    assert telegram.methods("sendMessage") == []
+
+
+def test_updates_are_acknowledged_at_once_and_handled_in_order(webhook_settings):
+    responses = []
+
+    async def scenario(http):
+        for update_id, text in ((1, "медленно"), (2, "быстро")):
+            started_at = time.monotonic()
+            async with http.post(
+                webhook_settings,
+                json=make_update(update_id, text),
+                headers={"X-Telegram-Bot-Api-Secret-Token": SECRET},
+            ) as response:
+                responses.append((response.status, time.monotonic() - started_at))
+
+    telegram = asyncio.run(run_harness(webhook_settings, scenario, replies=2))
+
+    # Ответ 200 приходит до окончания обработки медленного апдейта
+    assert [status for status, _ in responses] == [200, 200]
+    assert all(elapsed < 0.3 for _, elapsed in responses)
+    # Апдейты одного пользователя обработаны по очереди
+    assert [call["text"] for call in telegram.methods("sendMessage")] == [
+        "медленно",
+        "быстро",
+    ]
+    assert all(
+        call["chat_id"] == str(USER_ID) for call in telegram.methods("sendMessage")
+    )
@@ -0,0 +1,15 @@
+import os
+
+# Настройки читаются при импорте модулей src, поэтому задаются до импорта.
+# Для тестов с БД нужно передать реальные значения через переменные окружения
+for name, value in {
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "coffee_shop_test",
+    "API_HOST": "0.0.0.0",
+    "API_PORT": "3000",
+    "BOT_TOKEN": "123456:test-token",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,77 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.core.order.models import ObtainingMethod
+from src.core.order.respository import OrderRepository
+from src.core.order.schemas import OrderCreateSchema, OrderPositionCreateSchema
+from src.core.order.service import OrderService
+from src.core.types import ObjectsNotFoundError
+
+
+class FakeSession:
+    """Сессия, возвращающая заданные строки позиций на любой запрос."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        return self.rows
+
+
+def test_prepare_order_positions_reports_missing_ids():
+    session = FakeSession([SimpleNamespace(id=1, price=200, name="Эспрессо")])
+    order_positions = [
+        OrderPositionCreateSchema(position_id=position_id, quantity=1, weight=100)
+        for position_id in (1, 2, 3)
+    ]
+
+    with pytest.raises(ObjectsNotFoundError) as error:
+        asyncio.run(
+            OrderRepository()._prepare_order_positions(session, order_positions)
+        )
+
+    assert error.value.ids == {2, 3}
+    assert session.queries == 1
+
+
+def test_prepare_order_positions_uses_snapshot():
+    session = FakeSession([SimpleNamespace(id=1, price=200, name="Эспрессо")])
+    order_positions = [OrderPositionCreateSchema(position_id=1, quantity=2, weight=150)]
+
+    data, total_price = asyncio.run(
+        OrderRepository()._prepare_order_positions(session, order_positions)
+    )
+
+    assert data[0]["unit_price"] == 200
+    assert data[0]["position_name"] == "Эспрессо"
+    assert total_price == 600
+
+
+def test_create_order_with_missing_positions_returns_404():
+    class FakeOrderRepository:
+        async def create(self, data, include_related):
+            raise ObjectsNotFoundError({5})
+
+    class FakeUserRepository:
+        async def exists(self, id):
+            return True
+
+    service = OrderService(FakeOrderRepository(), FakeUserRepository(), HTTPException)
+    data = OrderCreateSchema(
+        user_id=1,
+        obtaining_method=ObtainingMethod.TAKEAWAY,
+        order_positions=[
+            OrderPositionCreateSchema(position_id=5, quantity=1, weight=100)
+        ],
+    )
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(service.create(data))
+
+    assert error.value.status_code == 404
+    assert "5" in error.value.detail
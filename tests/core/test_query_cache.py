@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm.exc import DetachedInstanceError
+
+from src.core.cache import QueryCache
+from src.core.category.models import Category
+from src.core.position.models import Position
+from src.core.repository import _freeze, _thaw
+
+
+def test_unrelated_invalidation_keeps_pending_read():
+    cache = QueryCache(max_size=10, ttl=60)
+    version = cache.version({"positions"})
+
+    cache.invalidate({"orders"})
+    cache.set("key", 1, {"positions"}, version)
+
+    assert cache.get("key") == (True, 1)
+
+
+def test_invalidation_during_read_drops_result():
+    cache = QueryCache(max_size=10, ttl=60)
+    version = cache.version({"positions", "categories"})
+
+    cache.invalidate({"categories"})
+    cache.set("key", 1, {"positions", "categories"}, version)
+
+    assert cache.get("key") == (False, None)
+
+
+def test_thawed_objects_are_new_and_detached():
+    category = Category(id=1, name="Кофе")
+    category.positions = [Position(id=2, name="Латте", category_id=1, price=100)]
+    snapshot = _freeze([category])
+
+    first, second = _thaw(snapshot)[0], _thaw(snapshot)[0]
+    first.name = "Чай"
+    first.positions[0].price = 1
+
+    assert first is not second
+    assert inspect(second).detached
+    assert second.name == "Кофе"
+    assert second.positions[0].price == 100
+
+
+def test_unloaded_attribute_is_not_lazy_loaded():
+    position = _thaw(_freeze(Position(id=2, name="Латте", category_id=1, price=100)))
+
+    with pytest.raises(DetachedInstanceError):
+        position.category
@@ -0,0 +1,118 @@
+import asyncio
+from typing import Awaitable
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+
+from src.core.category.models import Category
+from src.core.db import engine
+from src.core.models import Base
+from src.core.order.models import Order, OrderPosition
+from src.core.position.models import Position
+from src.core.user.models import User
+
+# Тестовые таблицы создаются в отдельной схеме, чтобы не трогать таблицы БД из настроек
+SCHEMA = "query_plans_test"
+
+USERS = 5000
+BARISTAS = 5
+ORDERS = 50000
+PROCESSING_ORDERS = 50
+POSITIONS = 200
+CATEGORIES = 10
+
+SEED = [
+    f"INSERT INTO categories (id, name) "
+    f"SELECT i, 'Категория ' || i FROM generate_series(1, {CATEGORIES}) i",
+    f"INSERT INTO positions (id, name, category_id, price) "
+    f"SELECT i, 'Позиция ' || i, i % {CATEGORIES} + 1, 100 + i "
+    f"FROM generate_series(1, {POSITIONS}) i",
+    f"INSERT INTO users (id, role) "
+    f"SELECT i, CASE WHEN i <= {BARISTAS} THEN 'BARISTA' ELSE 'CLIENT' END::role "
+    f"FROM generate_series(1, {USERS}) i",
+    f"INSERT INTO orders (id, date, status, obtaining_method, user_id, total_price) "
+    f"SELECT i, now() - make_interval(mins => {ORDERS} - i), "
+    f"CASE WHEN i > {ORDERS - PROCESSING_ORDERS} THEN 'PROCESSING' "
+    f"ELSE 'COMPLETED' END::status, 'INPLACE', i % {USERS} + 1, 300 "
+    f"FROM generate_series(1, {ORDERS}) i",
+    f"INSERT INTO order_positions "
+    f"(order_id, position_id, quantity, weight, unit_price, position_name, line_total) "
+    f"SELECT o, (o * 7 + p) % {POSITIONS} + 1, 1, 100, 150, 'Позиция', 150 "
+    f"FROM generate_series(1, {ORDERS}) o, generate_series(0, 1) p",
+]
+
+TABLES = [table.__table__ for table in (Category, Position, User, Order, OrderPosition)]
+
+
+def _set_search_path(dbapi_connection, connection_record):
+    # Вне транзакции, иначе настройка откатится при возврате соединения в пул
+    dbapi_connection.run_async(
+        lambda conn: conn.execute(f"SET search_path TO {SCHEMA}, public")
+    )
+
+
+async def run(coro: Awaitable):
+    """
+    Выполнение корутины в новом цикле событий.
+    Соединения пула привязаны к циклу, поэтому пул закрывается в том же цикле.
+
+    Аргументы:
+        coro: Корутина
+    """
+    try:
+        return await coro
+    finally:
+        await engine.dispose()
+
+
+async def _check_connection():
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _create_schema():
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        has_trgm = True
+    except DBAPIError:
+        has_trgm = False
+
+    # Без pg_trgm триграммные индексы пропускаются, остальные создаются как в миграциях
+    for table in TABLES:
+        for index in table.indexes:
+            if "gin_trgm_ops" in index.dialect_options["postgresql"]["ops"].values():
+                index.ddl_if(callable_=lambda *args, **kwargs: has_trgm)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES, checkfirst=False)
+        for statement in SEED:
+            await conn.execute(text(statement))
+        await conn.execute(text("ANALYZE " + ", ".join(table.name for table in TABLES)))
+
+
+async def _drop_schema():
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+@pytest.fixture(scope="session")
+def database():
+    """
+    Заполненная тестовыми данными БД из настроек POSTGRES_*.
+    Тесты пропускаются, если БД недоступна.
+    """
+    try:
+        asyncio.run(run(_check_connection()))
+    except (OSError, DBAPIError) as e:
+        pytest.skip(f"БД недоступна: {e}")
+
+    event.listen(engine.sync_engine, "connect", _set_search_path)
+    asyncio.run(run(_create_schema()))
+    yield
+    asyncio.run(run(_drop_schema()))
+    event.remove(engine.sync_engine, "connect", _set_search_path)
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from src.core.db import advisory_lock, engine
+from tests.db.conftest import run
+
+
+def test_second_holder_does_not_get_lock(database):
+    async def acquire_twice():
+        async with advisory_lock(42) as first:
+            async with advisory_lock(42) as second:
+                pass
+        async with advisory_lock(42) as after_release:
+            pass
+        return first, second, after_release
+
+    assert asyncio.run(run(acquire_twice())) == (True, False, True)
+
+
+def test_lost_connection_stops_lock_holder(database):
+    async def hold():
+        async with advisory_lock(42, check_interval=0.05) as acquired:
+            assert acquired
+            await asyncio.sleep(10)
+
+    async def lose_connection():
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.1)
+        async with engine.connect() as conn:
+            # Обрыв соединения снимает сессионную блокировку, как при сбое сети
+            await conn.execute(
+                text(
+                    "SELECT pg_terminate_backend(pid) FROM pg_locks "
+                    "WHERE locktype = 'advisory' AND objid = 42"
+                )
+            )
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(holder, 1)
+        async with advisory_lock(42) as reacquired:
+            pass
+        return reacquired
+
+    assert asyncio.run(run(lose_connection()))
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from src.core.category.respository import CategoryRepository
+from src.core.category.service import CategoryService
+from src.core.db import get_db_session, unit_of_work
+from src.core.order.models import OrderPosition
+from src.core.position.respository import PositionRepository
+from src.core.position.service import PositionService
+from src.core.types import ServiceException
+from tests.db.conftest import run
+
+
+async def count_order_positions(position_id: int) -> int:
+    async with get_db_session() as session:
+        return await session.scalar(
+            select(func.count()).where(OrderPosition.position_id == position_id)
+        )
+
+
+def make_service() -> PositionService:
+    return PositionService(
+        PositionRepository(),
+        CategoryService(CategoryRepository(), ServiceException),
+        ServiceException,
+    )
+
+
+def test_ordered_position_is_not_deleted(database):
+    service = make_service()
+
+    async def delete():
+        before = await count_order_positions(1)
+        with pytest.raises(ServiceException):
+            await service.delete(1)
+        result = await service.bulk_delete([1, 1_000_000])
+        return before, await count_order_positions(1), result
+
+    before, after, result = asyncio.run(run(delete()))
+
+    assert before == after > 0
+    assert result.deleted_ids == []
+    assert [error.detail for error in result.errors] == [
+        "Позиция есть в заказах и не может быть удалена",
+        "Объект с id: 1000000 не найден",
+    ]
+
+
+def test_database_restricts_deleting_ordered_position(database):
+    async def delete():
+        async with unit_of_work():
+            await PositionRepository().delete(1)
+
+    with pytest.raises(IntegrityError):
+        asyncio.run(run(delete()))
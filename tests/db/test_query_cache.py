@@ -0,0 +1,45 @@
+import asyncio
+
+from sqlalchemy import inspect, select
+
+from src.core.cache import menu_cache
+from src.core.db import get_db_session, unit_of_work
+from src.core.position.models import Position
+from src.core.position.respository import PositionRepository
+from src.core.repository import Related
+from tests.db.conftest import run
+
+
+class Rollback(Exception):
+    """Откат единицы работы, чтобы не менять общие тестовые данные."""
+
+
+def test_cache_hits_do_not_share_session_objects(database):
+    repository = PositionRepository()
+    menu_cache.clear()
+
+    async def read():
+        try:
+            async with unit_of_work():
+                loaded = await repository.get(1, Related())
+                loaded.name = "Изменено в сессии"
+                first_hit = await PositionRepository().get(1, Related())
+                raise Rollback
+        except Rollback:
+            pass
+
+        first_hit.name = "Изменено в снимке"
+        first_hit.category.name = "Изменено в снимке"
+        second_hit = await repository.get(1, Related())
+        async with get_db_session() as session:
+            stored_name = await session.scalar(
+                select(Position.name).where(Position.id == 1)
+            )
+        return loaded, first_hit, second_hit, stored_name
+
+    loaded, first_hit, second_hit, stored_name = asyncio.run(run(read()))
+
+    assert first_hit is not loaded and second_hit is not first_hit
+    assert inspect(first_hit).detached
+    assert stored_name == second_hit.name == "Позиция 1"
+    assert second_hit.category.name == "Категория 2"
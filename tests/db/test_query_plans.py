@@ -0,0 +1,131 @@
+import asyncio
+from typing import Awaitable, Callable
+
+import pytest
+from sqlalchemy import delete, event
+
+from src.core.db import engine, get_db_session
+from src.core.order.models import OrderPosition, Status
+from src.core.order.respository import OrderRepository
+from src.core.order.schemas import OrderUpdateSchema
+from src.core.repository import Related
+from src.core.user.models import Role
+from src.core.user.respository import UserRepository
+from src.core.user.schemas import UserUpdateSchema
+from tests.db.conftest import BARISTAS, PROCESSING_ORDERS, run
+
+
+async def explain(query: Callable[[], Awaitable]) -> list[dict]:
+    """
+    Выполнение запроса репозитория и получение планов всех отправленных им SQL запросов.
+
+    Аргументы:
+        query: Функция, выполняющая запрос репозитория
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await query()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    plans = []
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(
+                "EXPLAIN (FORMAT JSON) " + statement, parameters
+            )
+            plans.append(result.scalar()[0]["Plan"])
+    return plans
+
+
+def scans(plan: dict) -> list[tuple[str, str, str | None]]:
+    """
+    Список чтений таблиц плана: (тип узла, таблица, индекс).
+
+    Аргументы:
+        plan: Узел плана EXPLAIN (FORMAT JSON)
+    """
+    result = []
+    if "Relation Name" in plan or "Index Name" in plan:
+        result.append(
+            (plan["Node Type"], plan.get("Relation Name"), plan.get("Index Name"))
+        )
+    for child in plan.get("Plans", []):
+        result.extend(scans(child))
+    return result
+
+
+def run_plans(query: Callable[[], Awaitable]) -> list[tuple[str, str, str | None]]:
+    return [scan for plan in asyncio.run(run(explain(query))) for scan in scans(plan)]
+
+
+async def delete_position_links():
+    # Тот же запрос выполняет каскадное удаление позиции меню по внешнему ключу
+    async with get_db_session() as session:
+        await session.execute(
+            delete(OrderPosition).where(OrderPosition.position_id == 1)
+        )
+        await session.rollback()
+
+
+HOT_QUERIES = {
+    # Список активных заказов баристы
+    "processing_orders": (
+        lambda: OrderRepository().get_all(
+            Related(), OrderUpdateSchema(status=Status.PROCESSING)
+        ),
+        "ix_orders_processing",
+    ),
+    # Заказы пользователя
+    "orders_by_user": (
+        lambda: OrderRepository().get_all(False, OrderUpdateSchema(user_id=42)),
+        "ix_orders_user_id",
+    ),
+    # Заказы пользователя при загрузке связей
+    "user_with_orders": (
+        lambda: UserRepository().get(42, Related()),
+        "ix_orders_user_id",
+    ),
+    # Рассылка о новом заказе всем баристам
+    "users_by_role": (
+        lambda: UserRepository().get_all(False, UserUpdateSchema(role=Role.BARISTA)),
+        "ix_users_role",
+    ),
+    # Удаление позиции меню из заказов
+    "order_positions_by_position": (
+        delete_position_links,
+        "ix_order_positions_position_id",
+    ),
+}
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_index(database, name):
+    query, index = HOT_QUERIES[name]
+
+    plan_scans = run_plans(query)
+
+    assert index in {scan[2] for scan in plan_scans}, plan_scans
+    assert not [scan for scan in plan_scans if scan[0] == "Seq Scan"], plan_scans
+
+
+def test_seeded_data_matches_queries(database):
+    async def fetch():
+        orders = await OrderRepository().get_all(
+            False, OrderUpdateSchema(status=Status.PROCESSING)
+        )
+        baristas = await UserRepository().get_all(
+            False, UserUpdateSchema(role=Role.BARISTA)
+        )
+        return orders, baristas
+
+    orders, baristas = asyncio.run(run(fetch()))
+
+    # Планы проверяются на запросах, которые действительно находят строки
+    assert len(orders) == PROCESSING_ORDERS
+    assert len(baristas) == BARISTAS
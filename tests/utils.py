@@ -0,0 +1,55 @@
+import asyncio
+
+
+async def asgi_request(
+    app, method: str, path: str, body: bytes = b"", headers: dict | None = None
+) -> tuple[list[str], int, dict[str, str], bytes]:
+    """
+    Выполнение запроса к ASGI приложению без HTTP клиента.
+    Возвращает список отправленных сообщений ASGI, статус, заголовки и тело ответа.
+
+    Аргументы:
+        app: ASGI приложение
+        method: HTTP метод
+        path: Путь запроса
+        body: Тело запроса
+        headers: Заголовки запроса
+    """
+    headers = {"content-type": "application/json", **(headers or {})}
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("test", 80),
+        "client": ("test", 1),
+        "root_path": "",
+    }
+    received = False
+    messages = []
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Клиент не отключается до конца ответа
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    response_body = b"".join(m.get("body", b"") for m in messages[1:])
+    return (
+        [m["type"] for m in messages],
+        start["status"],
+        response_headers,
+        response_body,
+    )